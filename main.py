@@ -17,6 +17,7 @@
 版本: 1.6.0
 """
 
+import gc
 import sys
 import os
 
@@ -44,6 +45,9 @@ def main() -> None:
             logger.error("配置参数验证失败，程序无法启动")
             sys.exit(1)
         
+        # 提高第0代垃圾回收阈值：解析和下载会创建大量短命对象，默认阈值下回收过于频繁
+        gc.set_threshold(50000, 10, 10)
+        
         # 创建Qt应用程序实例
         app = QApplication(sys.argv)
         
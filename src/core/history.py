@@ -150,23 +150,29 @@ class HistoryManager:
                 except Exception:
                     pass
     
+    _INSERT_SQL = '''
+        INSERT INTO download_history 
+        (url, title, filename, format_id, resolution, file_size, download_path, 
+         download_time, duration, thumbnail_url, platform, status)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    '''
+    
+    @staticmethod
+    def _record_to_row(record: DownloadRecord) -> tuple:
+        """将下载记录转换为插入语句的参数"""
+        return (
+            record.url, record.title, record.filename, record.format_id,
+            record.resolution, record.file_size, record.download_path,
+            record.download_time.isoformat(), record.duration,
+            record.thumbnail_url, record.platform, record.status
+        )
+    
     def add_record(self, record: DownloadRecord) -> int:
         """添加下载记录"""
         try:
             with self._lock:
                 cursor = self._get_cursor()
-                
-                cursor.execute('''
-                    INSERT INTO download_history 
-                    (url, title, filename, format_id, resolution, file_size, download_path, 
-                     download_time, duration, thumbnail_url, platform, status)
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                ''', (
-                    record.url, record.title, record.filename, record.format_id,
-                    record.resolution, record.file_size, record.download_path,
-                    record.download_time.isoformat(), record.duration,
-                    record.thumbnail_url, record.platform, record.status
-                ))
+                cursor.execute(self._INSERT_SQL, self._record_to_row(record))
                 
                 record_id = cursor.lastrowid
                 self._commit()
@@ -177,6 +183,22 @@ class HistoryManager:
             self._rollback()
             raise
     
+    def add_records(self, records: List[DownloadRecord]) -> int:
+        """批量添加下载记录，所有记录在同一个事务中提交，返回添加的数量"""
+        if not records:
+            return 0
+        try:
+            with self._lock:
+                cursor = self._get_cursor()
+                cursor.executemany(self._INSERT_SQL, [self._record_to_row(record) for record in records])
+                self._commit()
+                return len(records)
+        except Exception as e:
+            from src.utils.logger import logger
+            logger.error(f"批量添加下载记录失败: {e}")
+            self._rollback()
+            raise
+    
     def get_record(self, record_id: int) -> Optional[DownloadRecord]:
         """根据ID获取下载记录"""
         row = self._execute_query('SELECT * FROM download_history WHERE id = ?', (record_id,), fetch_one=True)
@@ -0,0 +1,294 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+封面加载器
+
+异步加载解析结果中的封面图片，包括：
+- 线程池并发下载，复用HTTP连接
+- 磁盘缓存（按时间和总大小淘汰）与内存缓存（QPixmapCache）
+- 悬停放大的工具提示只生成一次
+
+作者: 椰果IDM开发团队
+版本: 1.6.0
+"""
+
+import os
+import time
+import base64
+import hashlib
+import tempfile
+from collections import OrderedDict
+from typing import Dict, List, Optional, Tuple
+
+import requests
+from PyQt5.QtCore import QObject, QRunnable, QThreadPool, QBuffer, Qt, pyqtSignal
+from PyQt5.QtGui import QIcon, QImage, QPixmap, QPixmapCache
+from PyQt5.QtWidgets import QTreeWidgetItem
+
+from ..utils.logger import logger
+
+
+# 工具提示放大图的边长
+TOOLTIP_SIZE = 200
+# 原图不超过该大小时直接内嵌原始字节，不再重新编码
+RAW_EMBED_LIMIT = 64 * 1024
+# 磁盘缓存总大小上限和单个文件的最长保留时间
+DISK_CACHE_LIMIT_BYTES = 100 * 1024 * 1024
+DISK_CACHE_MAX_AGE = 7 * 24 * 3600
+
+# 文件头 -> MIME类型
+_IMAGE_SIGNATURES = (
+    (b'\xff\xd8\xff', 'image/jpeg'),
+    (b'\x89PNG\r\n\x1a\n', 'image/png'),
+    (b'GIF8', 'image/gif'),
+)
+
+
+def _sniff_mime(data: bytes) -> Optional[str]:
+    """根据文件头识别已压缩图片的MIME类型"""
+    for signature, mime in _IMAGE_SIGNATURES:
+        if data.startswith(signature):
+            return mime
+    if data[:4] == b'RIFF' and data[8:12] == b'WEBP':
+        return 'image/webp'
+    return None
+
+
+def _image_to_base64(image: QImage) -> str:
+    """将QImage编码为JPEG后转换为base64字符串"""
+    try:
+        buffer = QBuffer()
+        buffer.open(QBuffer.ReadWrite)
+        # 封面不需要透明通道，JPEG比PNG体积小得多且编码更快
+        image.save(buffer, "JPEG", 75)
+        return base64.b64encode(bytes(buffer.data())).decode('ascii')
+    except Exception as e:
+        logger.warning(f"转换图片到base64失败: {e}")
+        return ""
+
+
+def _build_tooltip_html(image: QImage, data: bytes = b"") -> str:
+    """生成封面悬停放大的工具提示HTML"""
+    size = image.size()
+    size.scale(TOOLTIP_SIZE, TOOLTIP_SIZE, Qt.KeepAspectRatio)
+
+    mime = _sniff_mime(data) if len(data) <= RAW_EMBED_LIMIT else None
+    if mime:
+        # 原图本身已是压缩格式，直接内嵌原始字节，由img标签负责缩放
+        encoded = base64.b64encode(data).decode('ascii')
+    else:
+        mime = "image/jpeg"
+        enlarged = image.scaled(size, Qt.IgnoreAspectRatio, Qt.SmoothTransformation)
+        encoded = _image_to_base64(enlarged)
+    if not encoded:
+        return ""
+    return f"""
+            <div style="background-color: white; border: 2px solid #ccc; padding: 5px;">
+                <img src="data:{mime};base64,{encoded}"
+                     width="{size.width()}"
+                     height="{size.height()}" />
+            </div>
+            """
+
+
+def _prune_disk_cache(cache_dir: str) -> None:
+    """删除过期的磁盘缓存文件，并按最早修改时间淘汰直到总大小不超过上限"""
+    try:
+        entries = []
+        with os.scandir(cache_dir) as it:
+            for entry in it:
+                if entry.is_file(follow_symlinks=False):
+                    stat = entry.stat(follow_symlinks=False)
+                    entries.append((stat.st_mtime, stat.st_size, entry.path))
+    except OSError as e:
+        logger.warning(f"扫描封面缓存目录失败: {e}")
+        return
+
+    expire_before = time.time() - DISK_CACHE_MAX_AGE
+    total_size = sum(size for _, size, _ in entries)
+    entries.sort()
+    removed = 0
+    for mtime, size, path in entries:
+        if mtime >= expire_before and total_size <= DISK_CACHE_LIMIT_BYTES:
+            break
+        try:
+            os.remove(path)
+        except OSError:
+            continue
+        total_size -= size
+        removed += 1
+    if removed:
+        logger.info("已清理 %d 个封面缓存文件", removed)
+
+
+class _ThumbnailSignals(QObject):
+    """封面下载任务的信号（QRunnable 本身不能定义信号）"""
+
+    finished = pyqtSignal(str, int, object, str)  # (URL, 图标高度, 缩放后图片, 工具提示)
+
+
+class _ThumbnailJob(QRunnable):
+    """在线程池中下载并解码单个封面"""
+
+    def __init__(self, url: str, icon_height: int, session: requests.Session,
+                 cache_dir: Optional[str], signals: _ThumbnailSignals):
+        super().__init__()
+        self.url = url
+        self.icon_height = icon_height
+        self.session = session
+        self.cache_dir = cache_dir
+        self.signals = signals
+
+    def run(self) -> None:
+        """下载、解码并缩放封面，结果通过信号回传主线程"""
+        image = None
+        tooltip = ""
+        try:
+            data = self._read_cached()
+            if data is None:
+                response = self.session.get(self.url, timeout=5)
+                if response.status_code == 200:
+                    data = response.content
+                    self._write_cached(data)
+
+            if data:
+                original = QImage()
+                original.loadFromData(data)
+                if not original.isNull():
+                    # 行高大小的小图标用快速缩放即可，细节损失不可见
+                    image = original.scaled(self.icon_height, self.icon_height,
+                                            Qt.KeepAspectRatio, Qt.FastTransformation)
+                    tooltip = _build_tooltip_html(original, data)
+        except Exception as e:
+            logger.warning(f"加载封面图片失败: {e}")
+        self.signals.finished.emit(self.url, self.icon_height, image, tooltip)
+
+    def _cache_file(self) -> Optional[str]:
+        """获取磁盘缓存文件路径"""
+        if not self.cache_dir:
+            return None
+        return os.path.join(self.cache_dir, hashlib.md5(self.url.encode('utf-8')).hexdigest())
+
+    def _read_cached(self) -> Optional[bytes]:
+        """读取磁盘缓存"""
+        path = self._cache_file()
+        if path and os.path.isfile(path):
+            try:
+                with open(path, 'rb') as f:
+                    return f.read()
+            except OSError:
+                pass
+        return None
+
+    def _write_cached(self, data: bytes) -> None:
+        """写入磁盘缓存"""
+        path = self._cache_file()
+        if path:
+            try:
+                with open(path, 'wb') as f:
+                    f.write(data)
+            except OSError as e:
+                logger.warning(f"写入封面缓存失败: {e}")
+
+
+class ThumbnailLoader(QObject):
+    """封面加载器"""
+
+    PIXMAP_CACHE_LIMIT_KB = 50 * 1024  # 内存缓存约50MB
+    TOOLTIP_CACHE_SIZE = 200  # 工具提示HTML缓存条数
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.session = requests.Session()
+        self.cache_dir = None
+        self._signals = _ThumbnailSignals()
+        self._signals.finished.connect(self._on_job_finished)
+        # (URL, 图标高度) -> 等待该封面的树形控件项
+        self._pending: Dict[Tuple[str, int], List[QTreeWidgetItem]] = {}
+        # URL -> 工具提示HTML（LRU），每个URL只生成一次
+        self._tooltips: "OrderedDict[str, str]" = OrderedDict()
+
+        QPixmapCache.setCacheLimit(max(QPixmapCache.cacheLimit(), self.PIXMAP_CACHE_LIMIT_KB))
+        self._init_cache_dir()
+
+    def _init_cache_dir(self):
+        """初始化缓存目录"""
+        try:
+            self.cache_dir = os.path.join(tempfile.gettempdir(), "ygmdm_thumbnail_cache")
+            os.makedirs(self.cache_dir, exist_ok=True)
+        except Exception as e:
+            logger.error(f"创建封面缓存目录失败: {e}")
+            self.cache_dir = None
+            return
+        # 启动时在后台清理一次过期和超出大小上限的缓存文件
+        cache_dir = self.cache_dir
+        QThreadPool.globalInstance().start(lambda: _prune_disk_cache(cache_dir))
+
+    @staticmethod
+    def _cache_key(url: str, icon_height: int) -> str:
+        """生成内存缓存键"""
+        return f"thumb:{hashlib.md5(url.encode('utf-8')).hexdigest()}:{icon_height}"
+
+    def request(self, url: str, item: QTreeWidgetItem, icon_height: int) -> None:
+        """请求加载封面，加载完成后自动设置到树形控件项上"""
+        pixmap = QPixmapCache.find(self._cache_key(url, icon_height))
+        if pixmap is not None and not pixmap.isNull():
+            tooltip = self._tooltips.get(url, "")
+            if tooltip:
+                self._tooltips.move_to_end(url)
+            self._apply(item, pixmap, tooltip)
+            return
+
+        key = (url, icon_height)
+        waiting = self._pending.get(key)
+        if waiting is not None:
+            # 相同封面正在下载中，等待结果即可
+            waiting.append(item)
+            return
+
+        self._pending[key] = [item]
+        job = _ThumbnailJob(url, icon_height, self.session, self.cache_dir, self._signals)
+        QThreadPool.globalInstance().start(job)
+
+    def _on_job_finished(self, url: str, icon_height: int, image, tooltip: str) -> None:
+        """封面下载完成（主线程）"""
+        items = self._pending.pop((url, icon_height), [])
+        if image is None:
+            return
+
+        pixmap = QPixmap.fromImage(image)
+        QPixmapCache.insert(self._cache_key(url, icon_height), pixmap)
+        if tooltip:
+            self._tooltips[url] = tooltip
+            self._tooltips.move_to_end(url)
+            if len(self._tooltips) > self.TOOLTIP_CACHE_SIZE:
+                self._tooltips.popitem(last=False)
+        for item in items:
+            self._apply(item, pixmap, tooltip)
+
+    @staticmethod
+    def _apply(item: QTreeWidgetItem, pixmap: QPixmap, tooltip: str) -> None:
+        """将封面和工具提示设置到树形控件项"""
+        try:
+            item.setIcon(0, QIcon(pixmap))
+            if tooltip:
+                item.setToolTip(0, tooltip)
+        except RuntimeError:
+            # 树形控件项已被清除
+            pass
+
+    def clear_pending(self) -> None:
+        """清除等待中的树形控件项引用（结果清空时调用）"""
+        self._pending.clear()
+
+
+# 全局封面加载器实例，首次使用时创建（此时 QApplication 已存在）
+_thumbnail_loader: Optional[ThumbnailLoader] = None
+
+
+def get_thumbnail_loader() -> ThumbnailLoader:
+    """获取全局封面加载器"""
+    global _thumbnail_loader
+    if _thumbnail_loader is None:
+        _thumbnail_loader = ThumbnailLoader()
+    return _thumbnail_loader
@@ -18,8 +18,8 @@ Version: 1.0.0
 import os
 import sys
 import time
-from typing import Dict, List, Optional, Tuple
-from collections import OrderedDict, deque
+from typing import Dict, List, Optional, Set, Tuple
+from collections import deque
 
 from PyQt5.QtWidgets import (
     QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
@@ -35,6 +35,7 @@ from ..core.i18n_manager import i18n_manager, tr
 from ..utils.logger import logger
 from ..core.log_manager import log_manager
 from ..utils.file_utils import sanitize_filename, format_size, get_ffmpeg_path, check_ffmpeg
+from ..utils.lru_cache import SegmentedLRUCache
 from ..workers.parse_worker import ParseWorker
 from ..workers.download_worker import DownloadWorker
 from .main_window_methods import VideoDownloaderMethods
@@ -59,20 +60,21 @@ class VideoDownloader(QMainWindow, VideoDownloaderMethods):
         
         # 基础配置
         self.save_path: str = os.getcwd()                    # 文件保存路径
-        self.parse_cache: OrderedDict = OrderedDict()        # 解析结果缓存
+        self.parse_cache = SegmentedLRUCache(Config.CACHE_LIMIT)  # 解析结果缓存
         self.formats: List[Dict] = []                        # 可用格式列表
         self.download_progress: Dict[str, Tuple[float, str]] = {}  # 下载进度信息
         self.is_downloading: bool = False                    # 下载状态标志
         
         # 工作线程管理
         self.download_workers: List[DownloadWorker] = []     # 下载工作线程列表
-        self.parse_workers: List[ParseWorker] = []           # 解析工作线程列表
+        self.parse_workers: Set[ParseWorker] = set()         # 解析工作线程集合，线程退出时自动移除
 
         self.netease_music_workers: List = []                # 网易云音乐解析工作线程列表
         self.download_queue: deque = deque()                 # 下载队列
         
         # 状态计数
         self.active_downloads: int = 0                       # 活动下载数量
+        self.completed_downloads: int = 0                    # 本次下载会话中已结束（完成或出错）的文件数，只增不减
         self.total_urls: int = 0                             # 总URL数量
         self.parsed_count: int = 0                           # 已解析数量
         self.is_parsing: bool = False                        # 解析状态标志
@@ -414,6 +416,11 @@ class VideoDownloader(QMainWindow, VideoDownloaderMethods):
         # 状态显示相关变量
         self.current_status = tr("main_window.ready")
         self.latest_progress = ""
+        # 滚动状态限流：100毫秒内的多条消息只显示最后一条
+        self._last_scroll_update = 0.0
+        self._scroll_flush_timer = QTimer(self)
+        self._scroll_flush_timer.setSingleShot(True)
+        self._scroll_flush_timer.timeout.connect(self._flush_scroll_status)
         
         # 添加到状态栏 - 占用整个状态栏
         self.statusBar.addWidget(self.status_scroll_label, 1)  # 1表示拉伸因子
@@ -953,35 +960,58 @@ class VideoDownloader(QMainWindow, VideoDownloaderMethods):
                 # 处于下载暂停状态，忽略状态更新
                 return
             
-            # 不过滤任何消息，显示所有后台信息
-            # 添加时间戳
-            from datetime import datetime
-            timestamp = datetime.now().strftime("%H:%M:%S")
-            formatted_text = f"[{timestamp}] {status_text}"
-            
-            # 检查文本长度，如果过长则截断
-            max_length = 120  # 最大显示长度
-            if len(formatted_text) > max_length:
-                # 保留时间戳和开头部分，末尾添加省略号
-                timestamp_part = f"[{timestamp}] "
-                available_length = max_length - len(timestamp_part) - 3  # 3是省略号长度
-                if available_length > 0:
-                    truncated_text = f"{timestamp_part}{status_text[:available_length]}..."
-                else:
-                    truncated_text = f"{timestamp_part}..."
-            else:
-                truncated_text = formatted_text
-            
-            # 直接更新状态栏，每次只显示一行
-            self.status_scroll_label.setText(truncated_text)
-            
             # 记录最新状态
             self.latest_progress = status_text
+            
+            # 距上次刷新不足100毫秒时只保留最新消息，由定时器稍后统一显示
+            elapsed = time.monotonic() - self._last_scroll_update
+            if elapsed < 0.1:
+                if not self._scroll_flush_timer.isActive():
+                    self._scroll_flush_timer.start(int((0.1 - elapsed) * 1000) + 1)
+                return
+            
+            self._render_scroll_status(status_text)
                 
         except Exception as e:
             # 记录错误但不影响程序运行
             logger.error(f"状态栏更新失败: {e}")
     
+    def _flush_scroll_status(self) -> None:
+        """显示限流期间积压的最新状态消息"""
+        try:
+            # 等待期间下载被暂停时不再显示
+            if self.smart_pause_button.text() == tr("main_window.resume_download"):
+                return
+            self._render_scroll_status(self.latest_progress)
+        except Exception as e:
+            logger.error(f"状态栏更新失败: {e}")
+    
+    def _render_scroll_status(self, status_text: str) -> None:
+        """将状态消息加上时间戳后显示到状态栏"""
+        self._last_scroll_update = time.monotonic()
+        
+        # 不过滤任何消息，显示所有后台信息
+        # 添加时间戳
+        from datetime import datetime
+        timestamp = datetime.now().strftime("%H:%M:%S")
+        formatted_text = f"[{timestamp}] {status_text}"
+        
+        # 检查文本长度，如果过长则截断
+        max_length = 120  # 最大显示长度
+        if len(formatted_text) > max_length:
+            # 保留时间戳和开头部分，末尾添加省略号
+            timestamp_part = f"[{timestamp}] "
+            available_length = max_length - len(timestamp_part) - 3  # 3是省略号长度
+            if available_length > 0:
+                truncated_text = f"{timestamp_part}{status_text[:available_length]}..."
+            else:
+                truncated_text = f"{timestamp_part}..."
+        else:
+            truncated_text = formatted_text
+        
+        # 直接更新状态栏，每次只显示一行
+        self.status_scroll_label.setText(truncated_text)
+    
     def _should_filter_status_message(self, message: str) -> bool:
         """判断是否应该过滤掉状态消息"""
         # 过滤掉一些过于频繁或无用的消息
@@ -1110,6 +1140,27 @@ class VideoDownloader(QMainWindow, VideoDownloaderMethods):
         # 关于
         about_action = help_menu.addAction(tr('menu.about'))
         about_action.triggered.connect(self.show_about_dialog)
+        
+        # 翻译键 -> 菜单和菜单项，切换语言时直接按键更新文本
+        self._menu_actions = {
+            'menu.file': file_menu.menuAction(),
+            'menu.new_session': new_action,
+            'menu.open_folder': open_folder_action,
+            'menu.exit': exit_action,
+            'menu.edit': edit_menu.menuAction(),
+            'menu.clear_input': clear_input_action,
+            'menu.clear_list': clear_results_action,
+            'menu.tools': tools_menu.menuAction(),
+            'menu.settings': settings_action,
+            'menu.history': history_action,
+            'menu.subtitle': subtitle_action,
+            'menu.log': log_action,
+            'menu.help': help_menu.menuAction(),
+            'menu.help_content': help_action,
+            'menu.check_update': update_action,
+            'menu.feedback': feedback_action,
+            'menu.about': about_action,
+        }
     
     def ensure_column_widths(self) -> None:
         """确保列宽设置正确，特别是选择列的宽度"""
@@ -1255,14 +1306,14 @@ class VideoDownloader(QMainWindow, VideoDownloaderMethods):
         """清理所有工作线程，防止内存泄漏"""
         try:
             # 清理解析工作线程
-            for worker in self.parse_workers[:]:  # 使用切片创建副本避免修改迭代中的列表
+            for worker in list(self.parse_workers):  # 创建副本避免修改迭代中的集合
                 if worker and worker.isRunning():
                     worker.cancel()
                     worker.wait(3000)  # 等待最多3秒
                     if worker.isRunning():
                         worker.terminate()  # 强制终止
                         worker.wait(1000)
-                self.parse_workers.remove(worker)
+                self.parse_workers.discard(worker)
             
             # 清理下载工作线程
             for worker in self.download_workers[:]:
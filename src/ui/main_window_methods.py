@@ -16,19 +16,27 @@ Version: 1.0.0"""
 
 import os
 import re
+import sys
+import logging
 import time
 import threading
 import gc
 import psutil
 import shutil
-from typing import Dict, List, Optional, Tuple, Any
+from collections import defaultdict, deque
+from dataclasses import dataclass
+from functools import lru_cache
+from itertools import chain, islice
+from operator import itemgetter
+from types import MappingProxyType
+from typing import Dict, List, Optional, Set, Tuple, Any
 # from collections import OrderedDict  # 未使用，已移除
 
 from PyQt5.QtWidgets import (
     QMessageBox, QFileDialog, QTreeWidgetItem, QDialog, QVBoxLayout, QHBoxLayout, QLabel, QPushButton, QMenu, QApplication
 )
-from PyQt5.QtCore import Qt, QUrl, QPoint, QTimer
-from PyQt5.QtGui import QCloseEvent, QDesktopServices, QPixmap
+from PyQt5.QtCore import Qt, QUrl, QPoint, QThread, QTimer, QThreadPool
+from PyQt5.QtGui import QCloseEvent, QDesktopServices, QIcon, QBrush
 
 from ..core.config import Config
 from ..core.i18n_manager import i18n_manager, tr
@@ -38,17 +46,445 @@ from ..core.playlist_manager import playlist_manager
 
 from ..core.subtitle_manager import subtitle_manager
 from ..core.sound_manager import sound_manager
+from ..core.thumbnail_loader import get_thumbnail_loader
+from ..core.preview_manager import preview_manager
 
 from ..core.netease_music_manager import NetEaseMusicManager
 from ..utils.logger import logger
-from ..utils.file_utils import sanitize_filename, format_size, get_ffmpeg_path, check_ffmpeg
+from ..utils.file_utils import sanitize_filename, format_size, get_ffmpeg_path, check_ffmpeg, list_file_names
 from ..core.log_manager import log_manager, LogViewer
 from ..workers.parse_worker import ParseWorker
 from ..workers.download_worker import DownloadWorker
 
 from ..workers.netease_music_worker import NetEaseMusicParseWorker
+from ..workers.playlist_worker import PlaylistFetchWorker
+from ..workers.dir_scan_worker import DirScanWorker
+from ..workers.memory_probe_worker import MemoryProbeWorker
 
 
+@dataclass
+class ParseProgress:
+    """解析进度计数器，作为解析完成判断的唯一依据"""
+    done: int = 0
+    total: int = 0
+
+    def tick(self) -> bool:
+        """完成数加一，返回是否全部完成"""
+        self.done += 1
+        return self.done >= self.total
+
+
+# 预编译的正则表达式，避免热路径上重复查找编译缓存
+_RE_TRAIL_NUM = re.compile(r"_\d+$")  # 文件名末尾的数字后缀
+_RE_PART_MARKER = re.compile(r"p\d+")  # 合集分P标识
+_RE_PART_TITLE = re.compile(r"p\d+\s*(.+?)(?:_\w+)?$")  # 合集分P标题
+_RE_PART_NUMBER = re.compile(r"[Pp](\d+)")  # 分P编号
+_RE_WXH = re.compile(r"(\d+)x(\d+)")  # 宽x高
+_RE_P_RESOLUTION = re.compile(r"^\d+p$")  # 1080p 形式的分辨率
+_RE_HTTP_URL = re.compile(r"^https?://")  # HTTP/HTTPS链接（只需匹配前缀）
+_RE_PLATFORM = re.compile(r"(youtube\.com|youtu\.be|bilibili\.com|music\.163\.com)")  # 平台域名
+
+# 平台域名 -> 平台名称
+_PLATFORM_MAP = {
+    'youtube.com': 'youtube',
+    'youtu.be': 'youtube',
+    'bilibili.com': 'bilibili',
+    'music.163.com': 'netease_music',
+}
+
+# 格式项的两种标志：未下载时可勾选，已下载时禁用复选框防止重复下载
+_FLAGS_CHECKABLE = Qt.ItemIsEnabled | Qt.ItemIsUserCheckable
+_FLAGS_DOWNLOADED = Qt.ItemIsEnabled
+
+# 内存告警后强制完整垃圾回收的最小间隔（秒）
+_GC_MIN_INTERVAL = 30.0
+
+# 两次内存检查之间至少新增的内存块数，分配不活跃时跳过进程内存查询
+_MEMORY_CHECK_MIN_NEW_BLOCKS = 100_000
+
+# 重置解析时需要断开的工作线程结果信号（线程退出信号保持连接，用于释放工作线程）
+_PARSE_WORKER_RESULT_SIGNALS = (
+    "status_signal", "log_signal", "progress_signal", "video_parsed_signal", "finished", "error",
+)
+_NETEASE_WORKER_RESULT_SIGNALS = (
+    "progress_signal", "log_signal", "music_parsed_signal", "error_signal", "finished_signal",
+)
+
+# 下载状态刷新的合并窗口（毫秒），窗口内的多次刷新请求只扫描一次目录
+_STATUS_REFRESH_DELAY_MS = 300
+
+# 可用磁盘空间缓存有效期（秒）
+_DISK_SPACE_CACHE_TTL = 2.0
+
+# 没有具体格式ID时按高度选择的格式规格，从高到低排列
+_HEIGHT_LADDER = (
+    (1080, "best[height>=1080]+bestaudio/best"),
+    (720, "best[height>=720]+bestaudio/best"),
+    (480, "best[height>=480]+bestaudio/best"),
+    (360, "best[height>=360]+bestaudio/best"),
+)
+
+# 视频下载的固定 yt-dlp 选项，每次下载只需复制并补充与本次任务相关的键
+_YDL_BASE_VIDEO = MappingProxyType({
+    "quiet": False,
+    "prefer_ffmpeg": True,
+    
+    # 下载恢复和断点续传
+    "continuedl": True,  # 启用断点续传
+    "noprogress": False,  # 显示进度
+    
+    # 错误处理
+    "ignoreerrors": False,  # 不忽略错误，确保错误被正确处理
+    
+    # 文件覆盖配置，避免同名文件导致下载失败
+    "overwrites": True,
+    
+    # 网络配置
+    "prefer_insecure": True,  # 优先使用不安全的连接
+    "no_check_certificate": True,  # 不检查证书
+    
+    # 优化下载配置 - 适度并发，提高稳定性
+    "concurrent_fragment_downloads": 8,  # 减少并发，提高稳定性
+    "concurrent_fragments": 8,
+    "http_chunk_size": 8388608,  # 8MB块大小，平衡速度和稳定性
+    "buffersize": 32768,  # 32KB缓冲区
+    
+    # 网络优化 - 适度超时，提高成功率
+    "socket_timeout": 90,  # 适度超时时间
+    "retries": 8,  # 适度重试次数
+    "fragment_retries": 5,
+    "extractor_retries": 3,
+})
+
+# 视频下载的请求头
+_HEADERS_VIDEO = MappingProxyType({
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
+    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+    "Accept-Language": "en-US,en;q=0.5",
+    "Accept-Encoding": "gzip, deflate",
+    "Connection": "keep-alive",
+})
+
+# 统一下载配置的固定 yt-dlp 选项（_get_download_options 复制后补充本次任务相关的键）
+_YDL_BASE_OPTIONS = MappingProxyType({
+    "quiet": False,
+    
+    # 增强下载稳定性配置
+    "retries": 10,  # 增加重试次数
+    "fragment_retries": 10,  # 增加片段重试次数
+    "extractor_retries": 5,  # 增加提取器重试次数
+    "socket_timeout": 60,  # 增加socket超时时间
+    "http_chunk_size": 10485760,  # 10MB块大小，平衡速度和稳定性
+    "buffersize": 4096,  # 增大缓冲区
+    
+    # 下载恢复和断点续传
+    "continuedl": True,  # 启用断点续传
+    "noprogress": False,  # 显示进度
+    
+    # 错误处理
+    "ignoreerrors": False,  # 不忽略错误，确保错误被正确处理
+    "no_warnings": False,  # 显示警告信息
+    
+    # 网络配置
+    "prefer_insecure": True,  # 优先使用不安全的连接
+    "no_check_certificate": True,  # 不检查证书
+})
+
+# 网易云音乐下载的固定 yt-dlp 选项，专门针对网易云音乐的反爬虫机制
+_YDL_BASE_NETEASE = MappingProxyType({
+    "quiet": False,
+    
+    # 增强下载稳定性配置
+    "socket_timeout": 120,
+    "http_chunk_size": 10485760,
+    "buffersize": 8192,
+    
+    # 下载恢复和断点续传
+    "continuedl": True,
+    "noprogress": False,
+    
+    # 错误处理
+    "ignoreerrors": False,
+    "no_warnings": False,
+    
+    # 网络配置
+    "prefer_insecure": True,
+    "no_check_certificate": True,
+    "nocheckcertificate": True,
+    
+    # 允许FFmpeg进行音视频合并
+    "merge_output_format": "mp4",  # 指定合并格式为mp4
+    
+    # 地理绕过
+    "geo_bypass": True,
+    "geo_bypass_country": "CN",
+    
+    # 下载策略
+    "concurrent_fragment_downloads": 5,
+    "max_sleep_interval": 5,
+    "sleep_interval": 1,
+    
+    # 格式选择策略
+    "format": "best[ext=mp3]/best",
+    "format_sort": ("ext:mp3:m4a", "quality", "filesize"),
+    
+    # 重试策略
+    "retry_sleep": "exponential",
+    "retries": 15,
+    "max_retries": 15,
+    "fragment_retries": 15,
+    "extractor_retries": 10,
+})
+
+# 网易云音乐下载的请求头 - 模拟真实浏览器
+_HEADERS_NETEASE = MappingProxyType({
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
+    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,image/apng,*/*;q=0.8,application/signed-exchange;v=b3;q=0.7",
+    "Accept-Language": "zh-CN,zh;q=0.9,en;q=0.8",
+    "Accept-Encoding": "gzip, deflate, br",
+    "Connection": "keep-alive",
+    "Upgrade-Insecure-Requests": "1",
+    "Sec-Fetch-Dest": "document",
+    "Sec-Fetch-Mode": "navigate",
+    "Sec-Fetch-Site": "none",
+    "Sec-Fetch-User": "?1",
+    "Cache-Control": "max-age=0",
+    "Referer": "https://music.163.com/",
+    "Origin": "https://music.163.com",
+    "DNT": "1",
+})
+
+# 网易云音乐下载的额外HTTP头部
+_HTTP_HEADERS_NETEASE = MappingProxyType({
+    "Referer": "https://music.163.com/",
+    "Origin": "https://music.163.com",
+    "X-Requested-With": "XMLHttpRequest",
+})
+
+
+# 下载完成对话框：窗口背景和边框
+_COMPLETION_DIALOG_QSS = """
+    QDialog {
+        background-color: #ffffff;
+        border: 1px solid #e0e0e0;
+        border-radius: 8px;
+    }
+"""
+
+# 下载完成对话框：标题
+_COMPLETION_TITLE_QSS = """
+    font-size: 20px; 
+    font-weight: bold; 
+    color: #28a745; 
+    margin: 0;
+    padding: 10px 0;
+"""
+
+# 下载完成对话框：分隔线
+_COMPLETION_LINE_QSS = "background-color: #e0e0e0; margin: 0;"
+
+# 下载完成对话框：成功信息
+_COMPLETION_SUCCESS_QSS = """
+    font-size: 14px; 
+    color: #495057; 
+    margin: 15px 0 10px 0;
+    padding: 8px 0;
+    line-height: 1.4;
+    min-height: 20px;
+"""
+
+# 下载完成对话框：路径信息容器
+_COMPLETION_PATH_BOX_QSS = """
+    background-color: #f8f9fa;
+    border: 1px solid #e9ecef;
+    border-radius: 6px;
+    padding: 15px;
+    margin: 10px 0;
+    font-family: "Microsoft YaHei", sans-serif;
+"""
+
+# 下载完成对话框：路径标题
+_COMPLETION_PATH_TITLE_QSS = """
+    font-size: 13px; 
+    font-weight: bold; 
+    color: #495057; 
+    margin: 0 0 8px 0;
+"""
+
+# 下载完成对话框：路径内容
+_COMPLETION_PATH_QSS = """
+    font-size: 12px; 
+    color: #6c757d; 
+    margin: 0;
+    line-height: 1.4;
+"""
+
+# 下载完成对话框：确定按钮
+_COMPLETION_OK_BUTTON_QSS = """
+    QPushButton {
+        background-color: #6c757d;
+        color: #ffffff;
+        border: 1px solid #6c757d;
+        border-radius: 6px;
+        padding: 1px 8px;
+        font-family: "Microsoft YaHei", sans-serif;
+        font-size: 13px;
+        font-weight: 400;
+    }
+    QPushButton:hover {
+        background-color: #5a6268;
+        border: 1px solid #5a6268;
+    }
+    QPushButton:pressed {
+        background-color: #545b62;
+        border: 1px solid #545b62;
+    }
+"""
+
+# 下载完成对话框：打开文件夹按钮
+_COMPLETION_OPEN_BUTTON_QSS = """
+    QPushButton {
+        background-color: #007bff;
+        color: #ffffff;
+        border: 1px solid #007bff;
+        border-radius: 6px;
+        padding: 1px 8px;
+        font-family: "Microsoft YaHei", sans-serif;
+        font-size: 13px;
+        font-weight: 400;
+    }
+    QPushButton:hover {
+        background-color: #0056b3;
+        border: 1px solid #0056b3;
+    }
+    QPushButton:pressed {
+        background-color: #004085;
+        border: 1px solid #004085;
+    }
+"""
+
+
+# 下载错误类型及处理建议
+_ERROR_TYPES = {
+    "network": {
+        "keywords": ["timeout", "connection", "network", "unreachable", "refused"],
+        "title": "网络连接问题",
+        "message": "网络连接出现问题，请检查网络设置",
+        "suggestions": [
+            "检查网络连接是否正常",
+            "尝试切换网络环境",
+            "检查防火墙设置",
+            "稍后重试下载"
+        ]
+    },
+    "incomplete": {
+        "keywords": ["bytes read", "more expected", "incomplete", "partial"],
+        "title": "下载不完整",
+        "message": "文件下载不完整，可能因网络中断导致",
+        "suggestions": [
+            "检查网络连接稳定性",
+            "尝试重新下载",
+            "降低下载速度限制",
+            "使用断点续传功能"
+        ]
+    },
+    "format": {
+        "keywords": ["format", "codec", "unsupported", "invalid"],
+        "title": "格式不支持",
+        "message": "文件格式或编解码器不被支持",
+        "suggestions": [
+            "选择其他视频格式",
+            "更新FFmpeg版本",
+            "检查视频源是否正常",
+            "尝试不同的分辨率"
+        ]
+    },
+    "permission": {
+        "keywords": ["permission", "access denied", "forbidden", "unauthorized"],
+        "title": "权限不足",
+        "message": "没有足够的权限访问资源",
+        "suggestions": [
+            "检查文件保存路径权限",
+            "以管理员身份运行程序",
+            "更换保存目录",
+            "检查磁盘空间"
+        ]
+    },
+    "server": {
+        "keywords": ["server", "404", "500", "not found", "unavailable"],
+        "title": "服务器问题",
+        "message": "视频服务器暂时不可用",
+        "suggestions": [
+            "稍后重试下载",
+            "检查视频链接是否有效",
+            "尝试其他下载源",
+            "联系技术支持"
+        ]
+    }
+}
+
+# 未匹配到特定类型时使用的通用错误
+_ERROR_GENERAL = {
+    "title": "下载失败",
+    "message": "下载过程中出现未知错误",
+    "suggestions": [
+        "检查网络连接",
+        "尝试重新下载",
+        "重启应用程序",
+        "联系技术支持"
+    ]
+}
+
+# 所有错误类型的关键词合并为一个带命名分组的正则，一次扫描即可分类
+# 分组顺序与 _ERROR_TYPES 一致，多个类型同时命中时取最先出现的关键词
+_RE_ERROR_TYPE = re.compile(
+    "|".join(
+        f"(?P<{etype}>{'|'.join(map(re.escape, config['keywords']))})"
+        for etype, config in _ERROR_TYPES.items()
+    ),
+    re.IGNORECASE,
+)
+
+# 各错误类型的友好提示文本，加载时一次生成（键 "general" 对应通用错误）
+_FRIENDLY_ERROR_MESSAGES = MappingProxyType({
+    etype: "{}\n\n💡 解决建议：\n{}".format(
+        config["message"],
+        "".join(f"{i}. {suggestion}\n" for i, suggestion in enumerate(config["suggestions"], 1)),
+    )
+    for etype, config in (*_ERROR_TYPES.items(), ("general", _ERROR_GENERAL))
+})
+
+
+# 标准分辨率列表 - 扩展支持更多常见分辨率
+_STANDARD_RESOLUTIONS = frozenset({
+    # 4K
+    "3840x2160", "4096x2160",
+    # 2K
+    "2560x1440", "2048x1080",
+    # 1080P
+    "1920x1080", "1920x1088", "1440x1080",  # 添加1440x1080（4:3比例1080P）
+    # 720P
+    "1280x720", "1280x736", "960x720",  # 添加960x720（4:3比例720P）
+    # 480P - 添加更多变体
+    "854x480", "848x480", "832x480", "852x480", "850x480", "856x480", "858x480", "860x480", "862x480", "864x480", "866x480", "868x480", "870x480", "872x480", "874x480", "876x480", "878x480", "880x480",
+    # 360P
+    "640x360", "640x368", "640x480",  # 添加640x480（4:3比例480P）
+    # 240P
+    "426x240", "424x240", "480x360",  # 添加480x360（4:3比例360P）
+    # 144P
+    "256x144", "256x160"
+})
+
+
+def _parse_resolution_pair(res: str) -> Tuple[int, int]:
+    """将 "宽x高" 形式的分辨率拆分为整数元组"""
+    left, _, right = res.rpartition("x")
+    return int(left), int(right)
+
+
+# 预先解析的标准分辨率宽高表，避免每次比较时重复拆分字符串
+_STANDARD_RESOLUTION_SIZES = tuple(_parse_resolution_pair(res) for res in _STANDARD_RESOLUTIONS)
+
 
 def is_standard_resolution(resolution: str) -> bool:
     """
@@ -60,26 +496,6 @@ def is_standard_resolution(resolution: str) -> bool:
     Returns:
         bool: 是否为标准分辨率
     """
-    # 标准分辨率列表 - 扩展支持更多常见分辨率
-    standard_resolutions = {
-        # 4K
-        "3840x2160", "4096x2160",
-        # 2K
-        "2560x1440", "2048x1080",
-        # 1080P
-        "1920x1080", "1920x1088", "1440x1080",  # 添加1440x1080（4:3比例1080P）
-        # 720P
-        "1280x720", "1280x736", "960x720",  # 添加960x720（4:3比例720P）
-        # 480P - 添加更多变体
-        "854x480", "848x480", "832x480", "852x480", "850x480", "856x480", "858x480", "860x480", "862x480", "864x480", "866x480", "868x480", "870x480", "872x480", "874x480", "876x480", "878x480", "880x480",
-        # 360P
-        "640x360", "640x368", "640x480",  # 添加640x480（4:3比例480P）
-        # 240P
-        "426x240", "424x240", "480x360",  # 添加480x360（4:3比例360P）
-        # 144P
-        "256x144", "256x160"
-    }
-    
     # 处理None值
     if resolution is None:
         return False
@@ -88,7 +504,7 @@ def is_standard_resolution(resolution: str) -> bool:
     clean_resolution = str(resolution).strip().lower()
     
     # 检查是否在标准分辨率列表中
-    if clean_resolution in standard_resolutions:
+    if clean_resolution in _STANDARD_RESOLUTIONS:
         return True
     
     # 检查是否为音频格式（没有分辨率）
@@ -96,32 +512,79 @@ def is_standard_resolution(resolution: str) -> bool:
         return True
     
     # 检查是否为标准P格式（如1080p, 720p等）
-    if re.match(r"^\d+p$", clean_resolution):
+    if _RE_P_RESOLUTION.match(clean_resolution):
         p_value = int(clean_resolution[:-1])
         if p_value in [144, 240, 360, 480, 720, 1080, 1440, 2160]:
             return True
     
     # 检查是否为接近标准分辨率的格式（允许±1像素的误差）
-    if "x" in clean_resolution:
-        try:
-            width, height = clean_resolution.split("x")
-            width, height = int(width), int(height)
-            
-            # 检查是否接近标准分辨率
-            for std_res in standard_resolutions:
-                if "x" in std_res:
-                    std_width, std_height = std_res.split("x")
-                    std_width, std_height = int(std_width), int(std_height)
-                    
-                    # 允许±4像素的误差，以包含更多变体
-                    if abs(width - std_width) <= 4 and abs(height - std_height) <= 4:
-                        return True
-        except (ValueError, IndexError):
-            pass
+    left, sep, right = clean_resolution.rpartition("x")
+    if not sep:
+        return False
+    try:
+        width = int(left)
+        height = int(right)
+    except ValueError:
+        return False
+    
+    # 检查是否接近标准分辨率，允许±4像素的误差，以包含更多变体
+    for std_width, std_height in _STANDARD_RESOLUTION_SIZES:
+        if abs(width - std_width) <= 4 and abs(height - std_height) <= 4:
+            return True
     
     return False
 
 
+# 主流分辨率锚点：高度 -> [(宽度, 标准分辨率)]
+_RES_ANCHORS = {
+    1080: [(1920, "1920x1080"), (1440, "1440x1080")],  # 1080P 变体
+    720: [(1280, "1280x720"), (960, "960x720")],  # 720P 变体
+    480: [(852, "852x480"), (640, "640x480")],  # 480P 变体
+    360: [(640, "640x360"), (480, "480x360")],  # 360P 变体
+    240: [(426, "426x240")],  # 240P 变体
+}
+
+# 高度（±4像素）-> 锚点高度的查找表
+_HEIGHT_LOOKUP = {anchor + d: anchor for anchor in _RES_ANCHORS for d in range(-4, 5)}
+
+
+@lru_cache(maxsize=512)
+def _standardize_resolution(resolution: str) -> str:
+    """将 "宽x高" 分辨率标准化到最接近的主流分辨率，无法匹配时原样返回"""
+    try:
+        width, height = _parse_resolution_pair(resolution)
+    except ValueError:
+        return resolution
+    
+    anchor = _HEIGHT_LOOKUP.get(height)
+    if anchor is None:
+        return resolution
+    for std_width, std_resolution in _RES_ANCHORS[anchor]:
+        if abs(width - std_width) <= 4:
+            return std_resolution
+    return resolution
+
+
+def _resolution_sort_key(res_text) -> int:
+    """分辨率排序键：按高度排序，None 排在最后"""
+    # 处理None值
+    if res_text is None or res_text == "None":
+        return -1  # None值排在最后
+    
+    if "x" in str(res_text):
+        try:
+            width, height = str(res_text).split("x")
+            return int(height)  # 按高度排序
+        except (ValueError, IndexError):
+            return 0
+    return 0
+
+
+def _filter_nonstrict(formats: List[Dict]) -> List[Dict]:
+    """非严格过滤：保留音频和所有视频格式，仅剔除既无视频也无音频的格式"""
+    return [f for f in formats if not (f.get("vcodec", "none") == "none" and f.get("acodec", "none") == "none")]
+
+
 def filter_formats(formats: List[Dict], strict_filter: bool = False) -> List[Dict]:
     """
     过滤格式列表，只保留标准分辨率的格式
@@ -133,9 +596,22 @@ def filter_formats(formats: List[Dict], strict_filter: bool = False) -> List[Dic
     Returns:
         List[Dict]: 过滤后的格式列表
     """
+    if not strict_filter:
+        return _filter_nonstrict(formats)
+    
     filtered_formats = []
     
     for format_info in formats:
+        # 检查是否为音频格式
+        acodec = format_info.get("acodec", "none")
+        vcodec = format_info.get("vcodec", "none")
+        if vcodec == "none":
+            if acodec != "none":
+                # 音频格式，保留
+                filtered_formats.append(format_info)
+            # 跳过既无视频也无音频的格式
+            continue
+        
         # 获取分辨率信息
         resolution = format_info.get("resolution", "")
         format_note = format_info.get("format_note", "")
@@ -149,29 +625,11 @@ def filter_formats(formats: List[Dict], strict_filter: bool = False) -> List[Dic
         elif not resolution_str and format_note:
             resolution_str = format_note
         
-        # 检查是否为音频格式
-        acodec = format_info.get("acodec", "none")
-        vcodec = format_info.get("vcodec", "none")
-        if acodec != "none" and vcodec == "none":
-            # 音频格式，保留
-            filtered_formats.append(format_info)
-            continue
-        
-        # 检查是否为视频格式
-        if vcodec == "none":
-            # 跳过纯音频格式（非视频）
-            continue
-        
-        # 如果不使用严格过滤，保留所有视频格式
-        if not strict_filter:
-            filtered_formats.append(format_info)
-            continue
-        
         # 严格过滤模式：只保留标准分辨率的格式
         if is_standard_resolution(resolution_str):
             filtered_formats.append(format_info)
         else:
-            logger.info(f"过滤掉非标准分辨率: {resolution_str} (原始: {resolution}, 说明: {format_note}, 宽高: {width}x{height})")
+            logger.debug("过滤掉非标准分辨率: %s (原始: %s, 说明: %s, 宽高: %sx%s)", resolution_str, resolution, format_note, width, height)
     
     return filtered_formats
 
@@ -185,15 +643,127 @@ class VideoDownloaderMethods:
         self._parse_lock = threading.RLock()  # 使用可重入锁
         self._download_lock = threading.RLock()
         self._cache_lock = threading.RLock()
-        self._memory_lock = threading.Lock()  # 内存检查锁
         
         # 内存监控
-        self._last_memory_check = time.time()
+        self._last_memory_check = time.monotonic()
         self._memory_check_interval = 60  # 60秒检查一次内存，减少频率
+        self._process = psutil.Process()  # 当前进程，复用同一个句柄
+        self._last_allocated_blocks = sys.getallocatedblocks()  # 上次检查时已分配的内存块数
+        self._last_gc_time = 0.0  # 上次强制完整垃圾回收的时间
+        self._memory_probe_signals = None  # 进行中的内存查询任务信号，同一时间只查询一次
+        
+        # 网易云音乐解析进度
+        self._progress = ParseProgress()
+        # 活动的视频解析工作线程数量
+        self._active_parse_workers = 0
+        # 已请求取消但线程尚未退出的解析工作线程，保留引用直到线程退出后释放
+        self._retiring_parse_workers: Set[QThread] = set()
+        # 进行中的播放列表网络请求信号对象，回调完成后移除
+        self._playlist_fetch_signals: Set = set()
+        # 是否已安排选择计数更新
+        self._selection_count_pending = False
+        # 最近一次统计的选中数和可选总数，全选/取消全选/反选时直接推算
+        self._sel_selected = 0
+        self._sel_total = 0
+        # 等待批量处理的下载完成事件：(文件名, URL, 格式信息)
+        self._pending_completions: List[Tuple[str, str, Optional[Dict]]] = []
+        self._completion_flush_timer = QTimer(self)
+        self._completion_flush_timer.setSingleShot(True)
+        self._completion_flush_timer.setInterval(50)
+        self._completion_flush_timer.timeout.connect(self._flush_download_completions)
+        # 取消解析/取消下载的确认框，首次使用时创建
+        self._cancel_confirm_box: Optional[QMessageBox] = None
+        self._cancel_downloads_box: Optional[QMessageBox] = None
+        # 下载完成对话框和右键菜单，首次使用时创建，之后只更新可变部分
+        self._completion_dialog: Optional[QDialog] = None
+        self._url_input_menu: Optional[QMenu] = None
+        self._format_tree_menu: Optional[QMenu] = None
+        # 快捷键帮助和关于对话框，HTML 只在首次打开或切换语言后生成和解析
+        self._shortcuts_dialog: Optional[QDialog] = None
+        self._about_dialog: Optional[QDialog] = None
+        # 翻译键 -> 菜单栏上的 QAction，由 create_menu_bar 填充
+        self._menu_actions: Dict[str, Any] = {}
+        # 自动检查更新的 (信号, 槽) 连接，收到结果后统一断开
+        self._auto_update_connections: Tuple = ()
+        # 设置、帮助、反馈、历史和字幕对话框，首次打开时创建，之后复用同一实例
+        self._settings_dialog: Optional[QDialog] = None
+        self._help_dialog: Optional[QDialog] = None
+        self._feedback_dialog: Optional[QDialog] = None
+        self._history_dialog: Optional[QDialog] = None
+        self._subtitle_dialog: Optional[QDialog] = None
+        # QSettings 中已保存的保存路径，关闭窗口时未变化则不再写入
+        self._loaded_save_path: Optional[str] = None
+        # 上一次写入界面的下载进度快照，未变化时跳过标题和状态栏刷新
+        self._last_progress_snapshot: Optional[Tuple] = None
+        
+        # 复用网易云音乐管理器，避免每次识别链接都新建会话
+        self._netease_mgr = NetEaseMusicManager()
+        
+        # 分辨率分组索引：分辨率名称 -> 分组节点
+        self._res_group_index: Dict[str, QTreeWidgetItem] = {}
+        # 文件名计数：(分组节点id, 基础文件名) -> 下一个尝试的后缀序号
+        self._name_counts: Dict[Tuple[int, str], int] = defaultdict(int)
+        # 已分配的文件名：分组节点id -> 该分组内已使用的文件名集合
+        self._assigned_names: Dict[int, Set[str]] = defaultdict(set)
+        # 已添加到格式树的视频：(视频ID, P数)
+        self._processed_video_ids: set = set()
+        # 树形控件项 -> 格式信息，键为 id(item)
+        self._item_to_format: Dict[int, Dict] = {}
+        # 描述/下载地址 -> 格式信息，同名时保留最先添加的格式
+        self._formats_by_desc: Dict[str, Dict] = {}
+        self._formats_by_url: Dict[str, Dict] = {}
+        
+        # 缓存热路径上使用的翻译文本、图标和画刷
+        self._rebuild_tr_cache()
+        self._rebuild_icon_cache()
+        self._brush_downloaded = QBrush(Qt.green)
+        self._brush_not_downloaded = QBrush(Qt.black)
+        
+        # 可用磁盘空间缓存：(查询时间, 查询的路径, 可用字节数)，None 表示路径不可用
+        self._disk_space_cache: Tuple[float, str, Optional[int]] = (0.0, "", None)
+        
+        # 保存目录中已有文件名的快照，按需构建（None 表示需要重新扫描）
+        self._existing_files: Optional[set] = None
+        # 下载状态刷新：短时间内的多次请求合并为一次后台目录扫描
+        self._status_refresh_timer = QTimer(self)
+        self._status_refresh_timer.setSingleShot(True)
+        self._status_refresh_timer.setInterval(_STATUS_REFRESH_DELAY_MS)
+        self._status_refresh_timer.timeout.connect(self._start_status_scan)
+        # 最近一次目录扫描任务的信号对象，旧任务的结果会被忽略
+        self._status_scan_signals = None
+        # 带分隔符的保存路径前缀，随 save_path 一起更新
+        self._save_path_prefix = ""
     
         # 初始化FFmpeg路径
         self.ffmpeg_path = None
     
+    def _rebuild_tr_cache(self) -> None:
+        """重建翻译文本缓存（语言切换时调用）"""
+        self._tr_unknown = tr("main_window.unknown")
+        self._tr_downloaded = tr("main_window.downloaded")
+        self._tr_not_downloaded = tr("main_window.not_downloaded")
+        # 下载进度定时器和选择计数使用的文本
+        self._tr_download = tr("main_window.download")
+        self._tr_downloading = tr("main_window.downloading")
+        self._tr_completed = tr("main_window.completed")
+        self._tr_active = tr("main_window.active")
+        self._tr_files = tr("main_window.files")
+        self._tr_ready = tr("main_window.ready")
+        self._tr_selected_count = tr("main_window.selected_count")
+        self._tr_selected_count_total = tr("main_window.selected_count_total")
+        # 智能选择按钮文本
+        self._tr_select_all = tr("main_window.select_all")
+        self._tr_deselect_all = tr("main_window.deselect_all")
+        self._tr_invert_selection = tr("main_window.invert_selection")
+        self._window_title_base = f"{tr('app.title')}-v{Config.APP_VERSION}"
+
+    def _rebuild_icon_cache(self) -> None:
+        """重建标准图标缓存"""
+        style = self.style()
+        self._icon_play = style.standardIcon(style.SP_MediaPlay)
+        self._icon_volume = style.standardIcon(style.SP_MediaVolume)
+        self._icon_dir = style.standardIcon(style.SP_DirIcon)
+
     def _init_ffmpeg_path(self) -> None:
         """初始化FFmpeg路径"""
         try:
@@ -206,12 +776,23 @@ class VideoDownloaderMethods:
             logger.error(f"初始化FFmpeg路径失败: {e}")
             self.ffmpeg_path = None
     
-    def load_settings(self) -> None:
-        """加载保存的设置"""
-        self.save_path = self.settings.value("save_path", os.getcwd())
+    def _set_save_path(self, path: str) -> None:
+        """设置保存路径，并同步更新路径前缀缓存和界面显示"""
+        self.save_path = path
+        # 缓存带分隔符的路径前缀，逐项拼接文件路径时无需再调用 os.path.join
+        self._save_path_prefix = os.path.join(path, "")
+        self._existing_files = None
+        # 预先在后台查询新路径的可用空间，点击下载时无需同步等待
+        self._disk_space_cache = (0.0, path, None)
+        QThreadPool.globalInstance().start(self._refresh_disk_space_cache)
         # 如果 path_label 已存在，则更新其文本
         if hasattr(self, 'path_label'):
             self.path_label.setText(f"保存路径: {self.save_path}")
+
+    def load_settings(self) -> None:
+        """加载保存的设置"""
+        self._set_save_path(self.settings.value("save_path", os.getcwd()))
+        self._loaded_save_path = self.save_path
         
         # 初始化FFmpeg路径
         self._init_ffmpeg_path()
@@ -220,22 +801,19 @@ class VideoDownloaderMethods:
         """选择保存路径"""
         folder = QFileDialog.getExistingDirectory(self, tr("main_window.choose_save_path"), self.save_path)
         if folder:
-            self.save_path = folder
-            # 如果 path_label 已存在，则更新其文本
-            if hasattr(self, 'path_label'):
-                self.path_label.setText(f"保存路径: {self.save_path}")
+            self._set_save_path(folder)
 
     def validate_url(self, url: str) -> bool:
         """验证 URL 是否有效"""
         
         # 检查是否为网易云音乐链接
-        if NetEaseMusicManager().is_netease_music_url(url):
+        if self._netease_mgr.is_netease_music_url(url):
             return True
         
         
         
         # 检查是否为标准HTTP/HTTPS链接
-        return bool(re.match(r"^https?://.*", url))
+        return bool(_RE_HTTP_URL.match(url))
 
     def toggle_checkbox(self, item: QTreeWidgetItem, column: int) -> None:
         """双击切换复选框状态"""
@@ -247,51 +825,38 @@ class VideoDownloaderMethods:
     
     def select_all_formats(self) -> None:
         """全选所有格式"""
-        # 临时禁用信号以避免触发 on_item_changed
+        # 临时禁用信号以避免触发 on_item_changed，并暂停重绘，批量修改后统一刷新一次
+        self.format_tree.setUpdatesEnabled(False)
         self.format_tree.blockSignals(True)
         try:
+            # 分组节点带有 ItemIsAutoTristate，设置其状态时由Qt同步到所有子项；
+            # 没有子项的项目（网易云音乐等）直接设置
             for i in range(self.format_tree.topLevelItemCount()):
-                root_item = self.format_tree.topLevelItem(i)
-                if root_item.childCount() > 0:
-                    # 有子项的项目（视频等）
-                    for j in range(root_item.childCount()):
-                        child_item = root_item.child(j)
-                        child_item.setCheckState(0, Qt.Checked)  # 子项复选框在第0列
-                    # 设置父项状态
-                    root_item.setCheckState(0, Qt.Checked)
-                else:
-                    # 没有子项的项目（网易云音乐等）
-                    root_item.setCheckState(0, Qt.Checked)
+                self.format_tree.topLevelItem(i).setCheckState(0, Qt.Checked)
         finally:
             self.format_tree.blockSignals(False)
-        self.update_selection_count()
-        self.update_smart_select_button_text()
+            self.format_tree.setUpdatesEnabled(True)
+        self._apply_selection_count(self._sel_total, self._sel_total)
     
     def deselect_all_formats(self) -> None:
         """取消全选所有格式"""
-        # 临时禁用信号以避免触发 on_item_changed
+        # 临时禁用信号以避免触发 on_item_changed，并暂停重绘，批量修改后统一刷新一次
+        self.format_tree.setUpdatesEnabled(False)
         self.format_tree.blockSignals(True)
         try:
+            # 分组节点带有 ItemIsAutoTristate，设置其状态时由Qt同步到所有子项；
+            # 没有子项的项目（网易云音乐等）直接设置
             for i in range(self.format_tree.topLevelItemCount()):
-                root_item = self.format_tree.topLevelItem(i)
-                if root_item.childCount() > 0:
-                    # 有子项的项目（视频等）
-                    for j in range(root_item.childCount()):
-                        child_item = root_item.child(j)
-                        child_item.setCheckState(0, Qt.Unchecked)  # 子项复选框在第0列
-                    # 设置父项状态
-                    root_item.setCheckState(0, Qt.Unchecked)
-                else:
-                    # 没有子项的项目（网易云音乐等）
-                    root_item.setCheckState(0, Qt.Unchecked)
+                self.format_tree.topLevelItem(i).setCheckState(0, Qt.Unchecked)
         finally:
             self.format_tree.blockSignals(False)
-        self.update_selection_count()
-        self.update_smart_select_button_text()
+            self.format_tree.setUpdatesEnabled(True)
+        self._apply_selection_count(0, self._sel_total)
 
     def invert_selection(self) -> None:
         """反选所有格式"""
-        # 临时禁用信号以避免触发 on_item_changed
+        # 临时禁用信号以避免触发 on_item_changed，并暂停重绘，批量修改后统一刷新一次
+        self.format_tree.setUpdatesEnabled(False)
         self.format_tree.blockSignals(True)
         try:
             for i in range(self.format_tree.topLevelItemCount()):
@@ -303,9 +868,7 @@ class VideoDownloaderMethods:
                         current_state = child_item.checkState(0)
                         new_state = Qt.Checked if current_state == Qt.Unchecked else Qt.Unchecked
                         child_item.setCheckState(0, new_state)
-                    # 检查是否所有子项都被选中，更新父项状态
-                    all_checked = all(root_item.child(k).checkState(0) == Qt.Checked for k in range(root_item.childCount()))
-                    root_item.setCheckState(0, Qt.Checked if all_checked else Qt.Unchecked)
+                    # 父项状态由Qt根据子项自动计算，不能再设置父项，否则会覆盖所有子项
                 else:
                     # 没有子项的项目（网易云音乐等）
                     current_state = root_item.checkState(0)
@@ -313,24 +876,42 @@ class VideoDownloaderMethods:
                     root_item.setCheckState(0, new_state)
         finally:
             self.format_tree.blockSignals(False)
-        self.update_selection_count()
-        self.update_smart_select_button_text()
+            self.format_tree.setUpdatesEnabled(True)
+        self._apply_selection_count(self._sel_total - self._sel_selected, self._sel_total)
     
-    def update_selection_count(self) -> None:
-        """更新选择计数"""
+    def _count_selection(self) -> Tuple[int, int]:
+        """遍历一次格式树，统计选中数和可选总数并缓存"""
         selected_count = 0
-        for i in range(self.format_tree.topLevelItemCount()):
-            root_item = self.format_tree.topLevelItem(i)
-            if root_item.childCount() > 0:
+        total_count = 0
+        checked = Qt.Checked
+        tree = self.format_tree
+        for i in range(tree.topLevelItemCount()):
+            root_item = tree.topLevelItem(i)
+            child_count = root_item.childCount()
+            if child_count > 0:
                 # 统计子项的选择状态（复选框在第0列）
-                for j in range(root_item.childCount()):
-                    if root_item.child(j).checkState(0) == Qt.Checked:
+                total_count += child_count
+                for j in range(child_count):
+                    if root_item.child(j).checkState(0) == checked:
                         selected_count += 1
             else:
                 # 统计没有子项的项目（网易云音乐等）
-                if root_item.checkState(0) == Qt.Checked:
+                total_count += 1
+                if root_item.checkState(0) == checked:
                     selected_count += 1
-        self.selection_count_label.setText(tr("main_window.selected_count").format(count=selected_count))
+        self._sel_selected = selected_count
+        self._sel_total = total_count
+        return selected_count, total_count
+    
+    def update_selection_count(self) -> None:
+        """更新选择计数"""
+        self._apply_selection_count(*self._count_selection())
+    
+    def _apply_selection_count(self, selected_count: int, total_count: int) -> None:
+        """根据选中数更新计数标签、下载按钮、状态栏和智能选择按钮"""
+        self._sel_selected = selected_count
+        self._sel_total = total_count
+        self.selection_count_label.setText(self._tr_selected_count.format(count=selected_count))
         
         # 根据选择状态启用/禁用下载按钮
         self.smart_download_button.setEnabled(selected_count > 0)
@@ -338,10 +919,11 @@ class VideoDownloaderMethods:
         # 更新状态栏文件信息
         if self.formats:
             self.update_status_bar(
-                tr("main_window.ready"),
+                self._tr_ready,
                 "",
-                tr("main_window.selected_count_total").format(selected=selected_count, total=len(self.formats))
+                self._tr_selected_count_total.format(selected=selected_count, total=len(self.formats))
             )
+        self.update_smart_select_button_text()
 
     def smart_parse_action(self) -> None:
         """智能解析按钮动作 - 支持解析/取消解析切换"""
@@ -360,7 +942,8 @@ class VideoDownloaderMethods:
     
     def parse_video(self) -> None:
         """解析视频链接"""
-        urls = [url.strip() for url in self.url_input.toPlainText().split("\n") if url.strip()]
+        # 去除重复链接（保持原有顺序），避免重复创建解析线程
+        urls = list(dict.fromkeys(u.strip() for u in self.url_input.toPlainText().splitlines() if u.strip()))
         if not urls:
             QMessageBox.warning(self, tr("messages.tip"), tr("messages.please_input_url"))
             return
@@ -369,11 +952,13 @@ class VideoDownloaderMethods:
         playlist_urls = []
         single_video_urls = []
         netease_music_urls = []
+        is_netease = self._netease_mgr.is_netease_music_url
+        is_playlist = playlist_manager.is_playlist_url
         
         for url in urls:
-            if NetEaseMusicManager().is_netease_music_url(url):
+            if is_netease(url):
                 netease_music_urls.append(url)
-            elif playlist_manager.is_playlist_url(url):
+            elif is_playlist(url):
                 playlist_urls.append(url)
             else:
                 if not self.validate_url(url):
@@ -394,39 +979,90 @@ class VideoDownloaderMethods:
             self._handle_single_video_parsing(single_video_urls)
     
     def _handle_playlist_parsing(self, playlist_urls: List[str]) -> None:
-        """处理播放列表解析 - 改进版本，避免UI阻塞"""
+        """处理播放列表解析 - 逐个排队处理，网络请求在线程池中执行"""
+        queue = deque(playlist_urls)
+        # 总数随队列一起传递，多次解析同时进行时互不覆盖
+        total = len(playlist_urls)
+        QTimer.singleShot(0, lambda: self._process_next_playlist(queue, total))
+    
+    def _process_next_playlist(self, queue: deque, total: int) -> None:
+        """处理队列中的下一个播放列表"""
+        if not queue:
+            return
+        url = queue.popleft()
+        index = total - len(queue)
+        self.update_status_bar(f"正在处理播放列表 {index}/{total}", "", "")
+        
+        self._start_playlist_fetch(
+            url, playlist_manager.get_playlist_info,
+            lambda u, info: self._on_playlist_info_fetched(u, info, queue, total),
+            queue, total
+        )
+    
+    def _start_playlist_fetch(self, url: str, fetch, callback, queue: deque, total: int) -> None:
+        """在线程池中执行播放列表网络请求，完成或出错后在主线程回调"""
+        worker = PlaylistFetchWorker(url, fetch)
+        signals = worker.signals
+        
+        def on_finished(fetched_url, result):
+            self._playlist_fetch_signals.discard(signals)
+            callback(fetched_url, result)
+        
+        def on_error(fetched_url, error):
+            self._playlist_fetch_signals.discard(signals)
+            self._on_playlist_fetch_failed(fetched_url, error, queue, total)
+        
+        signals.finished.connect(on_finished)
+        signals.error.connect(on_error)
+        # 每个请求单独保持信号对象引用，防止在回调前被回收
+        self._playlist_fetch_signals.add(signals)
+        QThreadPool.globalInstance().start(worker)
+    
+    def _on_playlist_info_fetched(self, url: str, playlist_info, queue: deque, total: int) -> None:
+        """播放列表信息获取完成处理"""
         try:
-            for i, url in enumerate(playlist_urls):
-                # 更新状态，避免UI冻结
-                self.update_status_bar(f"正在处理播放列表 {i+1}/{len(playlist_urls)}", "", "")
-                QApplication.processEvents()  # 处理UI事件，避免阻塞
-                
-                # 获取播放列表信息
-                playlist_info = playlist_manager.get_playlist_info(url)
-                if not playlist_info:
-                    logger.error(f"无法获取播放列表信息: {url}")
-                    continue
-                
-                # 显示播放列表信息对话框
-                reply = self._show_playlist_info_dialog(playlist_info)
-                if reply == QMessageBox.Yes:
-                    # 获取播放列表中的视频URL
-                    video_urls = playlist_manager.get_playlist_video_urls(url)
-                    if video_urls:
-                        self._parse_video_urls(video_urls)
-                        
-                # 短暂延迟，让UI响应
-                time.sleep(0.1)
-                
-        except (ValueError, TypeError) as e:
-            logger.error(f"播放列表解析参数错误: {e}")
+            if not playlist_info:
+                logger.error(f"无法获取播放列表信息: {url}")
+            elif self._show_playlist_info_dialog(playlist_info) == QMessageBox.Yes:
+                # 获取播放列表中的视频URL
+                self._start_playlist_fetch(
+                    url, playlist_manager.get_playlist_video_urls,
+                    lambda u, video_urls: self._on_playlist_videos_fetched(u, video_urls, queue, total),
+                    queue, total
+                )
+                return
+        except Exception as e:
+            logger.error(f"处理播放列表解析失败: {e}")
+            QMessageBox.critical(self, tr("messages.error"), "播放列表解析失败：请稍后重试")
+        
+        QTimer.singleShot(0, lambda: self._process_next_playlist(queue, total))
+    
+    def _on_playlist_fetch_failed(self, url: str, error: Exception, queue: deque, total: int) -> None:
+        """播放列表网络请求出错处理（主线程）"""
+        if isinstance(error, (ValueError, TypeError)):
+            logger.error(f"播放列表解析参数错误: {error}")
             QMessageBox.critical(self, tr("messages.error"), "播放列表解析失败：请检查链接格式是否正确")
-        except (ConnectionError, TimeoutError) as e:
-            logger.error(f"播放列表解析网络错误: {e}")
+        elif isinstance(error, (ConnectionError, TimeoutError)):
+            logger.error(f"播放列表解析网络错误: {error}")
             QMessageBox.critical(self, tr("messages.error"), "播放列表解析失败：网络连接异常，请检查网络后重试")
+        else:
+            logger.error(f"处理播放列表解析失败: {url}: {error}")
+            QMessageBox.critical(self, tr("messages.error"), "播放列表解析失败：请稍后重试")
+        
+        QTimer.singleShot(0, lambda: self._process_next_playlist(queue, total))
+    
+    def _on_playlist_videos_fetched(self, url: str, video_urls, queue: deque, total: int) -> None:
+        """播放列表视频链接获取完成处理"""
+        try:
+            if video_urls:
+                self._parse_video_urls(video_urls)
+            else:
+                logger.error(f"播放列表中没有可解析的视频: {url}")
         except Exception as e:
             logger.error(f"处理播放列表解析失败: {e}")
             QMessageBox.critical(self, tr("messages.error"), "播放列表解析失败：请稍后重试")
+        
+        QTimer.singleShot(0, lambda: self._process_next_playlist(queue, total))
     
     def _show_playlist_info_dialog(self, playlist_info) -> int:
         """显示播放列表信息对话框"""
@@ -444,8 +1080,9 @@ class VideoDownloaderMethods:
     def _handle_netease_music_parsing(self, netease_music_urls: List[str]) -> None:
         """处理网易云音乐链接解析"""
         # 清空之前的结果
-        self.format_tree.clear()
+        self._clear_format_tree()
         self.formats = []
+        self._rebuild_format_indices()
         self.smart_download_button.setEnabled(False)
         self.smart_select_button.setEnabled(False)
         self.selection_count_label.setText(tr("main_window.selected_count").format(count=0))
@@ -459,8 +1096,7 @@ class VideoDownloaderMethods:
         self.smart_parse_button.setEnabled(True)
         
         self.netease_music_workers = []
-        self.total_urls = len(netease_music_urls)
-        self.parsed_count = 0
+        self._progress = ParseProgress(total=len(netease_music_urls))
         self.is_parsing = True  # 设置解析状态标志
         
         for url in netease_music_urls:
@@ -470,7 +1106,8 @@ class VideoDownloaderMethods:
             worker.log_signal.connect(self.update_scroll_status)
             worker.music_parsed_signal.connect(self.on_netease_music_parse_finished)
             worker.error_signal.connect(self.on_netease_music_parse_failed)
-            worker.finished_signal.connect(self.on_netease_music_parse_completed)
+            # 线程真正退出后再从列表移除并释放
+            worker.finished.connect(self._release_parse_worker)
             
             # 保存工作线程到列表中，防止被垃圾回收
             self.netease_music_workers.append(worker)
@@ -503,52 +1140,41 @@ class VideoDownloaderMethods:
             self.update_status_bar(status_msg, "", "")
             self.smart_select_button.setEnabled(True)
             
-            # 增加解析计数
-            self.parsed_count += 1
-            
-            # 检查是否所有解析都完成
-            if self.parsed_count >= self.total_urls:
-                self.finalize_netease_music_parse()
-            
         except Exception as e:
             logger.error(f"处理网易云音乐解析结果失败: {str(e)}")
             self.update_status_bar(f"处理网易云音乐失败: {str(e)}", "", "")
-            # 增加解析计数并检查完成状态
-            self.parsed_count += 1
-            if self.parsed_count >= self.total_urls:
-                self.finalize_netease_music_parse()
+        
+        # 无论成功与否都计入进度，避免遗漏完成处理
+        self._tick_netease_music_progress()
     
     def on_netease_music_parse_failed(self, error_msg: str) -> None:
         """网易云音乐解析失败处理"""
-        logger.error(f"网易云音乐解析失败: {error_msg}")
-        self.update_status_bar(f"网易云音乐解析失败: {error_msg}", "", "")
-        QMessageBox.warning(self, tr("messages.parse_failed"), tr("messages.netease_parse_failed"))
-        # 增加解析计数并检查完成状态
-        self.parsed_count += 1
-        if self.parsed_count >= self.total_urls:
-            self.finalize_netease_music_parse()
+        try:
+            logger.error(f"网易云音乐解析失败: {error_msg}")
+            self.update_status_bar(f"网易云音乐解析失败: {error_msg}", "", "")
+            QMessageBox.warning(self, tr("messages.parse_failed"), tr("messages.netease_parse_failed"))
+        finally:
+            self._tick_netease_music_progress()
     
-    def on_netease_music_parse_completed(self) -> None:
-        """网易云音乐解析完成（线程结束）"""
-        self._cleanup_netease_music_workers()
+    def _tick_netease_music_progress(self) -> None:
+        """更新网易云音乐解析进度，全部完成时收尾"""
+        if self._progress.tick():
+            self.finalize_netease_music_parse()
     
     def finalize_netease_music_parse(self) -> None:
         """完成网易云音乐解析"""
         try:
-            # 检查是否所有工作线程都已完成
-            if all(not w.isRunning() for w in self.netease_music_workers):
-                # 重置解析状态
-                self.is_parsing = False
-                self.smart_parse_button.setText(tr("main_window.parse"))
-                self.smart_parse_button.setEnabled(True)
-                
-                # 清理工作线程
-                self._cleanup_netease_music_workers()
-                
-                # 更新状态
-                self.update_status_bar(tr("messages.netease_parse_completed"), "", "")
-                logger.info("网易云音乐解析完成")
-                
+            # 重置解析状态
+            self.is_parsing = False
+            self.smart_parse_button.setText(tr("main_window.parse"))
+            self.smart_parse_button.setEnabled(True)
+            
+            # 工作线程由各自的线程退出信号释放，此时最后一个线程可能仍在运行
+            
+            # 更新状态
+            self.update_status_bar(tr("messages.netease_parse_completed"), "", "")
+            logger.info("网易云音乐解析完成")
+            
         except Exception as e:
             logger.error(f"完成网易云音乐解析失败: {str(e)}")
             self.update_status_bar(f"完成解析失败: {str(e)}", "", "")
@@ -567,9 +1193,9 @@ class VideoDownloaderMethods:
                 # 加载音乐封面图片
                 cover_url = music_info.get('cover_url', '')
                 if cover_url:
-                    self._load_thumbnail_sync(song_item, cover_url)
+                    self._load_thumbnail_async(song_item, cover_url, self._icon_volume)
                 else:
-                    song_item.setIcon(0, self.style().standardIcon(self.style().SP_MediaVolume))
+                    song_item.setIcon(0, self._icon_volume)
                 song_item.setText(1, f"{music_info['title']} - {music_info['artist']}")  # 文件名称（显示歌曲名称+歌手）
                 song_item.setText(2, format_info['ext'].upper())  # 文件类型
                 
@@ -581,7 +1207,7 @@ class VideoDownloaderMethods:
                     size_str = tr("main_window.unknown_size")
                 song_item.setText(3, size_str)  # 文件大小
                 
-                song_item.setText(4, tr("main_window.not_downloaded"))  # 状态
+                song_item.setText(4, self._tr_not_downloaded)  # 状态
                 song_item.setCheckState(0, Qt.Unchecked)
                 
                 # 保存格式信息
@@ -602,8 +1228,8 @@ class VideoDownloaderMethods:
                     'item': song_item
                 }
                 
-                self.formats.append(format_data)
-                logger.info(f"添加网易云音乐格式到UI: {music_info['title']} - {format_info['ext'].upper()}")
+                self._append_format(format_data)
+                logger.debug("添加网易云音乐格式到UI: %s - %s", music_info['title'], format_info['ext'])
             
         except Exception as e:
             logger.error(f"添加网易云音乐到UI失败: {str(e)}")
@@ -621,9 +1247,9 @@ class VideoDownloaderMethods:
                 # 加载音乐封面图片
                 cover_url = format_info.get('cover_url', '')
                 if cover_url:
-                    self._load_thumbnail_sync(song_item, cover_url)
+                    self._load_thumbnail_async(song_item, cover_url, self._icon_volume)
                 else:
-                    song_item.setIcon(0, self.style().standardIcon(self.style().SP_MediaVolume))
+                    song_item.setIcon(0, self._icon_volume)
                 song_item.setText(1, f"{format_info['song_title']} - {format_info['song_artist']}")  # 文件名称（显示歌曲名称+歌手）
                 song_item.setText(2, format_info['ext'].upper())  # 文件类型
                 
@@ -635,7 +1261,7 @@ class VideoDownloaderMethods:
                     size_str = tr("main_window.unknown_size")
                 song_item.setText(3, size_str)  # 文件大小
                 
-                song_item.setText(4, tr("main_window.not_downloaded"))  # 状态
+                song_item.setText(4, self._tr_not_downloaded)  # 状态
                 song_item.setCheckState(0, Qt.Unchecked)
                 
                 # 保存格式信息
@@ -658,8 +1284,8 @@ class VideoDownloaderMethods:
                     'item': song_item
                 }
                 
-                self.formats.append(format_data)
-                logger.info(f"添加网易云音乐格式到UI: {format_info['song_title']} - {format_info['ext'].upper()}")
+                self._append_format(format_data)
+                logger.debug("添加网易云音乐格式到UI: %s - %s", format_info['song_title'], format_info['ext'])
             
         except Exception as e:
             logger.error(f"添加网易云音乐歌单到UI失败: {str(e)}")
@@ -675,7 +1301,7 @@ class VideoDownloaderMethods:
     def _format_duration(self, duration_ms: int) -> str:
         """格式化时长（毫秒转分:秒）"""
         if not duration_ms:
-            return tr("main_window.unknown")
+            return self._tr_unknown
         
         seconds = duration_ms // 1000
         minutes = seconds // 60
@@ -687,20 +1313,6 @@ class VideoDownloaderMethods:
         # 使用共享的format_size函数
         return format_size(size_bytes)
     
-    def _cleanup_netease_music_workers(self) -> None:
-        """清理网易云音乐工作线程"""
-        try:
-            # 移除已完成的工作线程
-            self.netease_music_workers = [worker for worker in self.netease_music_workers if worker.isRunning()]
-            
-            # 如果没有正在运行的工作线程，重置解析状态
-            if not self.netease_music_workers and self.is_parsing:
-                self.is_parsing = False
-                self.smart_parse_button.setText(tr("main_window.parse"))
-                self.smart_parse_button.setEnabled(True)
-                
-        except Exception as e:
-            logger.error(f"清理网易云音乐工作线程失败: {str(e)}")
     
 
     
@@ -719,9 +1331,12 @@ class VideoDownloaderMethods:
     def _parse_video_urls(self, urls: List[str]) -> None:
         """解析视频URL列表"""
         # 清空之前的结果
-        self.format_tree.clear()
+        self._clear_format_tree()
         self.formats = []
+        self._rebuild_format_indices()
         self.parse_cache.clear()  # 清空解析缓存
+        self._existing_files = None  # 新的解析重新扫描保存目录
+        get_thumbnail_loader().clear_pending()
         self.smart_download_button.setEnabled(False)
         
         # 禁用选择按钮
@@ -738,9 +1353,10 @@ class VideoDownloaderMethods:
         self.smart_parse_button.setText(tr("main_window.pause"))
         self.smart_parse_button.setEnabled(True)
         
-        self.parse_workers = []
+        self.parse_workers = set()
         self.total_urls = len(urls)
         self.parsed_count = 0
+        self._active_parse_workers = 0
         self.is_parsing = True  # 添加解析状态标志
         
         for url in urls:
@@ -751,13 +1367,14 @@ class VideoDownloaderMethods:
             worker.video_parsed_signal.connect(self.on_video_parsed)  # 连接视频解析信号
             worker.finished.connect(self.on_parse_completed)  # 连接完成信号
             worker.error.connect(self.on_parse_error)
+            worker.thread_finished.connect(self._release_parse_worker)
             
             # 立即启动工作线程，避免延迟导致的UI阻塞感
             worker.start()
-            self.parse_workers.append(worker)
+            self.parse_workers.add(worker)
+            self._active_parse_workers += 1
             
             # 短暂延迟，避免同时启动过多线程
-            import time
             time.sleep(0.05)  # 50毫秒延迟
 
     def on_parse_progress(self, current_progress: int, total_count: int) -> None:
@@ -765,7 +1382,7 @@ class VideoDownloaderMethods:
         try:
             progress_text = f"解析进度: {current_progress}/{total_count}"
             self.update_status_bar(progress_text, "", "")
-            logger.debug(f"解析进度更新: {current_progress}/{total_count}")
+            logger.debug("解析进度更新: %s/%s", current_progress, total_count)
         except Exception as e:
             logger.error(f"处理解析进度失败: {str(e)}")
 
@@ -778,33 +1395,62 @@ class VideoDownloaderMethods:
             video_title = info.get("title", "未知标题")
             
             # 添加调试日志
-            logger.info(f"处理视频解析结果: {video_title}")
-            logger.info(f"  - Video ID: {video_id}")
-            logger.info(f"  - Webpage URL: {webpage_url}")
-            logger.info(f"  - Original URL: {url}")
+            logger.debug("处理视频解析结果: %s", video_title)
+            logger.debug("  - Video ID: %s", video_id)
+            logger.debug("  - Webpage URL: %s", webpage_url)
+            logger.debug("  - Original URL: %s", url)
             
             # 检查是否已经缓存过这个视频
-            if webpage_url in self.parse_cache:
-                logger.info(f"视频已存在缓存中，跳过重复处理: {video_title} (URL: {webpage_url})")
+            if not self._cache_parse_result(webpage_url, info):
+                logger.info("视频已存在缓存中，跳过重复处理: %s (URL: %s)", video_title, webpage_url)
                 return
-            
-            with self._cache_lock:
-                self.parse_cache[webpage_url] = info
-                if len(self.parse_cache) > Config.CACHE_LIMIT:
-                    self.parse_cache.popitem()
-                logger.info(f"视频已添加到缓存: {video_title}")
+            logger.debug("视频已添加到缓存: %s", video_title)
 
             # 立即处理并显示当前视频的解析结果
             self.on_parse_finished(info)
             
-            logger.info(f"视频解析完成: {video_title}")
+            logger.info("视频解析完成: %s", video_title)
             
         except Exception as e:
             logger.error(f"处理视频解析结果失败: {str(e)}")
             self.update_status_bar(f"解析失败: {str(e)}", "", "")
 
+    def _cache_parse_result(self, webpage_url: str, info: Dict) -> bool:
+        """按分段LRU策略缓存解析结果，已缓存时刷新其位置并返回False"""
+        # 无锁快速路径：成员检查只读取字典，在GIL下是原子操作
+        if webpage_url in self.parse_cache:
+            with self._cache_lock:
+                self.parse_cache.get(webpage_url)
+            return False
+        
+        with self._cache_lock:
+            # 检查与插入合并为一次操作，避免并发时重复插入；超出上限时只淘汰试用段
+            return self.parse_cache.add(webpage_url, info)
+
+    def _release_parse_worker(self) -> None:
+        """解析线程退出（run() 已返回）后从集合中移除并交给Qt释放"""
+        worker = self.sender()
+        if not isinstance(worker, QThread):
+            return
+        self.parse_workers.discard(worker)
+        self._retiring_parse_workers.discard(worker)
+        if worker in self.netease_music_workers:
+            self.netease_music_workers.remove(worker)
+        worker.deleteLater()
+
+    def _on_parse_worker_done(self) -> None:
+        """解析工作线程结束（完成或出错）时减少活动计数"""
+        with self._parse_lock:
+            if self._active_parse_workers > 0:
+                self._active_parse_workers -= 1
+
+    def _all_parse_workers_done(self) -> bool:
+        """所有视频解析工作线程是否都已结束"""
+        return self._active_parse_workers == 0
+
     def on_parse_completed(self, info: Dict) -> None:
         """处理解析完成"""
+        self._on_parse_worker_done()
         try:
             self.parsed_count += 1
             
@@ -813,7 +1459,7 @@ class VideoDownloaderMethods:
             self.update_status_bar(progress_text, "", "")
             
             # 如果所有视频都解析完成，执行最终处理
-            if self.parsed_count == self.total_urls and all(not w.isRunning() for w in self.parse_workers) and all(not w.isRunning() for w in self.netease_music_workers):
+            if self.parsed_count == self.total_urls and self._all_parse_workers_done():
                 try:
                     self.finalize_parse()
                 except Exception as e:
@@ -835,15 +1481,10 @@ class VideoDownloaderMethods:
             webpage_url = info.get("webpage_url", url)
             
             # 检查是否已经缓存过这个视频
-            if webpage_url in self.parse_cache:
-                logger.info(f"视频已存在，跳过重复处理: {video_id}")
+            if not self._cache_parse_result(webpage_url, info):
+                logger.info("视频已存在，跳过重复处理: %s", video_id)
                 self.parsed_count += 1
                 return
-            
-            with self._cache_lock:
-                self.parse_cache[webpage_url] = info
-                if len(self.parse_cache) > Config.CACHE_LIMIT:
-                    self.parse_cache.popitem()
 
             # 立即处理并显示当前视频的解析结果
             self.on_parse_finished(info)
@@ -855,7 +1496,7 @@ class VideoDownloaderMethods:
             self.update_status_bar(progress_text, "", "")
             
             # 如果所有视频都解析完成，执行最终处理
-            if self.parsed_count == self.total_urls and all(not w.isRunning() for w in self.parse_workers) and all(not w.isRunning() for w in self.netease_music_workers):
+            if self.parsed_count == self.total_urls and self._all_parse_workers_done():
                 try:
                     self.finalize_parse()
                 except Exception as e:
@@ -882,62 +1523,35 @@ class VideoDownloaderMethods:
             
             logger.info("所有视频和音乐解析完成")
             
-            # 统计解析结果 - 确保在所有视频都添加完成后统计
-            # 等待一小段时间确保UI更新完成
-            QApplication.processEvents()
-            
-            # 再次等待确保所有视频项都已添加到树形控件
-            time.sleep(0.3)  # 进一步增加等待时间
-            QApplication.processEvents()
+            # 更新分辨率分组的显示顺序（按分辨率从高到低）
+            self.sort_resolution_groups()
             
-            # 强制刷新树形控件
+            # 刷新树形控件，统计放到下一轮事件循环，确保所有视频项都已添加完成
             self.format_tree.update()
-            QApplication.processEvents()
-            
-            # 再次等待确保刷新完成
-            time.sleep(0.1)
-            QApplication.processEvents()
-            
-            # 直接统计树形控件中的项目
-            total_video_items = 0
-            resolution_groups = self.format_tree.topLevelItemCount()
-            
-            for i in range(resolution_groups):
-                root_item = self.format_tree.topLevelItem(i)
-                total_video_items += root_item.childCount()
-            
-            # 统计唯一视频和音乐文件数量
-            unique_video_count = 0
-            unique_music_count = 0
-            unique_filenames = set()
-            unique_music_names = set()
-            
-            for i in range(resolution_groups):
-                root_item = self.format_tree.topLevelItem(i)
-                for j in range(root_item.childCount()):
-                    child_item = root_item.child(j)
-                    filename = child_item.text(1)  # 文件名在第1列
-                    
-                    # 检查是否为音乐文件
-                    if "🎵" in root_item.text(0):  # 音乐文件在根节点有🎵标识
-                        unique_music_names.add(filename)
-                    else:
-                        base_filename = re.sub(r"_\d+$", "", filename)
-                        unique_filenames.add(base_filename)
-            
-            unique_video_count = len(unique_filenames)
-            unique_music_count = len(unique_music_names)
+            QTimer.singleShot(0, self._finalize_parse_stats)
+        else:
+            logger.warning("未找到任何可用格式")
+            self.update_status_bar("未找到可用格式", "", "")
+            self.status_scroll_label.setText(tr("main_window.parse_failed"))  # 清空滚动状态
+            QMessageBox.warning(self, tr("messages.tip"), tr("main_window.no_formats_found"))
+            self.reset_parse_state()
+
+    def _finalize_parse_stats(self) -> None:
+        """统计解析结果并显示完成提示"""
+        try:
+            # 单次遍历树形控件统计各项数量
+            resolution_groups, total_video_items, unique_video_count, unique_music_count = self._collect_tree_stats()
             total_formats = len(self.formats)
             
-            # 添加详细的调试日志
-            logger.info(f"=== 解析完成统计信息 ===")
-            logger.info(f"分辨率分类数量: {resolution_groups}")
-            logger.info(f"实际视频文件数量: {unique_video_count}")
-            logger.info(f"音乐文件数量: {unique_music_count}")
-            logger.info(f"视频项总数: {total_video_items}")
-            logger.info(f"可用格式数量: {total_formats}")
-            logger.info(f"self.formats 长度: {len(self.formats)}")
-            logger.info(f"=== 统计信息结束 ===")
+            # 添加详细的调试日志（仅在DEBUG级别下生成）
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("=== 解析完成统计信息 ===")
+                logger.debug("分辨率分类数量: %d", resolution_groups)
+                logger.debug("实际视频文件数量: %d", unique_video_count)
+                logger.debug("音乐文件数量: %d", unique_music_count)
+                logger.debug("视频项总数: %d", total_video_items)
+                logger.debug("可用格式数量: %d", total_formats)
+                logger.debug("=== 统计信息结束 ===")
             
             # 更新状态栏
             status_text = f"共找到 {total_formats} 个格式"
@@ -963,12 +1577,10 @@ class VideoDownloaderMethods:
             message += tr('main_window.please_select_formats')
             
             QMessageBox.information(self, tr('main_window.parse_completed'), message)
-        else:
-            logger.warning("未找到任何可用格式")
-            self.update_status_bar("未找到可用格式", "", "")
-            self.status_scroll_label.setText(tr("main_window.parse_failed"))  # 清空滚动状态
-            QMessageBox.warning(self, tr("messages.tip"), tr("main_window.no_formats_found"))
-        self.reset_parse_state()
+        except Exception as e:
+            logger.error(f"统计解析结果失败: {str(e)}")
+        finally:
+            self.reset_parse_state()
 
 
 
@@ -999,7 +1611,7 @@ class VideoDownloaderMethods:
         # 检查 format 字段
         format_str = f.get("format", "")
         if "x" in format_str:
-            match = re.search(r"(\d+)x(\d+)", format_str)
+            match = _RE_WXH.search(format_str)
             if match:
                 return self.standardize_resolution(f"{match.group(1)}x{match.group(2)}")
                 
@@ -1008,49 +1620,13 @@ class VideoDownloaderMethods:
             return "audio only"
             
         # 如果都找不到，返回未知
-        return tr("main_window.unknown")
+        return self._tr_unknown
 
     def standardize_resolution(self, resolution: str) -> str:
         """标准化分辨率到主流分辨率"""
         if resolution is None or not resolution or "x" not in str(resolution):
             return resolution or "unknown"
-            
-        try:
-            width, height = resolution.split("x")
-            width, height = int(width), int(height)
-            
-            # 1080P 变体 → 1920x1080 或 1440x1080
-            if abs(height - 1080) <= 4:
-                if abs(width - 1920) <= 4:
-                    return "1920x1080"
-                elif abs(width - 1440) <= 4:
-                    return "1440x1080"
-            # 720P 变体 → 1280x720 或 960x720
-            elif abs(height - 720) <= 4:
-                if abs(width - 1280) <= 4:
-                    return "1280x720"
-                elif abs(width - 960) <= 4:
-                    return "960x720"
-            # 480P 变体 → 852x480 或 640x480
-            elif abs(height - 480) <= 4:
-                if abs(width - 852) <= 4:
-                    return "852x480"
-                elif abs(width - 640) <= 4:
-                    return "640x480"
-            # 360P 变体 → 640x360 或 480x360
-            elif abs(height - 360) <= 4:
-                if abs(width - 640) <= 4:
-                    return "640x360"
-                elif abs(width - 480) <= 4:
-                    return "480x360"
-            # 240P 变体 → 426x240
-            elif abs(height - 240) <= 4:
-                if abs(width - 426) <= 4:
-                    return "426x240"
-            else:
-                return resolution
-        except (ValueError, IndexError):
-            return resolution
+        return _standardize_resolution(resolution)
 
     def on_parse_finished(
         self,
@@ -1060,51 +1636,25 @@ class VideoDownloaderMethods:
         video_title = info.get("title", "未知标题")
         video_id = info.get("id", "unknown")
         
-        # 检查是否已经添加过这个视频
-        if self._is_video_already_added(video_id, video_title):
-            logger.info(f"视频已存在，跳过重复添加: {video_title} (ID: {video_id})")
+        # 检查是否已经添加过这个视频（多P视频按P数区分）
+        part_match = _RE_PART_NUMBER.search(video_title)
+        video_key = (video_id if video_id != "unknown" else video_title, part_match.group(1) if part_match else None)
+        if video_key in self._processed_video_ids:
+            logger.info("视频已存在，跳过重复添加: %s (ID: %s)", video_title, video_id)
             return
         
-        logger.info(f"开始处理视频: {video_title} (ID: {video_id})")
-        
-        # 强制添加调试信息
-        logger.info(f"🔍 强制调试信息:")
-        logger.info(f"  - 视频标题: {video_title}")
-        logger.info(f"  - 视频ID: {video_id}")
-        logger.info(f"  - 网页URL: {info.get('webpage_url', '未知')}")
-        logger.info(f"  - 格式数量: {len(info.get('formats', []))}")
-            
-        audio_format = None
-        audio_filesize = 0
-        video_formats: Dict[str, Dict] = {}
-
-        # 处理视频标题格式 - 优化合集视频处理
-        # 检查是否为合集视频的一部分
-        if "p" in video_title.lower() and re.search(r"p\d+", video_title):
-            # 合集视频，提取部分标题
-            match = re.search(r"p\d+\s*(.+?)(?:_\w+)?$", video_title)
-            if match:
-                part_title = match.group(1).strip()
-                formatted_title = part_title
-            else:
-                # 如果无法提取部分标题，使用完整标题
-                formatted_title = video_title
-        else:
-            # 单个视频，使用完整标题
-            formatted_title = video_title
-            if f"_{video_id}" in formatted_title:
-                formatted_title = formatted_title.replace(f"_{video_id}", "")
+        logger.debug("开始处理视频: %s (ID: %s)", video_title, video_id)
+        self._processed_video_ids.add(video_key)
         
-        # 确保标题不为空
-        if not formatted_title.strip():
-            formatted_title = f"视频_{video_id}"
+        # 调试信息（仅在DEBUG级别下生成）
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("🔍 调试信息:")
+            logger.debug("  - 视频标题: %s", video_title)
+            logger.debug("  - 视频ID: %s", video_id)
+            logger.debug("  - 网页URL: %s", info.get('webpage_url', '未知'))
+            logger.debug("  - 格式数量: %d", len(info.get('formats', [])))
         
-        # 不再添加方括号包装
-        # if not formatted_title.startswith("["):
-        #     formatted_title = f"[{formatted_title}]"
-
-        # 不再创建视频根节点，直接使用分辨率分组
-        video_root = None
+        formatted_title = self._format_video_title(video_title, video_id)
 
         formats = info.get("formats", [])
         logger.info(f"解析条目 '{video_title}'，共有 {len(formats)} 个格式")
@@ -1113,55 +1663,7 @@ class VideoDownloaderMethods:
         filtered_formats = filter_formats(formats, strict_filter=False)
         logger.info(f"过滤后剩余 {len(filtered_formats)} 个格式")
 
-
-        # 处理格式信息
-        valid_format_count = 0
-        for f in filtered_formats:
-            format_id = f.get("format_id")
-            resolution = self.get_resolution(f)
-            ext = f.get("ext", "")
-            acodec = f.get("acodec", "none")
-            filesize = f.get("filesize") or f.get("filesize_approx")
-            vbr = f.get("vbr", 0)
-            vcodec = f.get("vcodec", "none")
-            
-            # 调试信息：记录每个格式的详细信息
-            logger.info(f"格式 {format_id}: resolution={resolution}, ext={ext}, acodec={acodec}, vbr={vbr}, filesize={filesize}, vcodec={vcodec}, width={f.get('width')}, height={f.get('height')}, format_note={f.get('format_note')}")
-
-            # 计算文件大小
-            if not filesize:
-                duration = info.get("duration", 0)
-                abr = f.get("abr", 0)
-                total_br = (abr or 0) + (vbr or 0)
-                if duration and total_br:
-                    filesize = (total_br * duration * 1000) / 8
-
-            # 查找最佳音频格式
-            if "audio only" in f.get("format", "") and ext in ["m4a", "mp3"] and not audio_format:
-                audio_format = format_id
-                audio_filesize = filesize if filesize else 0
-                
-            # 收集视频格式 - 每个分辨率只保留最优格式
-            elif resolution != tr("main_window.unknown") and vcodec != "none":
-                # 跳过Premium格式和其他可能不可用的格式
-                format_note = f.get("format_note", "").lower()
-                if "premium" in format_note or "membership" in format_note or "paid" in format_note:
-                    logger.info(f"跳过Premium格式 {format_id}: {format_note}")
-                    continue
-                
-                # 为每个分辨率只保留最优格式（按文件大小排序）
-                if resolution not in video_formats or filesize > video_formats[resolution].get("filesize", 0):
-                    video_formats[resolution] = {
-                        "format_id": format_id,
-                        "ext": ext,
-                        "filesize": filesize if filesize else 0,
-                        "vcodec": vcodec
-                    }
-                    valid_format_count += 1
-                    logger.info(f"✅ 更新最优视频格式: {resolution} -> {format_id} (大小: {filesize})")
-            else:
-                logger.info(f"❌ 跳过格式 {format_id}: resolution={resolution}, vbr={vbr}, vcodec={vcodec}")
-        
+        audio_format, audio_filesize, video_formats, valid_format_count = self._pick_best_formats(info, filtered_formats)
         logger.info(f"📊 视频 '{formatted_title}' 有效格式统计: {valid_format_count} 个有效格式")
 
         # 检查是否有有效格式
@@ -1171,234 +1673,315 @@ class VideoDownloaderMethods:
             return
         
         # 创建分辨率分组和视频项
-        logger.info(f"视频 '{formatted_title}' 将被添加到以下分辨率: {list(video_formats.keys())}")
+        logger.debug("视频 '%s' 将被添加到以下分辨率: %s", formatted_title, list(video_formats))
         
         # 在状态栏显示解析完成信息
         self.update_scroll_status(f"✅ 解析完成: {formatted_title}")
         
-        # 统计每个分辨率分类下的视频数量
-        resolution_counts = {}
-        for i in range(self.format_tree.topLevelItemCount()):
-            item = self.format_tree.topLevelItem(i)
-            res_name = item.text(0)  # 分辨率名称在第0列
-            resolution_counts[res_name] = item.childCount()
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("现有分辨率分组: %s", list(self._res_group_index))
         
-        logger.info(f"现有分辨率分组: {list(resolution_counts.keys())}")
-        
-
-        
-        # 安全地排序分辨率，处理None值
-        def safe_resolution_sort_key(item):
-            res = item[0]
-            if res is None or res == "None":
-                return -1  # None值排在最后
-            if "x" in str(res):
-                try:
-                    width, height = str(res).split("x")
-                    return int(height)
-                except (ValueError, IndexError):
-                    return 0
-            return 0
-        
-        for res, v_format in sorted(video_formats.items(), key=safe_resolution_sort_key, reverse=True):
-            # 查找或创建分辨率分组（直接作为根节点）
-            res_group = None
-            for i in range(self.format_tree.topLevelItemCount()):
-                if str(self.format_tree.topLevelItem(i).text(0)) == str(res):  # 分辨率名称在第0列
-                    res_group = self.format_tree.topLevelItem(i)
-                    logger.info(f"找到现有分辨率分组: {str(res) if res is not None else 'unknown'}")
-                    break
-            if not res_group:
-                res_group = QTreeWidgetItem(self.format_tree)
-                res_group.setFlags(Qt.ItemIsEnabled | Qt.ItemIsUserCheckable)  # 分辨率节点可选择
-                res_group.setCheckState(0, Qt.Unchecked)  # 复选框在第0列
-                res_group.setText(0, str(res) if res is not None else "unknown")  # 分辨率名称在第0列
-                res_group.setIcon(0, self.style().standardIcon(self.style().SP_DirIcon))  # 添加文件夹图标
-                res_group.setExpanded(True)
-                logger.info(f"创建新的分辨率分组: {str(res) if res is not None else 'unknown'}")
-                # 在状态栏显示创建新分辨率分组的信息
-                self.update_scroll_status(f"📁 创建新分辨率分组: {str(res) if res is not None else 'unknown'}")
-
-            # 为每个分辨率创建最优视频项
-            # 在文件名中添加分辨率和编码信息
-            base_filename = sanitize_filename(formatted_title, self.save_path)
-            vcodec_short = v_format.get("vcodec", "unknown").split(".")[0]  # 提取编码类型
-            filename = f"{base_filename}_{str(res) if res is not None else 'unknown'}_{vcodec_short}"
-            
-            # 确保在同一分辨率分组内文件名唯一
-            filename = self.ensure_unique_filename(res_group, filename)
-            
-            video_item = QTreeWidgetItem(res_group)
-            
-            # 计算总大小（视频+音频）
-            total_size = v_format["filesize"]
-            if audio_format:
-                total_size += audio_filesize
-                
-            # 添加视频项到树形控件
-            thumbnail_url = info.get("thumbnail", "")
-            self._add_tree_item(video_item, filename, "mp4", str(res) if res is not None else "unknown", total_size, thumbnail_url)
-            
-            logger.info(f"添加最优视频项到分辨率 {str(res) if res is not None else 'unknown'} ({vcodec_short}): {filename}")
-            # 在状态栏显示添加视频项的信息
-            self.update_scroll_status(f"📹 添加视频到 {str(res) if res is not None else 'unknown'}: {filename}")
-            
-            # 添加到格式列表
-            format_id = v_format["format_id"]
-            if audio_format:
-                format_id = f"{format_id}+{audio_format}"
-                
-            format_info = {
-                "video_id": video_id,
-                "format_id": format_id,
-                "description": f"{str(res) if res is not None else 'unknown'} MP4",  # 与树形控件显示保持一致
-                "resolution": str(res) if res is not None else "unknown",
-                "ext": "mp4",
-                "type": "video_audio",
-                "filesize": total_size,
-                "url": info.get("webpage_url", ""),
-                "item": video_item
-            }
-            self.formats.append(format_info)
-            logger.info(f"添加格式到列表: {format_info['description']} (URL: {format_info['url']})")
+        self._emit_tree_items(formatted_title, video_id, video_formats, audio_format, audio_filesize, info)
         
         # 记录当前分辨率分类的统计信息
-        current_counts = {}
-        for i in range(self.format_tree.topLevelItemCount()):
-            item = self.format_tree.topLevelItem(i)
-            res_name = item.text(0)  # 分辨率名称在第0列
-            current_counts[res_name] = item.childCount()
-            logger.info(f"分辨率分组 '{res_name}' 包含 {item.childCount()} 个视频")
+        debug_enabled = logger.isEnabledFor(logging.DEBUG)
+        tree = self.format_tree
+        group_count = tree.topLevelItemCount()
+        total_videos = 0
+        for i in range(group_count):
+            item = tree.topLevelItem(i)
+            child_count = item.childCount()
+            total_videos += child_count
             
             # 调试：列出该分辨率分组下的所有视频
-            for j in range(item.childCount()):
-                child_item = item.child(j)
-                child_name = child_item.text(0)
-                logger.info(f"  - 视频: {child_name}")
-        
-        logger.info(f"当前分辨率分类统计: {current_counts}")
+            if debug_enabled:
+                logger.debug("分辨率分组 '%s' 包含 %d 个视频", item.text(0), child_count)
+                for j in range(child_count):
+                    logger.debug("  - 视频: %s", item.child(j).text(0))
         
         # 在状态栏显示统计信息
-        total_videos = sum(current_counts.values())
-        self.update_scroll_status(f"📊 当前共有 {len(current_counts)} 个分辨率分组，{total_videos} 个视频")
+        self.update_scroll_status(f"📊 当前共有 {group_count} 个分辨率分组，{total_videos} 个视频")
         
         # 实时更新UI - 每个视频解析完成后立即启用选择按钮
         if self.formats:
             self.smart_select_button.setEnabled(True)
             self.update_selection_count()
-            
-        # 更新分辨率分组的显示顺序（按分辨率从高到低）
-        self.sort_resolution_groups()
 
-    def count_total_video_items(self) -> int:
-        """统计树形控件中总的视频项数量"""
-        total_count = 0
-        resolution_details = {}
+    def _format_video_title(self, video_title: str, video_id: str) -> str:
+        """处理视频标题格式 - 优化合集视频处理"""
+        # 检查是否为合集视频的一部分
+        if _RE_PART_MARKER.search(video_title):
+            # 合集视频，提取部分标题，无法提取时使用完整标题
+            match = _RE_PART_TITLE.search(video_title)
+            formatted_title = match.group(1).strip() if match else video_title
+        else:
+            # 单个视频，使用完整标题
+            formatted_title = video_title.replace(f"_{video_id}", "")
         
-        logger.info(f"开始统计总视频项数量，树形控件顶级项目数量: {self.format_tree.topLevelItemCount()}")
+        # 确保标题不为空
+        if not formatted_title.strip():
+            formatted_title = f"视频_{video_id}"
+        return formatted_title
+
+    def _pick_best_formats(self, info: Dict, filtered_formats: List[Dict]) -> Tuple[Optional[str], float, Dict[str, Dict], int]:
+        """挑选最佳音频格式和每个分辨率的最优视频格式，返回 (音频格式ID, 音频大小, 视频格式, 有效视频格式数)"""
+        audio_format = None
+        audio_filesize = 0
+        video_formats: Dict[str, Dict] = {}
         
-        for i in range(self.format_tree.topLevelItemCount()):
-            root_item = self.format_tree.topLevelItem(i)
-            resolution = root_item.text(0)
-            child_count = root_item.childCount()
-            total_count += child_count
-            resolution_details[resolution] = child_count
-            logger.info(f"分辨率分组 {i}: {resolution} -> {child_count} 个子项")
+        valid_format_count = 0
+        candidates: Dict[str, List[Tuple[float, str, str, str]]] = defaultdict(list)
+        unknown_resolution = self._tr_unknown
+        duration = info.get("duration", 0)
+        
+        def estimate_filesize(g, vbr) -> float:
+            """根据码率和时长估算文件大小"""
+            filesize = g("filesize") or g("filesize_approx")
+            if not filesize:
+                total_br = (g("abr", 0) or 0) + (vbr or 0)
+                if duration and total_br:
+                    filesize = (total_br * duration * 1000) / 8
+            return filesize or 0
+        
+        for f in filtered_formats:
+            g = f.get
+            format_id = g("format_id")
+            ext = g("ext", "")
+            vcodec = g("vcodec", "none")
+            vbr = g("vbr", 0)
+            
+            # 纯音频格式：只需查找最佳音频格式，无需解析分辨率
+            if vcodec == "none":
+                if not audio_format and g("acodec", "none") != "none" and ext in ("m4a", "mp3"):
+                    audio_format = format_id
+                    audio_filesize = estimate_filesize(g, vbr)
+                continue
+            
+            # 跳过Premium格式和其他可能不可用的格式
+            format_note = (g("format_note") or "").lower()
+            if "premium" in format_note or "membership" in format_note or "paid" in format_note:
+                logger.debug("跳过Premium格式 %s: %s", format_id, format_note)
+                continue
             
-        # 记录详细的统计信息
-        logger.info(f"视频项统计详情: {resolution_details}")
-        logger.info(f"总视频项数量: {total_count}")
+            resolution = self.get_resolution(f)
+            if resolution == unknown_resolution:
+                logger.debug("❌ 跳过格式 %s: resolution=%s, vbr=%s, vcodec=%s", format_id, resolution, vbr, vcodec)
+                continue
+            
+            # 收集视频格式，按分辨率分组，循环结束后统一挑选
+            candidates[resolution].append((estimate_filesize(g, vbr), format_id, ext, vcodec))
+            valid_format_count += 1
+        
+        # 每个分辨率只保留最优格式（文件最大者，相同大小时保留先出现的）
+        for resolution, bucket in candidates.items():
+            filesize, format_id, ext, vcodec = max(bucket, key=itemgetter(0))
+            video_formats[resolution] = {
+                "format_id": format_id,
+                "ext": ext,
+                "filesize": filesize,
+                "vcodec": vcodec
+            }
+            logger.debug("✅ 最优视频格式: %s -> %s (大小: %s)", resolution, format_id, filesize)
         
-        return total_count
+        return audio_format, audio_filesize, video_formats, valid_format_count
 
-    def count_unique_videos(self) -> int:
-        """统计实际的视频文件数量（去重）"""
-        unique_videos = set()
-        all_filenames = []
+    def _emit_tree_items(
+        self,
+        formatted_title: str,
+        video_id: str,
+        video_formats: Dict[str, Dict],
+        audio_format: Optional[str],
+        audio_filesize: float,
+        info: Dict
+    ) -> None:
+        """将视频的各分辨率最优格式添加到格式树和格式列表"""
+        # 与分辨率无关的值只计算一次
+        base_filename_root = sanitize_filename(formatted_title, self.save_path)
+        thumbnail_url = info.get("thumbnail", "")
+        webpage_url = info.get("webpage_url", "")
+        
+        # 批量插入期间暂停重绘和信号，结束后统一刷新
+        tree = self.format_tree
+        tree.setUpdatesEnabled(False)
+        prev_blocked = tree.blockSignals(True)
+        try:
+            for res, v_format in sorted(video_formats.items(), key=lambda item: _resolution_sort_key(item[0]), reverse=True):
+                # 查找或创建分辨率分组（直接作为根节点）
+                res_str = str(res) if res is not None else "unknown"
+                res_group = self._res_group_index.get(res_str)
+                if not res_group:
+                    res_group = QTreeWidgetItem(self.format_tree)
+                    # 分辨率节点可选择，父子复选状态由Qt自动同步
+                    res_group.setFlags(Qt.ItemIsEnabled | Qt.ItemIsUserCheckable | Qt.ItemIsAutoTristate)
+                    res_group.setCheckState(0, Qt.Unchecked)  # 复选框在第0列
+                    res_group.setText(0, res_str)  # 分辨率名称在第0列
+                    res_group.setIcon(0, self._icon_dir)  # 添加文件夹图标
+                    res_group.setExpanded(True)
+                    self._res_group_index[res_str] = res_group
+                    logger.debug("创建新的分辨率分组: %s", res_str)
+                    # 在状态栏显示创建新分辨率分组的信息
+                    self.update_scroll_status(f"📁 创建新分辨率分组: {res_str}")
+
+                # 为每个分辨率创建最优视频项
+                # 在文件名中添加分辨率和编码信息
+                vcodec_short = v_format.get("vcodec", "unknown").split(".")[0]  # 提取编码类型
+                filename = f"{base_filename_root}_{res_str}_{vcodec_short}"
+                
+                # 确保在同一分辨率分组内文件名唯一
+                filename = self.ensure_unique_filename(res_group, filename)
+                
+                video_item = QTreeWidgetItem(res_group)
+                
+                # 计算总大小（视频+音频）
+                total_size = v_format["filesize"]
+                if audio_format:
+                    total_size += audio_filesize
+                
+                # 添加视频项到树形控件
+                self._add_tree_item(video_item, filename, "mp4", res_str, total_size, thumbnail_url)
+                
+                logger.debug("添加最优视频项到分辨率 %s (%s): %s", res_str, vcodec_short, filename)
+                # 在状态栏显示添加视频项的信息
+                self.update_scroll_status(f"📹 添加视频到 {res_str}: {filename}")
+                
+                # 添加到格式列表
+                format_id = v_format["format_id"]
+                if audio_format:
+                    format_id = f"{format_id}+{audio_format}"
+                
+                format_info = {
+                    "video_id": video_id,
+                    "format_id": format_id,
+                    "description": f"{res_str} MP4",  # 与树形控件显示保持一致
+                    "resolution": res_str,
+                    "ext": "mp4",
+                    "type": "video_audio",
+                    "filesize": total_size,
+                    "url": webpage_url,
+                    "item": video_item
+                }
+                self._append_format(format_info)
+                logger.debug("添加格式到列表: %s (URL: %s)", format_info['description'], format_info['url'])
         
-        logger.info(f"开始统计唯一视频文件，树形控件顶级项目数量: {self.format_tree.topLevelItemCount()}")
+        finally:
+            tree.blockSignals(prev_blocked)
+            tree.setUpdatesEnabled(True)
+
+    def _collect_tree_stats(self) -> Tuple[int, int, int, int]:
+        """单次遍历树形控件，返回 (分辨率分组数, 视频项总数, 唯一视频数, 唯一音乐数)"""
+        tree = self.format_tree
+        top = tree.topLevelItem
+        groups = tree.topLevelItemCount()
+        total = 0
+        unique_videos = set()
+        unique_music = set()
+        strip_suffix = _RE_TRAIL_NUM.sub
+        
+        for i in range(groups):
+            root_item = top(i)
+            is_music = "🎵" in root_item.text(0)  # 音乐文件在根节点有🎵标识
+            child = root_item.child
+            n = root_item.childCount()
+            total += n
+            if is_music:
+                add = unique_music.add
+                for j in range(n):
+                    add(child(j).text(1))  # 文件名在第1列
+            else:
+                add = unique_videos.add
+                for j in range(n):
+                    # 移除数字后缀以获取原始文件名
+                    add(strip_suffix("", child(j).text(1)))
         
-        for i in range(self.format_tree.topLevelItemCount()):
-            root_item = self.format_tree.topLevelItem(i)
-            resolution = root_item.text(0)
-            child_count = root_item.childCount()
-            logger.info(f"检查分辨率分组: {resolution}, 子项数量: {child_count}")
-            
-            for j in range(child_count):
-                child_item = root_item.child(j)
-                # 获取文件名（去掉可能的数字后缀）
-                filename = child_item.text(1)  # 文件名在第1列
-                all_filenames.append(filename)
-                # 移除数字后缀以获取原始文件名
-                base_filename = re.sub(r"_\d+$", "", filename)
-                unique_videos.add(base_filename)
-                logger.info(f"  子项 {j}: {filename} -> {base_filename}")
-        
-        logger.info(f"所有文件名: {all_filenames}")
-        logger.info(f"去重后的文件名: {sorted(list(unique_videos))}")
-        logger.info(f"实际视频文件数量（去重）: {len(unique_videos)}")
-        return len(unique_videos)
+        return groups, total, len(unique_videos), len(unique_music)
+
+    def count_total_video_items(self) -> int:
+        """统计树形控件中总的视频项数量"""
+        return self._collect_tree_stats()[1]
+
+    def count_unique_videos(self) -> int:
+        """统计实际的视频文件数量（去重）"""
+        _, _, unique_video_count, unique_music_count = self._collect_tree_stats()
+        return unique_video_count + unique_music_count
 
     def sort_resolution_groups(self) -> None:
         """按分辨率从高到低排序分辨率分组"""
         try:
-            # 获取所有分辨率分组
-            groups = []
-            for i in range(self.format_tree.topLevelItemCount()):
-                item = self.format_tree.topLevelItem(i)
-                resolution = item.text(0)
-                groups.append((resolution, item))
-            
-            # 按分辨率排序（从高到低）
-            def resolution_sort_key(res_text):
-                # 处理None值
-                if res_text is None or res_text == "None":
-                    return -1  # None值排在最后
-                
-                if "x" in str(res_text):
-                    try:
-                        width, height = str(res_text).split("x")
-                        return int(height)  # 按高度排序
-                    except (ValueError, IndexError):
-                        return 0
-                return 0
-            
-            groups.sort(key=lambda x: resolution_sort_key(x[0]), reverse=True)
-            
-            # 重新排列树形控件项
-            for i, (resolution, item) in enumerate(groups):
-                # 将项目移动到正确的位置
-                self.format_tree.takeTopLevelItem(self.format_tree.indexOfTopLevelItem(item))
-                self.format_tree.insertTopLevelItem(i, item)
+            tree = self.format_tree
+            tree.setUpdatesEnabled(False)
+            try:
+                # 一次性取出所有分组，排序后批量插回
+                # 取出后的项不再属于树，isExpanded() 总是False，必须先记录展开状态
+                count = tree.topLevelItemCount()
+                expanded = [tree.topLevelItem(i).isExpanded() for i in range(count)]
+                groups = [tree.takeTopLevelItem(0) for _ in range(count)]
+                order = sorted(range(len(groups)), key=lambda i: _resolution_sort_key(groups[i].text(0)), reverse=True)
+                sorted_groups = [groups[i] for i in order]
+                tree.insertTopLevelItems(0, sorted_groups)
+                # 重新插入后恢复展开状态
+                for i in order:
+                    groups[i].setExpanded(expanded[i])
+            finally:
+                tree.setUpdatesEnabled(True)
                 
-            logger.info(f"分辨率分组已排序: {[g[0] for g in groups]}")
+            logger.info(f"分辨率分组已排序: {[item.text(0) for item in sorted_groups]}")
         except Exception as e:
             logger.error(f"排序分辨率分组失败: {str(e)}")
 
+    def _append_format(self, format_info: Dict) -> None:
+        """添加格式信息并登记其树形控件项，便于按项快速查找"""
+        self.formats.append(format_info)
+        item = format_info.get("item")
+        if item is not None:
+            self._item_to_format[id(item)] = format_info
+        self._index_format(format_info)
+
+    def _index_format(self, format_info: Dict) -> None:
+        """按描述和下载地址登记格式信息"""
+        description = format_info.get("description")
+        if description:
+            self._formats_by_desc.setdefault(description, format_info)
+        url = format_info.get("url")
+        if url:
+            self._formats_by_url.setdefault(url, format_info)
+
+    def _rebuild_format_indices(self) -> None:
+        """self.formats 被整体替换、裁剪或清空后重建查找索引"""
+        self._formats_by_desc.clear()
+        self._formats_by_url.clear()
+        # 树形控件项 -> 格式信息也只保留仍在列表中的格式，避免引用已丢弃的格式
+        self._item_to_format.clear()
+        for format_info in self.formats:
+            item = format_info.get("item")
+            if item is not None:
+                self._item_to_format[id(item)] = format_info
+            self._index_format(format_info)
+
+    def _clear_format_tree(self) -> None:
+        """清空格式树及其分组索引"""
+        self.format_tree.clear()
+        self._res_group_index.clear()
+        self._name_counts.clear()
+        self._assigned_names.clear()
+        self._processed_video_ids.clear()
+        self._item_to_format.clear()
+        self._sel_selected = 0
+        self._sel_total = 0
+
     def ensure_unique_filename(self, parent_item: QTreeWidgetItem, base_filename: str) -> str:
         """确保在同一分辨率分组内文件名唯一"""
-        try:
-            # 获取同一分组下所有现有文件名
-            existing_filenames = set()
-            for i in range(parent_item.childCount()):
-                child = parent_item.child(i)
-                existing_filename = child.text(1)  # 文件名在第1列
-                existing_filenames.add(existing_filename)
-            
-            # 如果文件名已存在，添加数字后缀
-            filename = base_filename
-            counter = 1
-            while filename in existing_filenames:
-                # 移除可能的现有后缀
-                if re.search(r"_\d+$", filename):
-                    filename = re.sub(r"_\d+$", "", filename)
-                filename = f"{filename}_{counter}"
-                counter += 1
-            
-            return filename
-        except Exception as e:
-            logger.error(f"确保文件名唯一失败: {str(e)}")
-            return base_filename
+        # 按分组计数，重复的文件名依次添加 _1、_2 ... 后缀
+        # 带后缀的名称可能与本身以 _N 结尾的标题相同，需跳过已分配的名称
+        assigned = self._assigned_names[id(parent_item)]
+        key = (id(parent_item), base_filename)
+        n = self._name_counts[key]
+        filename = base_filename if n == 0 else f"{base_filename}_{n}"
+        while filename in assigned:
+            n += 1
+            filename = f"{base_filename}_{n}"
+        self._name_counts[key] = n + 1
+        assigned.add(filename)
+        return filename
 
     def _add_tree_item(
         self,
@@ -1410,16 +1993,15 @@ class VideoDownloaderMethods:
         thumbnail_url: str = None
     ) -> None:
         """添加树形控件项"""
-        item.setFlags(Qt.ItemIsEnabled | Qt.ItemIsUserCheckable)
         # 第0列设置复选框和图标，第1列显示文件名
         item.setCheckState(0, Qt.Unchecked)  # 复选框在第0列
         
-        # 如果有封面URL，同步加载封面图片
+        # 如果有封面URL，异步加载封面图片
         if thumbnail_url:
-            self._load_thumbnail_sync(item, thumbnail_url)
+            self._load_thumbnail_async(item, thumbnail_url)
         else:
             # 设置默认视频图标
-            item.setIcon(0, self.style().standardIcon(self.style().SP_MediaPlay))
+            item.setIcon(0, self._icon_play)
             
         # 设置文本内容
         item.setText(0, f"{resolution} {file_type.upper()}")  # 第0列：描述
@@ -1427,147 +2009,59 @@ class VideoDownloaderMethods:
         item.setText(2, file_type)  # 第2列：文件类型
         item.setText(3, format_size(filesize))  # 第3列：文件大小
         
-        # 检查文件是否已下载，设置状态列
-        file_path = os.path.join(self.save_path, f"{filename}.{file_type}")
-        if os.path.exists(file_path):
+        # 检查文件是否已下载，设置状态列和复选框标志（每项只设置一次）
+        if os.path.normcase(f"{filename}.{file_type}") in self._get_existing_files():
             # 文件已下载，显示tr("main_window.downloaded")
-            item.setText(4, tr("main_window.downloaded"))
-            item.setForeground(4, Qt.green)
+            item.setText(4, self._tr_downloaded)
+            item.setForeground(4, self._brush_downloaded)
             # 禁用已下载文件的复选框，防止重复下载
-            item.setFlags(item.flags() & ~Qt.ItemIsUserCheckable)
+            item.setFlags(_FLAGS_DOWNLOADED)
         else:
             # 文件未下载，显示tr("main_window.not_downloaded")
-            item.setText(4, tr("main_window.not_downloaded"))
-            item.setForeground(4, Qt.black)
+            item.setText(4, self._tr_not_downloaded)
+            item.setForeground(4, self._brush_not_downloaded)
             # 确保未下载文件的复选框可用
-            item.setFlags(item.flags() | Qt.ItemIsUserCheckable)
-
-    def _load_thumbnail_sync(self, item: QTreeWidgetItem, thumbnail_url: str) -> None:
-        """同步加载封面图片"""
-        try:
-            import requests
-            from PyQt5.QtGui import QPixmap, QIcon
-            
-            # 获取表格行高度，封面图片高度为行高减1
-            tree_widget = item.treeWidget()
-            if tree_widget:
-                # 获取第一行的实际高度
-                first_item = tree_widget.topLevelItem(0)
-                if first_item:
-                    row_height = tree_widget.visualItemRect(first_item).height()
-                else:
-                    # 如果没有项目，使用默认高度
-                    row_height = 20
-            else:
-                row_height = 20
-            
-            # 封面图片高度为行高减1
-            icon_height = max(1, row_height - 1)
-            icon_width = icon_height  # 保持正方形
-            
-            # 同步下载封面图片
-            response = requests.get(thumbnail_url, timeout=5)
-            if response.status_code == 200:
-                pixmap = QPixmap()
-                pixmap.loadFromData(response.content)
-                if not pixmap.isNull():
-                    # 缩放图片到合适大小
-                    scaled_pixmap = pixmap.scaled(icon_width, icon_height, Qt.KeepAspectRatio, Qt.SmoothTransformation)
-                    icon = QIcon(scaled_pixmap)
-                    item.setIcon(0, icon)
-                    
-                    # 设置工具提示用于悬停放大
-                    self._set_thumbnail_tooltip(item, pixmap)
-                    return
-            
-            # 如果加载失败，设置默认图标
-            item.setIcon(0, self.style().standardIcon(self.style().SP_MediaPlay))
-            
-        except Exception as e:
-            logger.warning(f"加载封面图片失败: {e}")
-            # 设置默认图标
-            item.setIcon(0, self.style().standardIcon(self.style().SP_MediaPlay))
+            item.setFlags(_FLAGS_CHECKABLE)
 
-    def _set_thumbnail_tooltip(self, item: QTreeWidgetItem, original_pixmap: QPixmap) -> None:
-        """设置封面图片的工具提示（悬停放大）"""
-        try:
-            # 创建放大版本的图片
-            enlarged_pixmap = original_pixmap.scaled(
-                200, 200,  # 放大到200x200
-                Qt.KeepAspectRatio,
-                Qt.SmoothTransformation
-            )
-            
-            # 创建HTML格式的工具提示
-            tooltip_html = f"""
-            <div style="background-color: white; border: 2px solid #ccc; padding: 5px;">
-                <img src="data:image/png;base64,{self._pixmap_to_base64(enlarged_pixmap)}" 
-                     width="{enlarged_pixmap.width()}" 
-                     height="{enlarged_pixmap.height()}" />
-            </div>
-            """
-            
-            # 设置工具提示
-            item.setToolTip(0, tooltip_html)
-            
-        except Exception as e:
-            logger.warning(f"设置封面工具提示失败: {e}")
+    def _get_existing_files(self) -> set:
+        """获取保存目录中已有文件名集合，一次目录扫描代替逐项 stat"""
+        if self._existing_files is None:
+            self._existing_files = list_file_names(self.save_path)
+        return self._existing_files
 
-    def _pixmap_to_base64(self, pixmap: QPixmap) -> str:
-        """将QPixmap转换为base64字符串"""
-        try:
-            from PyQt5.QtCore import QBuffer
-            from PyQt5.QtGui import QImage
-            import base64
-            
-            # 转换为QImage
-            image = pixmap.toImage()
-            
-            # 创建缓冲区
-            buffer = QBuffer()
-            buffer.open(QBuffer.ReadWrite)
-            
-            # 保存为PNG格式
-            image.save(buffer, "PNG")
-            
-            # 获取数据并转换为base64
-            data = buffer.data()
-            base64_data = base64.b64encode(data.data()).decode('utf-8')
-            
-            return base64_data
-            
-        except Exception as e:
-            logger.warning(f"转换图片到base64失败: {e}")
-            return ""
+    def _load_thumbnail_async(self, item: QTreeWidgetItem, thumbnail_url: str, default_icon: Optional[QIcon] = None) -> None:
+        """异步加载封面图片，先显示默认图标，下载完成后替换"""
+        item.setIcon(0, default_icon if default_icon is not None else self._icon_play)
+        
+        # 获取表格行高度，封面图片高度为行高减1
+        row_height = 20
+        tree_widget = item.treeWidget()
+        if tree_widget:
+            # 获取第一行的实际高度
+            first_item = tree_widget.topLevelItem(0)
+            if first_item:
+                row_height = tree_widget.visualItemRect(first_item).height()
+        
+        # 封面图片高度为行高减1，保持正方形
+        icon_height = max(1, row_height - 1)
+        get_thumbnail_loader().request(thumbnail_url, item, icon_height)
 
     def on_item_changed(self, item: QTreeWidgetItem, column: int) -> None:
         """处理树形控件项状态变化"""
-        # 处理分辨率节点的复选框变化（第0列）
-        if column == 0 and item.parent() is None:
-            # 临时禁用信号以避免循环触发
-            self.format_tree.blockSignals(True)
-            try:
-                # 直接设置所有子项的状态，不使用递归
-                checked = item.checkState(0) == Qt.Checked
-                for i in range(item.childCount()):
-                    child = item.child(i)
-                    child.setCheckState(0, Qt.Checked if checked else Qt.Unchecked)
-            finally:
-                self.format_tree.blockSignals(False)
-        
-        # 处理视频文件节点的复选框变化（第0列）
-        elif column == 0 and item.parent() is not None:
-            parent = item.parent()
-            if parent:
-                # 临时禁用信号以避免循环触发
-                self.format_tree.blockSignals(True)
-                try:
-                    all_checked = all(parent.child(i).checkState(0) == Qt.Checked for i in range(parent.childCount()))
-                    parent.setCheckState(0, Qt.Checked if all_checked else Qt.Unchecked)
-                finally:
-                    self.format_tree.blockSignals(False)
-        
-        # 更新选择计数
+        # 分组节点带有 ItemIsAutoTristate，父子复选状态的同步由Qt完成，
+        # 这里只需更新选择计数（同一轮事件循环内的多次变化只统计一次）
+        self._schedule_selection_count_update()
+    
+    def _schedule_selection_count_update(self) -> None:
+        """延迟到下一轮事件循环更新选择计数，合并连续的复选框变化"""
+        if self._selection_count_pending:
+            return
+        self._selection_count_pending = True
+        QTimer.singleShot(0, self._flush_selection_count)
+    
+    def _flush_selection_count(self) -> None:
+        """执行延迟的选择计数更新"""
+        self._selection_count_pending = False
         self.update_selection_count()
     
     def pause_parse(self) -> None:
@@ -1603,65 +2097,63 @@ class VideoDownloaderMethods:
         logger.info("解析已恢复")
     
     def cancel_parse(self) -> None:
-        """取消解析"""
-        msg_box = QMessageBox()
+        """取消解析（非模态确认，不进入嵌套事件循环）"""
+        msg_box = self._cancel_confirm_box
+        if msg_box is None:
+            msg_box = self._create_confirm_box(tr("messages.confirm_cancel_parse"), self._on_cancel_confirmed)
+            self._cancel_confirm_box = msg_box
+        elif msg_box.isVisible():
+            return
+        msg_box.open()
+    
+    def _create_confirm_box(self, text: str, on_finished) -> QMessageBox:
+        """创建可重复使用的是/否确认框，关闭时以结果调用 on_finished"""
+        msg_box = QMessageBox(self)
         msg_box.setWindowTitle("确认")
-        msg_box.setText(tr("messages.confirm_cancel_parse"))
+        msg_box.setText(text)
         msg_box.setIcon(QMessageBox.Question)
         msg_box.setStandardButtons(QMessageBox.Yes | QMessageBox.No)
         msg_box.setDefaultButton(QMessageBox.No)
         # 设置按钮中文文本
         msg_box.button(QMessageBox.Yes).setText(tr("messages.yes"))
         msg_box.button(QMessageBox.No).setText(tr("messages.no"))
-        reply = msg_box.exec_()
-        
-        if reply == QMessageBox.Yes:
-            for worker in self.parse_workers:
-                if worker.isRunning():
-                    worker.cancel()
-            # 取消网易云音乐解析工作线程
-            for worker in self.netease_music_workers:
-                if worker.isRunning():
-                    worker.cancel()
-
-            self.reset_parse_state()
-            logger.info("用户取消了解析操作")
-            self.update_status_bar("解析已取消", "", "")
-            # 显示友好的取消提示
-            self.status_scroll_label.setText(tr("main_window.parse_cancelled"))
+        msg_box.finished.connect(on_finished)
+        return msg_box
+    
+    def _on_cancel_confirmed(self, result: int) -> None:
+        """取消解析确认框关闭后的处理"""
+        if result != QMessageBox.Yes:
+            return
+        # reset_parse_state 会断开信号并在线程池中取消所有解析工作线程
+        self.reset_parse_state()
+        logger.info("用户取消了解析操作")
+        self.update_status_bar("解析已取消", "", "")
+        # 显示友好的取消提示
+        self.status_scroll_label.setText(tr("main_window.parse_cancelled"))
     
     def reset_parse_state(self) -> None:
         """重置解析状态"""
         self.is_parsing = False
         
-        # 先断开所有解析工作线程的信号连接，避免残留信号
-        for worker in self.parse_workers:
-            try:
-                if worker.isRunning():
-                    worker.cancel()
-                # 断开所有信号连接
-                worker.status_signal.disconnect()
-                worker.log_signal.disconnect()
-                worker.progress_signal.disconnect()
-                worker.video_parsed_signal.disconnect()
-                worker.finished.disconnect()
-                worker.error.disconnect()
-            except Exception as e:
-                # 忽略断开连接时的错误（可能已经断开）
-                logger.debug(f"断开解析工作线程信号连接时出错: {e}")
-        
-        # 清理网易云音乐解析工作线程的信号连接
-        for worker in self.netease_music_workers:
+        # 先断开所有解析工作线程的结果信号，避免残留信号；只请求取消、不等待线程结束，
+        # 仍在运行的线程保留引用，直到线程退出信号触发 _release_parse_worker 再释放
+        for worker in chain(self.parse_workers, self.netease_music_workers):
+            # 只断开结果信号；线程退出信号仍连接到释放逻辑
+            signal_names = (_PARSE_WORKER_RESULT_SIGNALS if isinstance(worker, ParseWorker)
+                            else _NETEASE_WORKER_RESULT_SIGNALS)
+            for name in signal_names:
+                try:
+                    getattr(worker, name).disconnect()
+                except TypeError:
+                    # 该信号没有任何连接
+                    pass
             try:
+                # 线程退出信号在创建时已连接到 _release_parse_worker
                 if worker.isRunning():
-                    worker.cancel()
-                # 断开所有信号连接
-                worker.music_parsed_signal.disconnect()
-                worker.error_signal.disconnect()
-                worker.finished_signal.disconnect()
+                    self._retiring_parse_workers.add(worker)
+                    worker.request_cancel()
             except Exception as e:
-                # 忽略断开连接时的错误（可能已经断开）
-                logger.debug(f"断开网易云音乐解析工作线程信号连接时出错: {e}")
+                logger.debug("取消解析工作线程时出错: %s", e)
         
         # 清空工作线程列表
         self.parse_workers.clear()
@@ -1682,11 +2174,13 @@ class VideoDownloaderMethods:
         # 重置解析计数器
         self.parsed_count = 0
         self.total_urls = 0
+        self._active_parse_workers = 0
         
         logger.info("解析状态已重置，可以输入新的链接")
 
     def on_parse_error(self, error_msg: str) -> None:
         """处理解析错误"""
+        self._on_parse_worker_done()
         # 检查是否为取消操作
         if "解析已取消" in error_msg or "InterruptedError" in error_msg:
             # 用户取消解析，不显示错误对话框，只记录日志
@@ -1721,42 +2215,60 @@ class VideoDownloaderMethods:
             elif isinstance(d, dict) and d.get("status") == "finished":
                 filename = d.get("filename", "")
                 # 标记为已完成，但不立即删除，让 on_download_finished 处理
-                self.download_progress[filename] = (100, tr("main_window.completed"))
-                logger.info(f"文件下载完成: {filename}")
+                self.download_progress[filename] = (100, self._tr_completed)
+                logger.info("文件下载完成: %s", filename)
         except Exception as e:
-            logger.error(f"进度回调处理错误: {e}")
+            logger.error("进度回调处理错误: %s", e)
             # 如果参数不是预期的字典格式，尝试处理字符串或其他格式
             if isinstance(d, str):
-                logger.info(f"收到字符串进度信息: {d}")
+                logger.debug("收到字符串进度信息: %s", d)
             else:
-                logger.info(f"收到未知格式进度信息: {type(d)} - {d}")
+                logger.debug("收到未知格式进度信息: %s - %s", type(d), d)
 
     def update_download_progress(self) -> None:
         """更新下载进度"""
         # 检查是否所有下载都已完成
         if not self.is_downloading or (not self.download_progress and not self.download_workers):
-            self.smart_download_button.setText(tr("main_window.download"))
-            self.smart_download_button.setStyleSheet(self.default_style)
-            self.setWindowTitle(f"{tr('app.title')}-v{Config.APP_VERSION}")
-            self.update_status_bar(tr("main_window.ready"), "", "")
+            self._last_progress_snapshot = None
+            # 空闲时只在界面与目标状态不一致时才写入，避免每个定时器周期都重绘
+            download_text = self._tr_download
+            if self.smart_download_button.text() != download_text:
+                self.smart_download_button.setText(download_text)
+            if self.smart_download_button.styleSheet() != self.default_style:
+                self.smart_download_button.setStyleSheet(self.default_style)
+            self._set_window_title_if_changed(self._window_title_base)
+            ready_text = self._tr_ready
+            if self.status_scroll_label.text() != ready_text:
+                self.update_status_bar(ready_text, "", "")
             return
 
         # 检查是否所有下载都已完成（没有活动下载且没有队列）
         if self.active_downloads <= 0 and not self.download_queue:
+            self._last_progress_snapshot = None
             # 所有下载完成，显示100%进度
-            self.setWindowTitle(f"{tr('app.title')}-v{Config.APP_VERSION} - {tr('main_window.downloading')} (100.0%)")
-            self.update_status_bar(f"{tr('main_window.downloading')} (100.0%)", tr("main_window.completed"), "")
+            downloading_text = f"{self._tr_downloading} (100.0%)"
+            self._set_window_title_if_changed(f"{self._window_title_base} - {downloading_text}")
+            completed_text = self._tr_completed
+            if self.status_scroll_label.text() != f"{downloading_text} | {completed_text}":
+                self.update_status_bar(downloading_text, completed_text, "")
             return
 
+        # 直接读取计数器，避免每个周期遍历工作线程调用 isRunning()
+        active_count = self.active_downloads
+        completed_files = self.completed_downloads
+
         # 计算总体进度：已完成文件 + 当前下载进度
-        total_files = len(self.download_progress) + len([w for w in self.download_workers if not w.isRunning()])
+        total_files = len(self.download_progress) + completed_files
         if total_files == 0:
             return
             
-        # 当前下载进度总和
-        current_percent = sum(percent for percent, _ in self.download_progress.values())
+        # 一次遍历同时累加当前下载进度并收集速度
+        current_percent = 0.0
+        speeds = []
+        for percent, speed in self.download_progress.values():
+            current_percent += percent
+            speeds.append(speed)
         # 已完成文件数（每个算100%）
-        completed_files = len([w for w in self.download_workers if not w.isRunning()])
         completed_percent = completed_files * 100
         
         # 总进度 = (已完成进度 + 当前进度) / 总文件数
@@ -1766,60 +2278,55 @@ class VideoDownloaderMethods:
         # 确保进度不超过100%
         avg_percent = min(avg_percent, 100.0)
         
-        total_speed = [speed for _, speed in self.download_progress.values()]
-        speed_text = ", ".join(total_speed) if total_speed else tr("main_window.completed")
-        active_count = len([w for w in self.download_workers if w.isRunning()])
-        
-        # 更新窗口标题
-        self.setWindowTitle(f"{tr('app.title')}-v{Config.APP_VERSION} - {tr('main_window.downloading')} ({avg_percent:.1f}%)")
-        
-        # 更新状态栏
-        self.update_status_bar(
-            f"{tr('main_window.downloading')} ({avg_percent:.1f}%)", 
-            f"{speed_text} | {tr('main_window.active')}: {active_count}/{Config.MAX_CONCURRENT_DOWNLOADS}",
-            f"{tr('main_window.files')}: {total_files}"
-        )
+        # 显示内容与上一次相同时不再重绘标题和状态栏
+        snapshot = (round(avg_percent, 1), tuple(speeds), active_count, total_files)
+        if snapshot != self._last_progress_snapshot:
+            self._last_progress_snapshot = snapshot
+            # 仅在需要刷新时拼接速度文本
+            speed_text = ", ".join(speeds) if speeds else self._tr_completed
+            
+            # 更新窗口标题
+            downloading_text = f"{self._tr_downloading} ({avg_percent:.1f}%)"
+            self.setWindowTitle(f"{self._window_title_base} - {downloading_text}")
+            
+            # 更新状态栏
+            self.update_status_bar(
+                downloading_text, 
+                f"{speed_text} | {self._tr_active}: {active_count}/{Config.MAX_CONCURRENT_DOWNLOADS}",
+                f"{self._tr_files}: {total_files}"
+            )
 
-        while self.active_downloads < Config.MAX_CONCURRENT_DOWNLOADS and self.download_queue:
-            url, fmt = self.download_queue.popleft()
-            self.start_download(url, fmt)
+        if self.download_queue:
+            self._process_download_queue()
+
+    def _set_window_title_if_changed(self, title: str) -> None:
+        """仅在标题变化时设置窗口标题"""
+        if self.windowTitle() != title:
+            self.setWindowTitle(title)
 
     def download_selected(self, item: Optional[QTreeWidgetItem] = None, column: Optional[int] = None) -> None:
         """下载选中的格式"""
         selected_formats = []
 
         try:
-            def collect_checked_items(tree_item: QTreeWidgetItem) -> List[Dict]:
-                checked_items = []
-                item_name = tree_item.text(0)
-                logger.info(f"检查树项: {item_name}, 子项数量: {tree_item.childCount()}, 选中状态: {tree_item.checkState(0)}")
-                
-                # 检查当前项目本身（用于网易云音乐等直接添加的项目）
-                if tree_item.checkState(0) == Qt.Checked and tree_item.childCount() == 0:
-                    for fmt in self.formats:
-                        if fmt["item"] == tree_item:
-                            logger.info(f"找到选中的直接项目: {fmt.get('description', '未知')}")
-                            checked_items.append(fmt)
-                    return checked_items
-                # 检查子项目（用于视频等有层次结构的项目）
-                for i in range(tree_item.childCount()):
-                    child = tree_item.child(i)
-                    child_name = child.text(0)
-                    child_checked = child.checkState(0) == Qt.Checked
-                    logger.info(f"检查子项 {i}: {child_name}, 选中状态: {child_checked}")
-                    
-                    if child_checked and child.childCount() == 0:  # 复选框在第0列
-                        for fmt in self.formats:
-                            if fmt["item"] == child:
-                                logger.info(f"找到选中的子项目: {fmt.get('description', '未知')}")
-                                checked_items.append(fmt)
-                    elif child.childCount() > 0:
-                        checked_items.extend(collect_checked_items(child))
-                return checked_items
-
-            for i in range(self.format_tree.topLevelItemCount()):
-                top_item = self.format_tree.topLevelItem(i)
-                selected_formats.extend(collect_checked_items(top_item))
+            item_to_format = self._item_to_format
+            
+            # 用显式栈迭代遍历格式树，逆序压入子项以保持原有的先序顺序
+            tree = self.format_tree
+            stack = [tree.topLevelItem(i) for i in range(tree.topLevelItemCount() - 1, -1, -1)]
+            append = selected_formats.append
+            while stack:
+                node = stack.pop()
+                child_count = node.childCount()
+                if child_count:
+                    # 检查子项目（用于视频等有层次结构的项目）
+                    stack.extend(node.child(i) for i in range(child_count - 1, -1, -1))
+                elif node.checkState(0) == Qt.Checked:
+                    # 选中的叶子项目（视频文件或网易云音乐等直接添加的项目）
+                    fmt = item_to_format.get(id(node))
+                    if fmt is not None:
+                        logger.debug("找到选中的项目: %s", fmt.get('description', '未知'))
+                        append(fmt)
 
             if not selected_formats:
                 # 调试：显示格式树的状态
@@ -1850,6 +2357,7 @@ class VideoDownloaderMethods:
 
             self.is_downloading = True
             self.download_progress.clear()
+            self.completed_downloads = 0
             self.smart_download_button.setEnabled(True)  # 保持启用状态，允许取消下载
             self.smart_parse_button.setEnabled(False)
             self.smart_pause_button.setEnabled(True)
@@ -1860,19 +2368,20 @@ class VideoDownloaderMethods:
             logger.info("开始下载...")
             self.update_status_bar("开始下载...", "准备中", f"选中: {len(selected_formats)} 个文件")
 
-            logger.info(f"开始处理 {len(selected_formats)} 个选中的格式")
-            for i, fmt in enumerate(selected_formats):
-                logger.info(f"处理格式 {i+1}/{len(selected_formats)}: {fmt.get('description', '未知')}")
-                
+            queued_count = 0
+            for fmt in selected_formats:
+                # 对于网易云音乐，使用原始URL而不是fmt["url"]
+                download_url = fmt.get("original_url", fmt["url"]) if fmt.get("type") == "netease_music" else fmt["url"]
                 if self.active_downloads < Config.MAX_CONCURRENT_DOWNLOADS:
-                    # 对于网易云音乐，使用原始URL而不是fmt["url"]
-                    download_url = fmt.get("original_url", fmt["url"]) if fmt.get("type") == "netease_music" else fmt["url"]
-                    logger.info(f"立即启动下载: {fmt.get('description', '未知')}")
+                    logger.debug("立即启动下载: %s", fmt.get('description', '未知'))
                     self.start_download(download_url, fmt)
                 else:
-                    download_url = fmt.get("original_url", fmt["url"]) if fmt.get("type") == "netease_music" else fmt["url"]
-                    logger.info(f"添加到下载队列: {fmt.get('description', '未知')}")
+                    logger.debug("添加到下载队列: %s", fmt.get('description', '未知'))
                     self.download_queue.append((download_url, fmt))
+                    queued_count += 1
+            # 逐项日志降为 DEBUG，INFO 级别只输出一行汇总
+            logger.info("已处理 %d 个选中的格式：立即下载 %d 个，排队 %d 个",
+                        len(selected_formats), len(selected_formats) - queued_count, queued_count)
                 
         except Exception as e:
             logger.error(f"下载失败: {str(e)}", exc_info=True)
@@ -1890,45 +2399,21 @@ class VideoDownloaderMethods:
                 return
             
             # 原有的视频下载逻辑
-            output_file = os.path.join(self.save_path, selected_format["description"])
+            output_file = f"{self._save_path_prefix}{selected_format['description']}"
             self.download_progress[output_file] = (0, "未知速率")
             logger.info(f"开始下载: {output_file}")
 
+            # 复制固定模板并补充本次下载相关的选项；嵌套的可变对象每次新建，避免下载任务之间共享
             ydl_opts = {
-                "outtmpl": os.path.join(self.save_path, selected_format["description"]),
-                "quiet": False,
+                **_YDL_BASE_VIDEO,
+                "outtmpl": output_file,
                 "ffmpeg_location": self.ffmpeg_path,
-                "verbose": True,  # 启用详细日志以诊断FFmpeg问题
-                
-                # 增强下载稳定性配置
-                "retries": 10,  # 增加重试次数
-                "fragment_retries": 10,  # 增加片段重试次数
-                "extractor_retries": 5,  # 增加提取器重试次数
-                "socket_timeout": 60,  # 增加socket超时时间
-                "http_chunk_size": 10485760,  # 10MB块大小，平衡速度和稳定性
-                "buffersize": 4096,  # 增大缓冲区
-                
-                # 下载恢复和断点续传
-                "continuedl": True,  # 启用断点续传
-                "noprogress": False,  # 显示进度
-                
-                # 错误处理
-                "ignoreerrors": False,  # 不忽略错误，确保错误被正确处理
-                "no_warnings": False,  # 显示警告信息
-                
-                # 网络配置
-                "prefer_insecure": True,  # 优先使用不安全的连接
-                "no_check_certificate": True,  # 不检查证书
-                
                 # 请求头配置
-                "headers": {
-                    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
-                    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
-                    "Accept-Language": "en-US,en;q=0.5",
-                    "Accept-Encoding": "gzip, deflate",
-                    "Connection": "keep-alive",
-                },
+                "headers": dict(_HEADERS_VIDEO),
             }
+            
+            # 详细日志会产生大量状态栏消息，默认关闭，仅在设置中启用调试模式时用于诊断FFmpeg问题
+            ydl_opts["verbose"] = self.settings.value("enable_debug_mode", False, type=bool)
 
             speed_limit = self.speed_limit_input.text().strip()
             if speed_limit.isdigit():
@@ -1945,16 +2430,8 @@ class VideoDownloaderMethods:
                 logger.info(f"使用特定格式ID: {format_spec} (高度: {height})")
             else:
                 # 根据高度选择最佳格式，确保包含音频
-                if height >= 1080:
-                    format_spec = "best[height>=1080]+bestaudio/best"
-                elif height >= 720:
-                    format_spec = "best[height>=720]+bestaudio/best"
-                elif height >= 480:
-                    format_spec = "best[height>=480]+bestaudio/best"
-                elif height >= 360:
-                    format_spec = "best[height>=360]+bestaudio/best"
-                else:
-                    format_spec = "best+bestaudio/best"
+                format_spec = next((spec for min_height, spec in _HEIGHT_LADDER if height >= min_height),
+                                   "best+bestaudio/best")
                 logger.info(f"使用高度匹配格式: {format_spec} (高度: {height})")
             
             # 记录最终的下载配置
@@ -1964,38 +2441,21 @@ class VideoDownloaderMethods:
             auto_merge_enabled = self.settings.value("auto_merge", True, type=bool)
             
             ydl_opts.update({
-            "format": format_spec,
-            # 根据设置决定是否进行音视频合并
-            "merge_output_format": "mp4" if auto_merge_enabled else None,
-            "prefer_ffmpeg": True,
-            
-            # 添加后处理器配置，确保音视频正确合并
-            "postprocessors": [{
-                'key': 'FFmpegVideoConvertor',
-                'preferedformat': 'mp4',
-            }] if auto_merge_enabled else [],
-            
-            # 文件覆盖配置，避免同名文件导致下载失败
-            "overwrites": True,
-            "ignoreerrors": False,
-            
-            # 优化下载配置 - 适度并发，提高稳定性
-            "concurrent_fragment_downloads": 8,  # 减少并发，提高稳定性
-            "concurrent_fragments": 8,
-            "http_chunk_size": 8388608,  # 8MB块大小，平衡速度和稳定性
-            "buffersize": 32768,  # 32KB缓冲区
-            
-            # 网络优化 - 适度超时，提高成功率
-            "socket_timeout": 90,  # 适度超时时间
-            "retries": 8,  # 适度重试次数
-            "fragment_retries": 5,
-            "extractor_retries": 3,
-        })
-
-            worker = DownloadWorker(url, ydl_opts, format_id)
+                "format": format_spec,
+                # 根据设置决定是否进行音视频合并
+                "merge_output_format": "mp4" if auto_merge_enabled else None,
+                # 添加后处理器配置，确保音视频正确合并
+                "postprocessors": [{
+                    'key': 'FFmpegVideoConvertor',
+                    'preferedformat': 'mp4',
+                }] if auto_merge_enabled else [],
+            })
+
+            worker = DownloadWorker(url, ydl_opts, format_id, selected_format=selected_format)
             worker.progress_signal.connect(self.download_progress_hook)
             worker.log_signal.connect(self.update_scroll_status)  # 连接日志信号到状态栏
-            worker.finished.connect(lambda filename: self.on_download_finished(filename, url, selected_format))
+            worker.finished.connect(self._on_worker_finished)
+            worker.thread_finished.connect(self._release_download_worker)
             worker.error.connect(self.on_download_error)
             worker.start()
             self.download_workers.append(worker)
@@ -2018,85 +2478,19 @@ class VideoDownloaderMethods:
             safe_title = sanitize_filename(title, self.save_path)
             safe_artist = sanitize_filename(artist, self.save_path)
             filename = f"{safe_artist} - {safe_title}.{ext}"
-            output_file = os.path.join(self.save_path, filename)
+            output_file = f"{self._save_path_prefix}{filename}"
             
             self.download_progress[output_file] = (0, "未知速率")
             logger.info(f"开始下载网易云音乐: {filename}")
             
             # 创建增强的下载选项，专门针对网易云音乐的反爬虫机制
             ydl_opts = {
+                **_YDL_BASE_NETEASE,
                 "outtmpl": output_file,
-                "quiet": False,
                 "ffmpeg_location": self.ffmpeg_path,
-                
-                # 增强下载稳定性配置
-                "retries": 15,
-                "fragment_retries": 15,
-                "extractor_retries": 10,
-                "socket_timeout": 120,
-                "http_chunk_size": 10485760,
-                "buffersize": 8192,
-                
-                # 下载恢复和断点续传
-                "continuedl": True,
-                "noprogress": False,
-                
-                # 错误处理
-                "ignoreerrors": False,
-                "no_warnings": False,
-                
-                # 网络配置
-                "prefer_insecure": True,
-                "no_check_certificate": True,
-                "nocheckcertificate": True,
-                
-                # 允许FFmpeg进行音视频合并
-                "merge_output_format": "mp4",  # 指定合并格式为mp4
-                
-                # 地理绕过
-                "geo_bypass": True,
-                "geo_bypass_country": "CN",
-                
-                # 请求头配置 - 模拟真实浏览器
-                "headers": {
-                    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
-                    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,image/apng,*/*;q=0.8,application/signed-exchange;v=b3;q=0.7",
-                    "Accept-Language": "zh-CN,zh;q=0.9,en;q=0.8",
-                    "Accept-Encoding": "gzip, deflate, br",
-                    "Connection": "keep-alive",
-                    "Upgrade-Insecure-Requests": "1",
-                    "Sec-Fetch-Dest": "document",
-                    "Sec-Fetch-Mode": "navigate",
-                    "Sec-Fetch-Site": "none",
-                    "Sec-Fetch-User": "?1",
-                    "Cache-Control": "max-age=0",
-                    "Referer": "https://music.163.com/",
-                    "Origin": "https://music.163.com",
-                    "DNT": "1",
-                },
-                
-                # 额外的HTTP头部
-                "http_headers": {
-                    "Referer": "https://music.163.com/",
-                    "Origin": "https://music.163.com",
-                    "X-Requested-With": "XMLHttpRequest",
-                },
-                
-                # 下载策略
-                "concurrent_fragment_downloads": 5,
-                "max_sleep_interval": 5,
-                "sleep_interval": 1,
-                
-                # 格式选择策略
-                "format": "best[ext=mp3]/best",
-                "format_sort": ["ext:mp3:m4a", "quality", "filesize"],
-                
-                # 重试策略
-                "retry_sleep": "exponential",
-                "max_retries": 15,
-                "fragment_retries": 15,
-                "extractor_retries": 10,
-                
+                "format_sort": list(_YDL_BASE_NETEASE["format_sort"]),
+                "headers": dict(_HEADERS_NETEASE),
+                "http_headers": dict(_HTTP_HEADERS_NETEASE),
                 # 进度回调
                 "progress_hooks": [],
             }
@@ -2118,10 +2512,11 @@ class VideoDownloaderMethods:
                 return
             
             # 创建专门的网易云音乐下载工作线程
-            worker = DownloadWorker(download_url, ydl_opts)
+            worker = DownloadWorker(download_url, ydl_opts, selected_format=selected_format, source_url=url)
             worker.progress_signal.connect(self.download_progress_hook)
             worker.log_signal.connect(self.update_scroll_status)  # 连接日志信号到状态栏
-            worker.finished.connect(lambda filename: self.on_download_finished(filename, url, selected_format))
+            worker.finished.connect(self._on_worker_finished)
+            worker.thread_finished.connect(self._release_download_worker)
             worker.error.connect(self.on_download_error)
             worker.start()
             self.download_workers.append(worker)
@@ -2132,66 +2527,70 @@ class VideoDownloaderMethods:
             self.update_status_bar(f"网易云音乐下载失败: {selected_format.get('title', '未知')} - {str(e)}", "", "")
             self.reset_download_state()
     
-
-            
-            # 创建下载选项
-            ydl_opts = {
-                "outtmpl": output_file,
-                "quiet": False,
-                "ffmpeg_location": self.ffmpeg_path,
-                
-                # 增强下载稳定性配置
-                "retries": 10,  # 增加重试次数
-                "fragment_retries": 10,  # 增加片段重试次数
-                "extractor_retries": 5,  # 增加提取器重试次数
-                "socket_timeout": 60,  # 增加socket超时时间
-                "http_chunk_size": 10485760,  # 10MB块大小，平衡速度和稳定性
-                "buffersize": 4096,  # 增大缓冲区
-                
-                # 下载恢复和断点续传
-                "continuedl": True,  # 启用断点续传
-                "noprogress": False,  # 显示进度
-                
-                # 错误处理
-                "ignoreerrors": False,  # 不忽略错误，确保错误被正确处理
-                "no_warnings": False,  # 显示警告信息
-                
-                # 网络配置
-                "prefer_insecure": True,  # 优先使用不安全的连接
-                "no_check_certificate": True,  # 不检查证书
-                
-                # 请求头配置
-                "headers": {
-                    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
-                    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
-                    "Accept-Language": "en-US,en;q=0.5",
-                    "Accept-Encoding": "gzip, deflate",
-                    "Connection": "keep-alive",
-                },
-            }
-            
-            speed_limit = self.speed_limit_input.text().strip()
-            if speed_limit.isdigit():
-                ydl_opts["ratelimit"] = int(speed_limit) * 1024
-            
-
-
-    def on_download_finished(self, filename: str, url: str, selected_format: Optional[Dict] = None) -> None:
-        """处理下载完成"""
+    def _on_worker_finished(self, filename: str) -> None:
+        """下载工作线程完成信号的槽，从发送者取出链接和格式信息"""
+        worker = self.sender()
+        if isinstance(worker, DownloadWorker):
+            self.on_download_finished(filename, worker.source_url, worker.selected_format, worker)
+        else:
+            self.on_download_finished(filename, "")
+    
+    def _release_download_worker(self) -> None:
+        """下载线程退出（run() 已返回）后从列表中移除并交给Qt释放"""
+        worker = self.sender()
+        if not isinstance(worker, DownloadWorker):
+            return
+        with self._download_lock:
+            if worker in self.download_workers:
+                self.download_workers.remove(worker)
+        worker.deleteLater()
+    
+    def on_download_finished(self, filename: str, url: str, selected_format: Optional[Dict] = None,
+                             worker: Optional[DownloadWorker] = None) -> None:
+        """处理下载完成：只更新计数，界面刷新合并到下一次批量处理"""
         # 防止active_downloads变为负数
         if self.active_downloads > 0:
             self.active_downloads -= 1
-        
-        # 在下载完成后检查内存使用
-        self._check_memory_usage()
+        # 无论是否能取到工作线程都计入已完成数，保证计数单调且不漏计
+        self.completed_downloads += 1
         
         # 从下载进度中移除已完成的文件
         if filename and filename in self.download_progress:
             del self.download_progress[filename]
         
-        logger.info(f"下载完成: {filename}")
+        logger.info(f"下载完成: {filename}")
+        self._existing_files = None  # 保存目录已有新文件
+        
+        # 短时间内完成的多个下载合并为一次界面刷新
+        self._pending_completions.append((filename, url, selected_format))
+        if not self._completion_flush_timer.isActive():
+            self._completion_flush_timer.start()
+    
+    def _flush_download_completions(self) -> None:
+        """批量处理已完成的下载：历史记录、状态刷新、线程清理和完成提示"""
+        completions = self._pending_completions
+        if not completions:
+            return
+        self._pending_completions = []
+        
+        # 在下载完成后检查内存使用
+        self._check_memory_usage()
+        
+        # 添加到下载历史记录（一批完成事件在同一个事务中写入）
+        records = []
+        for filename, url, selected_format in completions:
+            if filename and selected_format:
+                record = self._build_history_record(url, filename, selected_format)
+                if record is not None:
+                    records.append(record)
+        if records:
+            try:
+                history_manager.add_records(records)
+                logger.info(f"已添加 {len(records)} 条下载历史")
+            except Exception as e:
+                logger.error(f"添加下载历史失败: {e}")
         
-        # 播放下载完成声音
+        # 播放下载完成声音（一批只播放一次）
         try:
             # 检查设置中是否启用了声音通知
             if self.settings.value("play_sound", True, type=bool):
@@ -2199,63 +2598,40 @@ class VideoDownloaderMethods:
         except Exception as e:
             logger.error(f"播放下载完成声音失败: {e}")
         
-        # 添加到下载历史记录
-        if filename and selected_format:
-            self._add_to_download_history(url, filename, selected_format)
-        
-        # 强制更新UI，确保状态更新
-        QApplication.processEvents()
+        # 更新下载状态显示 - 刷新所有文件状态
+        self.refresh_download_status()
         
-        # 使用QTimer延迟处理，避免UI阻塞
-        def cleanup_after_delay():
-            # 更新下载状态显示 - 刷新所有文件状态
-            self.refresh_download_status()
+        # 检查是否所有下载都完成了
+        if self.active_downloads <= 0 and not self.download_queue:
+            # 所有下载完成，显示100%进度
+            downloading_text = f"{self._tr_downloading} (100.0%)"
+            self.setWindowTitle(f"{self._window_title_base} - {downloading_text}")
+            self.update_status_bar(downloading_text, self._tr_completed, "")
+            logger.info("所有下载已完成，显示完成对话框")
             
-            # 再次强制更新UI
-            QApplication.processEvents()
-            
-            # 清理已完成的下载工作线程
-            with self._download_lock:
-                self.download_workers = [w for w in self.download_workers if w.isRunning()]
-                # 强制清理已完成线程的内存
-                for worker in self.download_workers:
-                    if not worker.isRunning():
-                        worker.deleteLater()
-            
-            # 检查是否所有下载都完成了
-            if self.active_downloads <= 0 and not self.download_queue:
-                # 所有下载完成，显示100%进度
-                self.setWindowTitle(f"{tr('app.title')}-v{Config.APP_VERSION} - {tr('main_window.downloading')} (100.0%)")
-                self.update_status_bar(f"{tr('main_window.downloading')} (100.0%)", tr("main_window.completed"), "")
-                # 强制更新状态栏显示
-                self.update_status_bar(f"{tr('main_window.downloading')} (100.0%)", tr("main_window.completed"), "")
-                logger.info("所有下载已完成，显示完成对话框")
-                
-                # 最终刷新一次状态
-                self.refresh_download_status()
-                QApplication.processEvents()
-                
-                self.show_completion_dialog()
-            else:
-                # 还有文件在下载，更新状态
-                self.update_status_bar(f"下载完成: {os.path.basename(filename) if filename else '未知文件'}", "", "")
-                # 处理下载队列中的剩余任务
-                self._process_download_queue()
-        
-        QTimer.singleShot(100, cleanup_after_delay)
+            # 先回到事件循环绘制最终状态，再弹出模态对话框
+            QTimer.singleShot(0, self.show_completion_dialog)
+        else:
+            # 还有文件在下载，更新状态
+            filename = completions[-1][0]
+            self.update_status_bar(f"下载完成: {os.path.basename(filename) if filename else '未知文件'}", "", "")
+            # 处理下载队列中的剩余任务
+            self._process_download_queue()
     
-    def _add_to_download_history(self, url: str, filename: str, format_info: Dict) -> None:
-        """添加到下载历史记录"""
+    def _build_history_record(self, url: str, filename: str, format_info: Dict) -> Optional[DownloadRecord]:
+        """根据完成的下载生成历史记录"""
         try:
-            # 获取文件大小
-            file_path = os.path.join(self.save_path, filename)
-            file_size = os.path.getsize(file_path) if os.path.exists(file_path) else 0
+            # 获取文件大小（一次 stat，文件不存在时为0）
+            try:
+                file_size = os.stat(os.path.join(self.save_path, filename)).st_size
+            except OSError:
+                file_size = 0
             
             # 对于网易云音乐，使用原始URL
             record_url = format_info.get('original_url', url) if format_info.get('type') == 'netease_music' else url
             
             # 创建下载记录
-            record = DownloadRecord(
+            return DownloadRecord(
                 url=record_url,
                 title=format_info.get('title', ''),
                 filename=filename,
@@ -2265,196 +2641,124 @@ class VideoDownloaderMethods:
                 download_path=self.save_path,
                 platform=self._detect_platform(record_url)
             )
-            
-            # 添加到历史记录
-            history_manager.add_record(record)
-            logger.info(f"已添加到下载历史: {filename}")
 
         except Exception as e:
-            logger.error(f"添加下载历史失败: {e}")
+            logger.error(f"生成下载历史记录失败: {e}")
+            return None
     
     def _detect_platform(self, url: str) -> str:
         """检测视频平台"""
-        if 'youtube.com' in url or 'youtu.be' in url:
-            return 'youtube'
-        elif 'bilibili.com' in url:
-            return 'bilibili'
-        elif 'music.163.com' in url:
-            return 'netease_music'
-        else:
-            return 'unknown'
+        match = _RE_PLATFORM.search(url)
+        return _PLATFORM_MAP[match.group(1)] if match else 'unknown'
+
+    def _build_completion_dialog(self) -> QDialog:
+        """创建下载完成对话框（只创建一次，样式表只解析一次）"""
+        dialog = QDialog(self)
+        dialog.setWindowTitle("下载完成")
+        dialog.setFixedSize(500, 280)
+        dialog.setModal(True)
+        dialog.setWindowFlags(dialog.windowFlags() & ~Qt.WindowContextHelpButtonHint)
+        
+        # 设置对话框样式
+        dialog.setStyleSheet(_COMPLETION_DIALOG_QSS)
+        
+        layout = QVBoxLayout()
+        layout.setSpacing(20)
+        layout.setContentsMargins(25, 25, 25, 25)
+        
+        # 成功图标和标题
+        title_label = QLabel("🎉 下载完成")
+        title_label.setStyleSheet(_COMPLETION_TITLE_QSS)
+        title_label.setAlignment(Qt.AlignCenter)
+        layout.addWidget(title_label)
+        
+        # 分隔线
+        line = QLabel()
+        line.setFixedHeight(1)
+        line.setStyleSheet(_COMPLETION_LINE_QSS)
+        layout.addWidget(line)
+        
+        # 成功信息
+        success_label = QLabel("所有文件已成功下载完成！")
+        success_label.setStyleSheet(_COMPLETION_SUCCESS_QSS)
+        success_label.setAlignment(Qt.AlignCenter)
+        layout.addWidget(success_label)
+        
+        # 路径信息容器
+        path_container = QLabel()
+        path_container.setStyleSheet(_COMPLETION_PATH_BOX_QSS)
+        
+        # 路径标题
+        path_title = QLabel("📁 保存位置：")
+        path_title.setStyleSheet(_COMPLETION_PATH_TITLE_QSS)
+        
+        # 路径内容
+        path_content = QLabel()
+        path_content.setStyleSheet(_COMPLETION_PATH_QSS)
+        path_content.setWordWrap(True)
+        
+        # 路径布局
+        path_layout = QVBoxLayout()
+        path_layout.setSpacing(5)
+        path_layout.setContentsMargins(0, 0, 0, 0)
+        path_layout.addWidget(path_title)
+        path_layout.addWidget(path_content)
+        path_container.setLayout(path_layout)
+        layout.addWidget(path_container)
+        
+        # 添加弹性空间
+        layout.addStretch(1)
+        
+        # 按钮布局
+        button_layout = QHBoxLayout()
+        button_layout.setSpacing(12)
+        button_layout.addStretch(1)
+        
+        # 确定按钮
+        ok_button = QPushButton("确定")
+        ok_button.setFixedSize(90, 36)
+        ok_button.clicked.connect(dialog.accept)
+        ok_button.setStyleSheet(_COMPLETION_OK_BUTTON_QSS)
+        button_layout.addWidget(ok_button)
+        
+        # 打开文件夹按钮
+        open_button = QPushButton("📂 打开文件夹")
+        open_button.setFixedSize(120, 36)
+        open_button.clicked.connect(lambda: self.open_save_path_and_close(dialog))
+        open_button.setStyleSheet(_COMPLETION_OPEN_BUTTON_QSS)
+        button_layout.addWidget(open_button)
+        
+        button_layout.addStretch(1)
+        layout.addLayout(button_layout)
+        
+        dialog.setLayout(layout)
+        
+        # 设置默认按钮
+        ok_button.setDefault(True)
+        
+        self._completion_dialog = dialog
+        self._completion_path_label = path_content
+        self._completion_ok_button = ok_button
+        return dialog
 
     def show_completion_dialog(self) -> None:
         """显示下载完成对话框"""
         try:
-            dialog = QDialog(self)
-            dialog.setWindowTitle("下载完成")
-            dialog.setFixedSize(500, 280)
-            dialog.setModal(True)
-            dialog.setWindowFlags(dialog.windowFlags() & ~Qt.WindowContextHelpButtonHint)
-            
-            # 设置对话框样式
-            dialog.setStyleSheet("""
-                QDialog {
-                    background-color: #ffffff;
-                    border: 1px solid #e0e0e0;
-                    border-radius: 8px;
-                }
-            """)
-            
-            layout = QVBoxLayout()
-            layout.setSpacing(20)
-            layout.setContentsMargins(25, 25, 25, 25)
-            
-            # 成功图标和标题
-            title_label = QLabel("🎉 下载完成")
-            title_label.setStyleSheet("""
-                font-size: 20px; 
-                font-weight: bold; 
-                color: #28a745; 
-                margin: 0;
-                padding: 10px 0;
-            """)
-            title_label.setAlignment(Qt.AlignCenter)
-            layout.addWidget(title_label)
-            
-            # 分隔线
-            line = QLabel()
-            line.setFixedHeight(1)
-            line.setStyleSheet("background-color: #e0e0e0; margin: 0;")
-            layout.addWidget(line)
-            
-            # 成功信息
-            success_label = QLabel("所有文件已成功下载完成！")
-            success_label.setStyleSheet("""
-                font-size: 14px; 
-                color: #495057; 
-                margin: 15px 0 10px 0;
-                padding: 8px 0;
-                line-height: 1.4;
-                min-height: 20px;
-            """)
-            success_label.setAlignment(Qt.AlignCenter)
-            layout.addWidget(success_label)
-            
-            # 路径信息容器
-            path_container = QLabel()
-            path_container.setStyleSheet("""
-                background-color: #f8f9fa;
-                border: 1px solid #e9ecef;
-                border-radius: 6px;
-                padding: 15px;
-                margin: 10px 0;
-                font-family: "Microsoft YaHei", sans-serif;
-            """)
-            
-            # 路径标题
-            path_title = QLabel("📁 保存位置：")
-            path_title.setStyleSheet("""
-                font-size: 13px; 
-                font-weight: bold; 
-                color: #495057; 
-                margin: 0 0 8px 0;
-            """)
-            
-            # 路径内容
-            path_content = QLabel(self.save_path)
-            path_content.setStyleSheet("""
-                font-size: 12px; 
-                color: #6c757d; 
-                margin: 0;
-                line-height: 1.4;
-            """)
-            path_content.setWordWrap(True)
-            
-            # 路径布局
-            path_layout = QVBoxLayout()
-            path_layout.setSpacing(5)
-            path_layout.setContentsMargins(0, 0, 0, 0)
-            path_layout.addWidget(path_title)
-            path_layout.addWidget(path_content)
-            path_container.setLayout(path_layout)
-            layout.addWidget(path_container)
-            
-            # 添加弹性空间
-            layout.addStretch(1)
-            
-            # 按钮布局
-            button_layout = QHBoxLayout()
-            button_layout.setSpacing(12)
-            button_layout.addStretch(1)
-            
-            # 确定按钮
-            ok_button = QPushButton("确定")
-            ok_button.setFixedSize(90, 36)
-            ok_button.clicked.connect(dialog.accept)
-            ok_button.setStyleSheet("""
-                QPushButton {
-                    background-color: #6c757d;
-                    color: #ffffff;
-                    border: 1px solid #6c757d;
-                    border-radius: 6px;
-                    padding: 1px 8px;
-                    font-family: "Microsoft YaHei", sans-serif;
-                    font-size: 13px;
-                    font-weight: 400;
-                }
-                QPushButton:hover {
-                    background-color: #5a6268;
-                    border: 1px solid #5a6268;
-                }
-                QPushButton:pressed {
-                    background-color: #545b62;
-                    border: 1px solid #545b62;
-                }
-            """)
-            button_layout.addWidget(ok_button)
-            
-            # 打开文件夹按钮
-            open_button = QPushButton("📂 打开文件夹")
-            open_button.setFixedSize(120, 36)
-            open_button.clicked.connect(lambda: self.open_save_path_and_close(dialog))
-            open_button.setStyleSheet("""
-                QPushButton {
-                    background-color: #007bff;
-                    color: #ffffff;
-                    border: 1px solid #007bff;
-                    border-radius: 6px;
-                    padding: 1px 8px;
-                    font-family: "Microsoft YaHei", sans-serif;
-                    font-size: 13px;
-                    font-weight: 400;
-                }
-                QPushButton:hover {
-                    background-color: #0056b3;
-                    border: 1px solid #0056b3;
-                }
-                QPushButton:pressed {
-                    background-color: #004085;
-                    border: 1px solid #004085;
-                }
-            """)
-            button_layout.addWidget(open_button)
-            
-            button_layout.addStretch(1)
-            layout.addLayout(button_layout)
+            dialog = self._completion_dialog
+            if dialog is None:
+                dialog = self._build_completion_dialog()
             
-            dialog.setLayout(layout)
-            
-            # 设置默认按钮
-            ok_button.setDefault(True)
-            ok_button.setFocus()
+            # 只更新保存路径
+            self._completion_path_label.setText(self.save_path)
+            self._completion_ok_button.setFocus()
             
             # 显示对话框
             logger.info("显示下载完成对话框")
             dialog.exec_()
             
-            # 重置下载状态
+            # 重置下载状态（下载状态已在完成批处理时刷新，关闭对话框后无需再次扫描）
             self.reset_download_state()
             
-            # 刷新下载状态显示
-            self.refresh_download_status()
-            
         except Exception as e:
             logger.error(f"显示完成对话框失败: {str(e)}")
             # 如果对话框显示失败，至少重置状态
@@ -2479,91 +2783,14 @@ class VideoDownloaderMethods:
         # 防止active_downloads变为负数
         if self.active_downloads > 0:
             self.active_downloads -= 1
+        worker = self.sender()
+        if isinstance(worker, DownloadWorker):
+            self.completed_downloads += 1
         
         # 分析错误类型并提供相应的处理建议
-        error_lower = error_msg.lower()
-        
-        # 定义错误类型和建议
-        error_types = {
-            "network": {
-                "keywords": ["timeout", "connection", "network", "unreachable", "refused"],
-                "title": "网络连接问题",
-                "message": "网络连接出现问题，请检查网络设置",
-                "suggestions": [
-                    "检查网络连接是否正常",
-                    "尝试切换网络环境",
-                    "检查防火墙设置",
-                    "稍后重试下载"
-                ]
-            },
-            "incomplete": {
-                "keywords": ["bytes read", "more expected", "incomplete", "partial"],
-                "title": "下载不完整",
-                "message": "文件下载不完整，可能因网络中断导致",
-                "suggestions": [
-                    "检查网络连接稳定性",
-                    "尝试重新下载",
-                    "降低下载速度限制",
-                    "使用断点续传功能"
-                ]
-            },
-            "format": {
-                "keywords": ["format", "codec", "unsupported", "invalid"],
-                "title": "格式不支持",
-                "message": "文件格式或编解码器不被支持",
-                "suggestions": [
-                    "选择其他视频格式",
-                    "更新FFmpeg版本",
-                    "检查视频源是否正常",
-                    "尝试不同的分辨率"
-                ]
-            },
-            "permission": {
-                "keywords": ["permission", "access denied", "forbidden", "unauthorized"],
-                "title": "权限不足",
-                "message": "没有足够的权限访问资源",
-                "suggestions": [
-                    "检查文件保存路径权限",
-                    "以管理员身份运行程序",
-                    "更换保存目录",
-                    "检查磁盘空间"
-                ]
-            },
-            "server": {
-                "keywords": ["server", "404", "500", "not found", "unavailable"],
-                "title": "服务器问题",
-                "message": "视频服务器暂时不可用",
-                "suggestions": [
-                    "稍后重试下载",
-                    "检查视频链接是否有效",
-                    "尝试其他下载源",
-                    "联系技术支持"
-                ]
-            }
-        }
-        
-        # 识别错误类型
-        error_type = None
-        for etype, config in error_types.items():
-            if any(keyword in error_lower for keyword in config["keywords"]):
-                error_type = etype
-                break
-        
-        # 如果没有匹配到特定类型，使用通用错误
-        if error_type is None:
-            error_type = "general"
-            error_config = {
-                "title": "下载失败",
-                "message": "下载过程中出现未知错误",
-                "suggestions": [
-                    "检查网络连接",
-                    "尝试重新下载",
-                    "重启应用程序",
-                    "联系技术支持"
-                ]
-            }
-        else:
-            error_config = error_types[error_type]
+        match = _RE_ERROR_TYPE.search(error_msg)
+        error_type = match.lastgroup if match else "general"
+        error_config = _ERROR_TYPES.get(error_type, _ERROR_GENERAL)
         
         # 记录详细错误信息
         logger.error(f"下载错误 [{error_type}]: {error_msg}")
@@ -2576,15 +2803,10 @@ class VideoDownloaderMethods:
         except Exception as e:
             logger.error(f"播放错误声音失败: {e}")
         
-        # 创建友好的错误消息
-        friendly_message = f"{error_config['message']}\n\n💡 解决建议：\n"
-        for i, suggestion in enumerate(error_config["suggestions"], 1):
-            friendly_message += f"{i}. {suggestion}\n"
-        
         # 显示用户友好的错误对话框
         msg_box = QMessageBox(self)
         msg_box.setWindowTitle(error_config["title"])
-        msg_box.setText(friendly_message)
+        msg_box.setText(_FRIENDLY_ERROR_MESSAGES[error_type])
         msg_box.setIcon(QMessageBox.Warning)
         msg_box.setStandardButtons(QMessageBox.Ok)
         msg_box.exec_()
@@ -2601,15 +2823,27 @@ class VideoDownloaderMethods:
     
     def _process_download_queue(self) -> None:
         """处理下载队列中的任务"""
+        queue = self.download_queue
+        # 按空闲槽位一次取出一批任务，不再每启动一个就重新检查并发上限；
+        # 启动失败空出的槽位由下一次进度刷新时的队列处理补上
+        slots = min(Config.MAX_CONCURRENT_DOWNLOADS - self.active_downloads, len(queue))
+        if slots <= 0:
+            return
+        popleft = queue.popleft
+        batch = [popleft() for _ in range(slots)]
+        start = self.start_download
+        started = 0
         try:
-            while len(self.download_queue) > 0 and self.active_downloads < Config.MAX_CONCURRENT_DOWNLOADS:
-                url, fmt = self.download_queue.popleft()
+            for url, fmt in batch:
                 # 对于网易云音乐，使用原始URL而不是队列中的URL
                 download_url = fmt.get("original_url", url) if fmt.get("type") == "netease_music" else url
-                self.start_download(download_url, fmt)
+                started += 1
+                start(download_url, fmt)
                 logger.info(f"从队列启动下载: {fmt.get('title', '未知标题')}")
         except Exception as e:
             logger.error(f"处理下载队列失败: {str(e)}")
+            # 尚未启动的任务放回队首，保持原有顺序
+            queue.extendleft(reversed(batch[started:]))
 
     def pause_downloads(self) -> None:
         """暂停下载"""
@@ -2625,33 +2859,29 @@ class VideoDownloaderMethods:
             self.status_scroll_label.setText("")
 
     def cancel_downloads(self) -> None:
-        """取消所有下载"""
-        msg_box = QMessageBox()
-        msg_box.setWindowTitle("确认")
-        msg_box.setText(tr("messages.confirm_stop_downloads"))
-        msg_box.setIcon(QMessageBox.Question)
-        msg_box.setStandardButtons(QMessageBox.Yes | QMessageBox.No)
-        msg_box.setDefaultButton(QMessageBox.No)
-        # 设置按钮中文文本
-        msg_box.button(QMessageBox.Yes).setText(tr("messages.yes"))
-        msg_box.button(QMessageBox.No).setText(tr("messages.no"))
-        reply = msg_box.exec_()
+        """取消所有下载（非模态确认，确认框只创建一次）"""
+        msg_box = self._cancel_downloads_box
+        if msg_box is None:
+            msg_box = self._create_confirm_box(tr("messages.confirm_stop_downloads"), self._on_cancel_downloads_confirmed)
+            self._cancel_downloads_box = msg_box
+        elif msg_box.isVisible():
+            return
+        msg_box.open()
+    
+    def _on_cancel_downloads_confirmed(self, reply: int) -> None:
+        """取消下载确认框关闭后的处理"""
         if reply == QMessageBox.Yes:
-            # 立即取消所有下载工作线程
-            for worker in self.download_workers:
-                if worker.isRunning():
-                    worker.cancel()
-                    # 强制终止线程，确保立即停止
-                    worker.terminate()
-                    worker.wait(1000)  # 等待最多1秒
-            
-            # 取消网易云音乐解析工作线程
-            for worker in self.netease_music_workers:
-                if worker.isRunning():
-                    worker.cancel()
-                    # 强制终止线程
-                    worker.terminate()
-                    worker.wait(1000)  # 等待最多1秒
+            # 立即取消所有下载工作线程和网易云音乐解析工作线程：
+            # 先全部发出取消和终止请求，再共用一个1秒的等待期限，
+            # 总等待时间不再随线程数量增长
+            workers = [w for w in chain(self.download_workers, self.netease_music_workers) if w.isRunning()]
+            for worker in workers:
+                worker.cancel()
+                # 强制终止线程，确保立即停止
+                worker.terminate()
+            deadline = time.monotonic() + 1.0
+            for worker in workers:
+                worker.wait(max(0, int((deadline - time.monotonic()) * 1000)))
             
             # 清空下载队列
             self.download_queue.clear()
@@ -2667,6 +2897,7 @@ class VideoDownloaderMethods:
         self.download_progress.clear()
         self.is_downloading = False
         self.active_downloads = 0
+        self.completed_downloads = 0
         self.download_workers.clear()
         # 清理网易云音乐工作线程
         self.netease_music_workers.clear()
@@ -2677,41 +2908,54 @@ class VideoDownloaderMethods:
         self.progress_bar.setVisible(False)
         self.status_label.setVisible(False)
         self.smart_download_button.setText(tr("main_window.download"))
-        self.smart_download_button.setStyleSheet(self.default_style)
+        # 多条错误/取消路径会连续调用，样式表未变化时跳过重新解析
+        if self.smart_download_button.styleSheet() != self.default_style:
+            self.smart_download_button.setStyleSheet(self.default_style)
         self.smart_pause_button.setText(tr("main_window.pause"))
 
-    def show_context_menu(self, pos: "QPoint") -> None:
-        """显示右键菜单"""
-        from PyQt5.QtWidgets import QApplication
+    def _build_format_tree_menu(self) -> QMenu:
+        """创建格式树右键菜单（只创建一次）"""
         menu = QMenu(self)
+        style = self.style()
+        
+        # 预览视频选项
+        self._preview_action = menu.addAction(tr("preview.preview_video"))
+        self._preview_action.setIcon(style.standardIcon(style.SP_MediaPlay))
+        
+        menu.addSeparator()
+        
+        # 复制文件名选项
+        self._copy_filename_action = menu.addAction(tr("preview.copy_filename"))
+        self._copy_filename_action.setIcon(style.standardIcon(style.SP_FileDialogDetailedView))
         
+        # 复制链接选项
+        self._copy_url_action = menu.addAction(tr("preview.copy_url"))
+        self._copy_url_action.setIcon(style.standardIcon(style.SP_FileLinkIcon))
+        
+        self._format_tree_menu = menu
+        return menu
+
+    def show_context_menu(self, pos: "QPoint") -> None:
+        """显示右键菜单"""
         # 获取当前选中的项目
         item = self.format_tree.itemAt(pos)
         if item and item.childCount() == 0:  # 只对格式项显示菜单
-            # 预览视频选项
-            preview_action = menu.addAction(tr("preview.preview_video"))
-            preview_action.setIcon(self.style().standardIcon(self.style().SP_MediaPlay))
-            
-            menu.addSeparator()
-            
-            # 复制文件名选项
-            copy_action = menu.addAction(tr("preview.copy_filename"))
-            copy_action.setIcon(self.style().standardIcon(self.style().SP_FileDialogDetailedView))
-            
-            # 复制链接选项
-            copy_url_action = menu.addAction(tr("preview.copy_url"))
-            copy_url_action.setIcon(self.style().standardIcon(self.style().SP_FileLinkIcon))
+            menu = self._format_tree_menu
+            if menu is None:
+                menu = self._build_format_tree_menu()
             
             # 执行菜单
             action = menu.exec_(self.format_tree.mapToGlobal(pos))
             
-            if action == preview_action:
+            if action is None:
+                return
+            if action == self._preview_action:
                 self._preview_video_from_item(item)
-            elif action == copy_action:
+            elif action == self._copy_filename_action:
                 filename = item.text(1)
                 QApplication.clipboard().setText(filename)
                 logger.info(f"已复制文件名: {filename}")
-            elif action == copy_url_action:
+            elif action == self._copy_url_action:
                 self._copy_url_from_item(item)
     
     def _preview_video_from_item(self, item) -> None:
@@ -2724,7 +2968,6 @@ class VideoDownloaderMethods:
                 return
             
             # 打开预览
-            from ..core.preview_manager import preview_manager
             success = preview_manager.open_preview(format_info, self)
             
             if success:
@@ -2750,30 +2993,27 @@ class VideoDownloaderMethods:
             
             logger.debug(f"从树形控件获取: description={description}, ext={ext}, filesize={filesize_text}")
             
-            # 从格式列表中查找匹配的格式
-            for fmt in self.formats:
-                # 直接使用格式数据中的description字段进行匹配
-                fmt_description = fmt.get("description", "")
-                
-                if fmt_description == description:
-                    # 创建预览用的格式信息
-                    preview_info = {
-                        "title": getattr(self, 'current_video_title', '') or "未知视频",
-                        "description": description,
-                        "filename": filename,
-                        "format": fmt.get("format", ""),
-                        "ext": ext,
-                        "filesize": fmt.get("filesize", 0),
-                        "url": fmt.get("url", ""),
-                        "download_url": fmt.get("url", ""),
-                        "webpage_url": getattr(self, 'current_url', ''),
-                        "original_url": getattr(self, 'current_url', '')
-                    }
-                    logger.debug(f"找到匹配格式: {preview_info}")
-                    return preview_info
-            
-            logger.warning(f"没有找到匹配的格式: description={description}")
-            return None
+            # 从格式索引中查找匹配的格式（使用格式数据中的description字段进行匹配）
+            fmt = self._formats_by_desc.get(description)
+            if fmt is None:
+                logger.warning(f"没有找到匹配的格式: description={description}")
+                return None
+            
+            # 创建预览用的格式信息
+            preview_info = {
+                "title": getattr(self, 'current_video_title', '') or "未知视频",
+                "description": description,
+                "filename": filename,
+                "format": fmt.get("format", ""),
+                "ext": ext,
+                "filesize": fmt.get("filesize", 0),
+                "url": fmt.get("url", ""),
+                "download_url": fmt.get("url", ""),
+                "webpage_url": getattr(self, 'current_url', ''),
+                "original_url": getattr(self, 'current_url', '')
+            }
+            logger.debug(f"找到匹配格式: {preview_info}")
+            return preview_info
             
         except Exception as e:
             logger.error(f"获取格式信息失败: {e}")
@@ -2784,7 +3024,6 @@ class VideoDownloaderMethods:
         try:
             format_info = self._get_format_info_from_item(item)
             if format_info and format_info.get("url"):
-                from PyQt5.QtWidgets import QApplication
                 QApplication.clipboard().setText(format_info["url"])
                 logger.info(f"已复制URL: {format_info['url']}")
             else:
@@ -2801,15 +3040,15 @@ class VideoDownloaderMethods:
                 logger.warning("预览视频信息中没有找到URL")
                 return
             
-            # 在格式列表中查找匹配的格式
-            for fmt in self.formats:
-                if fmt.get("url") == url:
-                    # 自动选择该格式
-                    self._select_format_for_download(fmt)
-                    logger.info(f"已选择格式进行下载: {fmt.get('description', 'Unknown')}")
-                    return
+            # 在格式索引中查找匹配的格式
+            fmt = self._formats_by_url.get(url)
+            if fmt is None:
+                logger.warning("没有找到匹配的格式进行下载")
+                return
             
-            logger.warning("没有找到匹配的格式进行下载")
+            # 自动选择该格式
+            self._select_format_for_download(fmt)
+            logger.info(f"已选择格式进行下载: {fmt.get('description', 'Unknown')}")
             
         except Exception as e:
             logger.error(f"从预览下载视频失败: {e}")
@@ -2820,76 +3059,88 @@ class VideoDownloaderMethods:
             # 清空现有选择
             self.format_tree.clearSelection()
             
-            # 查找对应的树形控件项目
-            for i in range(self.format_tree.topLevelItemCount()):
-                type_group = self.format_tree.topLevelItem(i)
-                for j in range(type_group.childCount()):
-                    format_item = type_group.child(j)
-                    if format_item.text(0) == format_info.get("description", ""):
-                        # 选择该项目
-                        format_item.setCheckState(0, Qt.Checked)
-                        format_item.setSelected(True)
-                        self.format_tree.scrollToItem(format_item)
-                        logger.info(f"已选择格式: {format_info.get('description', 'Unknown')}")
-                        return
-            
-            logger.warning("没有找到对应的格式项目")
+            # 格式信息中登记了对应的树形控件项目，否则按描述从索引中查找
+            format_item = format_info.get("item")
+            if format_item is None:
+                indexed = self._formats_by_desc.get(format_info.get("description", ""))
+                format_item = indexed.get("item") if indexed else None
+            if format_item is None:
+                logger.warning("没有找到对应的格式项目")
+                return
+            
+            # 选择该项目
+            format_item.setCheckState(0, Qt.Checked)
+            format_item.setSelected(True)
+            self.format_tree.scrollToItem(format_item)
+            logger.info(f"已选择格式: {format_info.get('description', 'Unknown')}")
             
         except Exception as e:
             logger.error(f"选择格式失败: {e}")
 
-    def show_url_input_context_menu(self, pos: "QPoint") -> None:
-        """显示输入框右键菜单（中文）"""
-        from PyQt5.QtWidgets import QApplication
+    def _build_url_input_menu(self) -> QMenu:
+        """创建输入框右键菜单（只创建一次）"""
         menu = QMenu(self)
-        
-        # 获取当前选中的文本
-        cursor = self.url_input.textCursor()
-        has_selection = cursor.hasSelection()
-        has_text = not self.url_input.toPlainText().strip() == ""
+        url_input = self.url_input
         
         # 撤销
-        undo_action = menu.addAction("撤销")
-        undo_action.setEnabled(self.url_input.document().isUndoAvailable())
-        undo_action.triggered.connect(self.url_input.undo)
+        self._undo_action = menu.addAction("撤销")
+        self._undo_action.triggered.connect(url_input.undo)
         
         # 重做
-        redo_action = menu.addAction("重做")
-        redo_action.setEnabled(self.url_input.document().isRedoAvailable())
-        redo_action.triggered.connect(self.url_input.redo)
+        self._redo_action = menu.addAction("重做")
+        self._redo_action.triggered.connect(url_input.redo)
         
         menu.addSeparator()
         
         # 剪切
-        cut_action = menu.addAction("剪切")
-        cut_action.setEnabled(has_selection)
-        cut_action.triggered.connect(self.url_input.cut)
+        self._cut_action = menu.addAction("剪切")
+        self._cut_action.triggered.connect(url_input.cut)
         
         # 复制
-        copy_action = menu.addAction("复制")
-        copy_action.setEnabled(has_selection)
-        copy_action.triggered.connect(self.url_input.copy)
+        self._copy_action = menu.addAction("复制")
+        self._copy_action.triggered.connect(url_input.copy)
         
         # 粘贴
         paste_action = menu.addAction("粘贴")
-        paste_action.triggered.connect(self.url_input.paste)
+        paste_action.triggered.connect(url_input.paste)
         
         # 删除
-        delete_action = menu.addAction("删除")
-        delete_action.setEnabled(has_selection)
-        delete_action.triggered.connect(lambda: self.url_input.textCursor().removeSelectedText())
+        self._delete_action = menu.addAction("删除")
+        self._delete_action.triggered.connect(lambda: url_input.textCursor().removeSelectedText())
         
         menu.addSeparator()
         
         # 全选
-        select_all_action = menu.addAction("全选")
-        select_all_action.setEnabled(has_text)
-        select_all_action.triggered.connect(self.url_input.selectAll)
+        self._select_all_action = menu.addAction("全选")
+        self._select_all_action.triggered.connect(url_input.selectAll)
         
         # 清空
-        clear_action = menu.addAction("清空")
-        clear_action.setEnabled(has_text)
-        clear_action.triggered.connect(self.url_input.clear)
+        self._clear_action = menu.addAction("清空")
+        self._clear_action.triggered.connect(url_input.clear)
+        
+        self._url_input_menu = menu
+        return menu
+
+    def show_url_input_context_menu(self, pos: "QPoint") -> None:
+        """显示输入框右键菜单（中文）"""
+        menu = self._url_input_menu
+        if menu is None:
+            menu = self._build_url_input_menu()
+        
+        # 获取当前选中的文本
+        cursor = self.url_input.textCursor()
+        has_selection = cursor.hasSelection()
+        has_text = not self.url_input.toPlainText().strip() == ""
+        document = self.url_input.document()
+        
+        # 每次显示只根据当前状态切换可用性
+        self._undo_action.setEnabled(document.isUndoAvailable())
+        self._redo_action.setEnabled(document.isRedoAvailable())
+        self._cut_action.setEnabled(has_selection)
+        self._copy_action.setEnabled(has_selection)
+        self._delete_action.setEnabled(has_selection)
+        self._select_all_action.setEnabled(has_text)
+        self._clear_action.setEnabled(has_text)
         
         # 显示菜单
         menu.exec_(self.url_input.mapToGlobal(pos))
@@ -2897,113 +3148,114 @@ class VideoDownloaderMethods:
     def smart_select_action(self) -> None:
         """智能选择按钮动作"""
         if not self.formats:
-                return
-            
-        # 统计当前选择状态
-        selected_count = 0
-        total_count = 0
-            
-        for i in range(self.format_tree.topLevelItemCount()):
-            root_item = self.format_tree.topLevelItem(i)
-            if root_item.childCount() > 0:
-                # 有子项的项目（视频等）
-                for j in range(root_item.childCount()):
-                    total_count += 1
-                    if root_item.child(j).checkState(0) == Qt.Checked:
-                        selected_count += 1
-            else:
-                # 没有子项的项目（网易云音乐等）
-                total_count += 1
-                if root_item.checkState(0) == Qt.Checked:
-                    selected_count += 1
-            
-        # 根据当前状态决定动作
+            return
+        
+        # 还有未处理的复选框变化时先统计，保证计数是最新的
+        if self._selection_count_pending:
+            self._flush_selection_count()
+        selected_count, total_count = self._sel_selected, self._sel_total
+        
+        # 根据当前状态决定动作（按钮文本随计数一起更新）
         if selected_count == 0:
             # 没有选中任何项，执行全选
             self.select_all_formats()
-            self.smart_select_button.setText(tr("main_window.deselect_all"))
         elif selected_count == total_count:
             # 全部选中，执行取消全选
             self.deselect_all_formats()
-            self.smart_select_button.setText(tr("main_window.select_all"))
         else:
             # 部分选中，执行反选
             self.invert_selection()
-            # 反选后重新判断状态
-            self.update_smart_select_button_text()
     
     def update_smart_select_button_text(self) -> None:
         """更新智能选择按钮文本"""
         if not self.formats:
             return
-            
-        selected_count = 0
-        total_count = 0
-        
-        for i in range(self.format_tree.topLevelItemCount()):
-            root_item = self.format_tree.topLevelItem(i)
-            if root_item.childCount() > 0:
-                # 有子项的项目（视频等）
-                for j in range(root_item.childCount()):
-                    total_count += 1
-                    if root_item.child(j).checkState(0) == Qt.Checked:
-                        selected_count += 1
-            else:
-                # 没有子项的项目（网易云音乐等）
-                total_count += 1
-                if root_item.checkState(0) == Qt.Checked:
-                    selected_count += 1
         
+        selected_count, total_count = self._sel_selected, self._sel_total
         if selected_count == 0:
-            self.smart_select_button.setText(tr("main_window.select_all"))
+            self.smart_select_button.setText(self._tr_select_all)
         elif selected_count == total_count:
-            self.smart_select_button.setText(tr("main_window.deselect_all"))
+            self.smart_select_button.setText(self._tr_deselect_all)
         else:
-            self.smart_select_button.setText(tr("main_window.invert_selection"))
+            self.smart_select_button.setText(self._tr_invert_selection)
     
 
     def refresh_download_status(self) -> None:
-        """刷新所有文件的下载状态"""
+        """刷新所有文件的下载状态（合并窗口内的多次调用只扫描一次目录）"""
+        self._status_refresh_timer.start()
+    
+    def _start_status_scan(self) -> None:
+        """在线程池中重新扫描保存目录"""
+        worker = DirScanWorker(self.save_path)
+        worker.signals.finished.connect(self._on_status_scan_finished)
+        # 保持信号对象引用，防止在回调前被回收
+        self._status_scan_signals = worker.signals
+        QThreadPool.globalInstance().start(worker)
+    
+    def _on_status_scan_finished(self, directory: str, existing_files: set) -> None:
+        """目录扫描完成（主线程），批量更新各项的下载状态"""
+        if self.sender() is not self._status_scan_signals or directory != self.save_path:
+            # 已有更新的扫描任务，或保存路径已变更
+            return
+        self._status_scan_signals = None
+        self._existing_files = existing_files
+        
+        tree = self.format_tree
+        tree.setUpdatesEnabled(False)
+        prev_blocked = tree.blockSignals(True)
+        try:
+            self._apply_download_status(existing_files)
+        finally:
+            tree.blockSignals(prev_blocked)
+            tree.setUpdatesEnabled(True)
+    
+    def _apply_download_status(self, existing_files: set) -> None:
+        """根据保存目录中的文件名集合更新所有文件的下载状态"""
         try:
             logger.info("开始刷新下载状态...")
             updated_count = 0
             
-            # 遍历所有树形项目，更新状态
-            for i in range(self.format_tree.topLevelItemCount()):
-                root_item = self.format_tree.topLevelItem(i)
-                for j in range(root_item.childCount()):
-                    child_item = root_item.child(j)
-                    item_filename = child_item.text(1)  # 文件名在第1列
-                    item_type = child_item.text(2)      # 文件类型在第2列
-                    
-                    # 构建完整的文件路径
-                    file_path = os.path.join(self.save_path, f"{item_filename}.{item_type}")
-                    
-                    # 检查文件是否存在
-                    if os.path.exists(file_path):
-                        # 文件已下载，显示tr("main_window.downloaded")
-                        old_status = child_item.text(4)
-                        child_item.setText(4, tr("main_window.downloaded"))
-                        child_item.setForeground(4, Qt.green)
-                        # 禁用已下载文件的复选框，防止重复下载
-                        child_item.setFlags(child_item.flags() & ~Qt.ItemIsUserCheckable)
-                        
-                        if old_status != tr("main_window.downloaded"):
-                            logger.info(f"文件状态更新为已下载: {item_filename}.{item_type}")
-                            updated_count += 1
-                    else:
-                        # 文件未下载，显示tr("main_window.not_downloaded")
-                        old_status = child_item.text(4)
-                        child_item.setText(4, tr("main_window.not_downloaded"))
-                        child_item.setForeground(4, Qt.black)
-                        # 启用未下载文件的复选框
-                        child_item.setFlags(child_item.flags() | Qt.ItemIsUserCheckable)
-                        
-                        if old_status != tr("main_window.not_downloaded"):
-                            logger.info(f"文件状态更新为未下载: {item_filename}.{item_type}")
-                            updated_count += 1
+            # 逐项判断改为集合查找，不再逐个 stat
+            normcase = os.path.normcase
+            
+            # 循环中用到的文本、画刷和标志位绑定为局部变量
+            downloaded_str = self._tr_downloaded
+            not_downloaded_str = self._tr_not_downloaded
+            brush_downloaded = self._brush_downloaded
+            brush_not_downloaded = self._brush_not_downloaded
             
-            logger.info(f"下载状态刷新完成，更新了 {updated_count} 个文件的状态")
+            # 直接遍历已登记的格式项，不再逐个分组查找子项；
+            # 没有父节点的项目（网易云音乐等）不在此处更新
+            for format_info in self._item_to_format.values():
+                child_item = format_info["item"]
+                if child_item.parent() is None:
+                    continue
+                item_filename = child_item.text(1)  # 文件名在第1列
+                item_type = child_item.text(2)      # 文件类型在第2列
+                
+                # 检查文件是否存在
+                downloaded = normcase(f"{item_filename}.{item_type}") in existing_files
+                new_status = downloaded_str if downloaded else not_downloaded_str
+                if child_item.text(4) == new_status:
+                    # 状态未变化，文本、颜色和复选框都已是正确的
+                    continue
+                
+                child_item.setText(4, new_status)
+                if downloaded:
+                    # 文件已下载，显示tr("main_window.downloaded")
+                    child_item.setForeground(4, brush_downloaded)
+                    # 禁用已下载文件的复选框，防止重复下载
+                    child_item.setFlags(_FLAGS_DOWNLOADED)
+                    logger.debug("文件状态更新为已下载: %s.%s", item_filename, item_type)
+                else:
+                    # 文件未下载，显示tr("main_window.not_downloaded")
+                    child_item.setForeground(4, brush_not_downloaded)
+                    # 启用未下载文件的复选框
+                    child_item.setFlags(_FLAGS_CHECKABLE)
+                    logger.debug("文件状态更新为未下载: %s.%s", item_filename, item_type)
+                updated_count += 1
+            
+            logger.info("下载状态刷新完成，更新了 %d 个文件的状态", updated_count)
                         
         except Exception as e:
             logger.error(f"刷新下载状态失败: {str(e)}")
@@ -3055,11 +3307,13 @@ class VideoDownloaderMethods:
             
             if reply == QMessageBox.Yes:
                 # 清空格式树
-                self.format_tree.clear()
+                self._clear_format_tree()
                 
                 # 清空相关数据
                 self.formats = []
+                self._rebuild_format_indices()
                 self.parse_cache.clear()
+                get_thumbnail_loader().clear_pending()
                 
                 # 重置按钮状态
                 self.smart_download_button.setEnabled(False)
@@ -3075,15 +3329,16 @@ class VideoDownloaderMethods:
                 # 记录日志
                 logger.info("用户清空了列表")
                 
-        except Exception as e:
-            logger.error(f"清空列表失败: {str(e)}")
+        except Exception:
+            logger.exception("清空列表失败")
             QMessageBox.critical(self, "操作失败", "清空列表失败，请稍后重试")
         
     def new_session(self) -> None:
         """新建会话"""
         self.url_input.clear()
-        self.format_tree.clear()
+        self._clear_format_tree()
         self.formats = []
+        self._rebuild_format_indices()
         self.smart_download_button.setEnabled(False)
         self.smart_select_button.setEnabled(False)
         self.selection_count_label.setText(tr("main_window.selected_count").format(count=0))
@@ -3094,9 +3349,13 @@ class VideoDownloaderMethods:
         
     def show_settings_dialog(self) -> None:
         """显示设置对话框"""
-        from .settings_dialog import SettingsDialog
-        
-        dialog = SettingsDialog(self)
+        dialog = self._settings_dialog
+        if dialog is None:
+            from .settings_dialog import SettingsDialog
+            dialog = self._settings_dialog = SettingsDialog(self)
+        else:
+            # 复用已创建的对话框，重新读取设置以丢弃上次取消的修改
+            dialog.load_settings()
         if dialog.exec_() == QDialog.Accepted:
             # 应用设置到主窗口
             self.apply_settings_from_dialog(dialog.get_settings_dict())
@@ -3106,10 +3365,9 @@ class VideoDownloaderMethods:
         try:
             # 应用基本设置
             if settings_dict.get("save_path"):
-                self.save_path = settings_dict["save_path"]
-                # 如果 path_label 已存在，则更新其文本
-                if hasattr(self, 'path_label'):
-                    self.path_label.setText(f"保存路径: {self.save_path}")
+                self._set_save_path(settings_dict["save_path"])
+                # 设置对话框已写入 QSettings
+                self._loaded_save_path = self.save_path
                 
             # 应用下载设置
             if "max_concurrent" in settings_dict:
@@ -3134,18 +3392,16 @@ class VideoDownloaderMethods:
                 
             logger.info("设置已应用到主窗口")
 
-        except Exception as e:
-            logger.error(f"应用设置失败: {str(e)}")
+        except Exception:
+            logger.exception("应用设置失败")
             
     def update_font_size(self, font_size: int) -> None:
         """更新全局字体大小"""
         try:
-            # 更新样式表中的字体大小
-            current_style = self.styleSheet()
             # 这里可以添加动态更新字体大小的逻辑
-            logger.info(f"字体大小已更新为: {font_size}px")
-        except Exception as e:
-            logger.error(f"更新字体大小失败: {str(e)}")
+            logger.info("字体大小已更新为: %dpx", font_size)
+        except Exception:
+            logger.exception("更新字体大小失败")
         
     
         
@@ -3167,14 +3423,15 @@ class VideoDownloaderMethods:
         
     def show_help_dialog(self) -> None:
         """显示使用说明对话框"""
-        from .simple_help_dialog import SimpleHelpDialog
-        
-        dialog = SimpleHelpDialog(self)
+        dialog = self._help_dialog
+        if dialog is None:
+            from .simple_help_dialog import SimpleHelpDialog
+            dialog = self._help_dialog = SimpleHelpDialog(self)
         dialog.exec_()
         
-    def show_shortcuts_dialog(self) -> None:
-        """显示快捷键帮助对话框"""
-        shortcuts_text = """
+    def _build_shortcuts_dialog(self) -> QDialog:
+        """创建快捷键帮助对话框（每种界面语言只创建一次）"""
+        shortcuts_text = f"""
         <div style="font-family: 'Microsoft YaHei', sans-serif; line-height: 1.6;">
             <h2 style="color: #007bff; margin-bottom: 20px;">⌨️ 快捷键参考</h2>
             
@@ -3375,14 +3632,27 @@ class VideoDownloaderMethods:
         
         dialog.setLayout(layout)
         
+        self._shortcuts_dialog = dialog
+        return dialog
+    
+    def show_shortcuts_dialog(self) -> None:
+        """显示快捷键帮助对话框"""
+        dialog = self._shortcuts_dialog
+        if dialog is None:
+            dialog = self._build_shortcuts_dialog()
         dialog.exec_()
         
     def show_feedback_dialog(self) -> None:
         """显示问题反馈对话框"""
         try:
-            from .feedback_dialog import FeedbackDialog
-            dialog = FeedbackDialog(self)
-            dialog.exec_()
+            dialog = self._feedback_dialog
+            if dialog is None:
+                from .feedback_dialog import FeedbackDialog
+                dialog = self._feedback_dialog = FeedbackDialog(self)
+            if dialog.exec_() == QDialog.Accepted:
+                # 反馈已发送，下次打开时使用空白表单
+                self._feedback_dialog = None
+                dialog.deleteLater()
         except Exception as e:
             QMessageBox.critical(self, "操作失败", "打开反馈对话框失败，请稍后重试")
             logger.error(f"打开反馈对话框失败: {str(e)}")
@@ -3390,8 +3660,13 @@ class VideoDownloaderMethods:
     def show_download_history(self) -> None:
         """显示下载历史对话框"""
         try:
-            from .history_dialog import HistoryDialog
-            dialog = HistoryDialog(self)
+            dialog = self._history_dialog
+            if dialog is None:
+                from .history_dialog import HistoryDialog
+                dialog = self._history_dialog = HistoryDialog(self)
+            elif not (dialog.search_worker and dialog.search_worker.isRunning()):
+                # 复用已创建的对话框，只重新查询历史记录
+                dialog.load_history()
             dialog.exec_()
         except Exception as e:
             QMessageBox.critical(self, "操作失败", "打开下载历史对话框失败，请稍后重试")
@@ -3400,15 +3675,17 @@ class VideoDownloaderMethods:
     def show_subtitle_dialog(self) -> None:
         """显示字幕下载对话框"""
         try:
-            from .subtitle_dialog import SubtitleDialog
-            dialog = SubtitleDialog(self)
+            dialog = self._subtitle_dialog
+            if dialog is None:
+                from .subtitle_dialog import SubtitleDialog
+                dialog = self._subtitle_dialog = SubtitleDialog(self)
             dialog.exec_()
         except Exception as e:
             QMessageBox.critical(self, "操作失败", "打开字幕下载对话框失败，请稍后重试")
             logger.error(f"打开字幕下载对话框失败: {str(e)}")
         
-    def show_about_dialog(self) -> None:
-        """显示关于对话框"""
+    def _build_about_dialog(self) -> QDialog:
+        """创建关于对话框（每种界面语言只创建一次）"""
         about_text = f"""
         <div style="font-family: 'Microsoft YaHei', sans-serif; text-align: left; line-height: 1.6;">
             <div style="margin-bottom: 30px; text-align: center;">
@@ -3584,6 +3861,14 @@ class VideoDownloaderMethods:
         
         dialog.setLayout(layout)
         
+        self._about_dialog = dialog
+        return dialog
+    
+    def show_about_dialog(self) -> None:
+        """显示关于对话框"""
+        dialog = self._about_dialog
+        if dialog is None:
+            dialog = self._build_about_dialog()
         dialog.exec_()
         
     
@@ -3594,185 +3879,116 @@ class VideoDownloaderMethods:
         for worker in self.download_workers:
             if worker.isRunning():
                 worker.cancel()
-        for worker in self.parse_workers:
-            if worker.isRunning():
-                worker.quit()
-                worker.wait()
+        # 先让所有解析线程退出事件循环，再统一等待，退出耗时取最大值而非累加
+        running_parse_workers = [worker for worker in self.parse_workers if worker.isRunning()]
+        for worker in running_parse_workers:
+            worker.quit()
+        for worker in running_parse_workers:
+            worker.wait()
 
-        self.settings.setValue("save_path", self.save_path)
+        if self.save_path != self._loaded_save_path:
+            self.settings.setValue("save_path", self.save_path)
+            self._loaded_save_path = self.save_path
+        # 在窗口关闭前确定性地写入磁盘/注册表
+        self.settings.sync()
         event.accept()
     
-    def _is_video_already_added(self, video_id: str, video_title: str) -> bool:
-        """检查视频是否已经添加到树形控件中"""
-        try:
-            logger.info(f"🔍 检查视频重复: {video_title} (ID: {video_id})")
-            
-            # 提取当前视频的P数信息
-            current_p_match = re.search(r'[Pp](\d+)', video_title)
-            current_p = current_p_match.group(1) if current_p_match else None
-            logger.info(f"  - 当前视频P数: {current_p}")
-            
-            # 遍历所有分辨率分组，检查是否已存在相同标题的视频
-            for i in range(self.format_tree.topLevelItemCount()):
-                root_item = self.format_tree.topLevelItem(i)
-                res_name = root_item.text(0)
-                logger.info(f"  - 检查分辨率分组: {res_name}")
-                
-                for j in range(root_item.childCount()):
-                    child_item = root_item.child(j)
-                    filename = child_item.text(1)  # 文件名在第1列
-                    logger.info(f"    - 已存在文件: {filename}")
-                    
-                    # 对于B站多P视频，需要更精确的匹配
-                    if current_p:
-                        # 提取已存在视频的P数
-                        existing_p_match = re.search(r'[Pp](\d+)', filename)
-                        existing_p = existing_p_match.group(1) if existing_p_match else None
-                        logger.info(f"      - 已存在文件P数: {existing_p}")
-                        
-                        # 如果都有P数，比较P数是否相同
-                        if existing_p and current_p == existing_p:
-                            logger.info(f"❌ 发现重复的P{current_p}视频: {video_title}")
-                            return True
-                        # 如果当前有P数但已存在的没有，或者P数不同，则不是重复
-                        elif existing_p and current_p != existing_p:
-                            logger.info(f"✅ P数不同，不是重复: {current_p} vs {existing_p}")
-                            continue
-                    
-                    # 对于没有P数的视频，使用原来的逻辑
-                    if not current_p:
-                        # 检查文件名是否包含相同的视频标题（去掉分辨率后缀）
-                        if video_title in filename or video_id in filename:
-                            logger.info(f"❌ 发现重复视频（无P数）: {video_title}")
-                            return True
-                        
-                        # 检查是否包含相同的视频ID
-                        if video_id != "unknown" and video_id in filename:
-                            logger.info(f"❌ 发现重复视频ID: {video_id}")
-                            return True
-            
-            logger.info(f"✅ 视频不是重复: {video_title}")
-            return False
-        except Exception as e:
-            logger.error(f"检查视频重复时出错: {e}")
-            return False
-
     def _get_download_options(self, output_file: str) -> Dict:
         """获取统一的下载配置选项"""
         ydl_opts = {
+            **_YDL_BASE_OPTIONS,
             "outtmpl": output_file,
-            "quiet": False,
             "ffmpeg_location": self.ffmpeg_path,
-            
-            # 增强下载稳定性配置
-            "retries": 10,  # 增加重试次数
-            "fragment_retries": 10,  # 增加片段重试次数
-            "extractor_retries": 5,  # 增加提取器重试次数
-            "socket_timeout": 60,  # 增加socket超时时间
-            "http_chunk_size": 10485760,  # 10MB块大小，平衡速度和稳定性
-            "buffersize": 4096,  # 增大缓冲区
-            
-            # 下载恢复和断点续传
-            "continuedl": True,  # 启用断点续传
-            "noprogress": False,  # 显示进度
-            
-            # 错误处理
-            "ignoreerrors": False,  # 不忽略错误，确保错误被正确处理
-            "no_warnings": False,  # 显示警告信息
-            
-            # 网络配置
-            "prefer_insecure": True,  # 优先使用不安全的连接
-            "no_check_certificate": True,  # 不检查证书
-            
-            # 请求头配置
-            "headers": {
-                "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
-                "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
-                "Accept-Language": "en-US,en;q=0.5",
-                "Accept-Encoding": "gzip, deflate",
-                "Connection": "keep-alive",
-            },
+            # 请求头与视频下载相同，复制一份避免 yt-dlp 修改共享模板
+            "headers": dict(_HEADERS_VIDEO),
         }
         
         # 添加速度限制
-        speed_limit = self.speed_limit_input.text().strip()
-        if speed_limit.isdigit():
-            ydl_opts["ratelimit"] = int(speed_limit) * 1024
+        speed_limit = self.speed_limit_input.text()
+        if speed_limit:
+            speed_limit = speed_limit.strip()
+            if speed_limit.isdigit():
+                ydl_opts["ratelimit"] = int(speed_limit) << 10
         
         return ydl_opts
 
     def _check_memory_usage(self) -> None:
-        """检查内存使用情况并执行清理"""
-        # 使用锁确保内存检查的线程安全
-        if not self._memory_lock.acquire(blocking=False):
-            return  # 如果锁被占用，跳过这次检查
-        
+        """按时间间隔在线程池中查询内存使用情况，结果回到主线程后再决定是否清理"""
+        current_time = time.monotonic()
+        if current_time - self._last_memory_check < self._memory_check_interval:
+            return
+        # 上次检查以来几乎没有新分配时，内存不会明显增长，跳过进程内存查询
+        allocated_blocks = sys.getallocatedblocks()
+        self._last_memory_check = current_time
+        if allocated_blocks - self._last_allocated_blocks < _MEMORY_CHECK_MIN_NEW_BLOCKS:
+            return
+        if self._memory_probe_signals is not None:
+            return  # 上一次查询尚未返回
+        self._last_allocated_blocks = allocated_blocks
+        
+        worker = MemoryProbeWorker(self._process)
+        worker.signals.finished.connect(self._on_memory_probed)
+        # 保持信号对象引用，防止在回调前被回收
+        self._memory_probe_signals = worker.signals
+        QThreadPool.globalInstance().start(worker)
+
+    def _on_memory_probed(self, memory_mb: int) -> None:
+        """内存查询完成（主线程），内存过高时执行清理"""
+        self._memory_probe_signals = None
+        if memory_mb < 0:
+            return
         try:
-            current_time = time.time()
-            if current_time - self._last_memory_check < self._memory_check_interval:
-                return
-            
-            self._last_memory_check = current_time
-            
-            # 获取当前进程的内存使用情况
-            process = psutil.Process()
-            memory_info = process.memory_info()
-            memory_mb = memory_info.rss / 1024 / 1024
-            
             # 只在内存使用较高时记录日志
             if memory_mb > Config.MEMORY_WARNING_THRESHOLD * 0.8:  # 80%阈值时开始记录
-                logger.info(f"当前内存使用: {memory_mb:.1f} MB")
+                logger.info("当前内存使用: %d MB", memory_mb)
             
             # 如果内存使用超过警告阈值，执行清理
             if memory_mb > Config.MEMORY_WARNING_THRESHOLD:
-                logger.warning(f"内存使用过高: {memory_mb:.1f} MB，执行清理...")
+                logger.warning("内存使用过高: %d MB，执行清理...", memory_mb)
                 self.cleanup_resources()
                 
-                # 强制垃圾回收
-                gc.collect()
+                # 强制完整垃圾回收，短时间内已回收过则交给自动分代回收
+                current_time = time.monotonic()
+                if current_time - self._last_gc_time >= _GC_MIN_INTERVAL:
+                    gc.collect(2)
+                    self._last_gc_time = current_time
                 
-                # 重新检查内存使用
-                memory_info = process.memory_info()
-                memory_mb_after = memory_info.rss / 1024 / 1024
-                logger.info(f"清理后内存使用: {memory_mb_after:.1f} MB")
+                # 重新检查内存使用（只在告警时发生，直接同步查询）
+                memory_mb_after = self._process.memory_info().rss >> 20
+                logger.info("清理后内存使用: %d MB", memory_mb_after)
                 
                 # 如果清理后内存仍然过高，执行更激进的清理
                 if memory_mb_after > Config.MEMORY_CRITICAL_THRESHOLD:
-                    logger.error(f"内存使用仍然过高: {memory_mb_after:.1f} MB，执行激进清理...")
+                    logger.error("内存使用仍然过高: %d MB，执行激进清理...", memory_mb_after)
                     self._aggressive_cleanup()
                     
         except Exception as e:
             logger.error(f"内存检查失败: {str(e)}")
-        finally:
-            self._memory_lock.release()
 
     def cleanup_resources(self) -> None:
         """清理资源，释放内存"""
         try:
             # 清理解析缓存
             with self._cache_lock:
-                if len(self.parse_cache) > Config.CACHE_LIMIT // 2:
-                    # 保留一半的缓存
-                    items_to_remove = len(self.parse_cache) - Config.CACHE_LIMIT // 2
-                    for _ in range(items_to_remove):
-                        if self.parse_cache:
-                            self.parse_cache.popitem()
+                # 保留一半的缓存，优先淘汰只访问过一次的条目
+                items_to_remove = len(self.parse_cache) - Config.CACHE_LIMIT // 2
+                if items_to_remove > 0:
+                    self.parse_cache.evict(items_to_remove)
             
             # 清理格式列表
             if len(self.formats) > Config.CACHE_LIMIT:
                 self.formats = self.formats[-Config.CACHE_LIMIT:]
+                self._rebuild_format_indices()
             
-            # 清理已完成的工作线程
-            self.parse_workers = [w for w in self.parse_workers if w.isRunning()]
-            self.download_workers = [w for w in self.download_workers if w.isRunning()]
-
+            # 解析和下载线程在退出时已自动移除，这里只清理网易云音乐工作线程
             self.netease_music_workers = [w for w in self.netease_music_workers if w.isRunning()]
             
             # 清理下载进度信息
-            if len(self.download_progress) > 50:  # 限制进度信息数量
-                keys_to_remove = list(self.download_progress.keys())[:-50]
-                for key in keys_to_remove:
-                    self.download_progress.pop(key, None)
+            items_to_remove = len(self.download_progress) - 50  # 限制进度信息数量
+            if items_to_remove > 0:
+                # 只取出最早插入的若干个键，不复制整个键列表
+                for key in list(islice(self.download_progress, items_to_remove)):
+                    del self.download_progress[key]
             
             logger.info("资源清理完成")
             
@@ -3788,140 +4004,184 @@ class VideoDownloaderMethods:
             
             # 清空格式列表
             self.formats.clear()
+            self._item_to_format.clear()
+            self._rebuild_format_indices()
             
             # 清空下载进度
             self.download_progress.clear()
             
-            # 强制终止所有非活动线程
-            for worker in self.parse_workers[:]:
-                if not worker.isRunning():
-                    worker.deleteLater()
-                    self.parse_workers.remove(worker)
-            
-            for worker in self.download_workers[:]:
-                if not worker.isRunning():
-                    worker.deleteLater()
-                    self.download_workers.remove(worker)
-            
-
-            
+            # 解析和下载线程在退出时已自动移除并释放，这里只清理网易云音乐工作线程
             for worker in self.netease_music_workers[:]:
                 if not worker.isRunning():
                     worker.deleteLater()
                     self.netease_music_workers.remove(worker)
             
-            # 多次强制垃圾回收
-            for _ in range(3):
-                gc.collect()
+            # 强制一次完整垃圾回收，连续多次回收不会再释放更多对象
+            gc.collect(2)
+            self._last_gc_time = time.monotonic()
             
             logger.info("激进内存清理完成")
             
         except Exception as e:
             logger.error(f"激进内存清理失败: {str(e)}")
 
-    def _check_disk_space(self, required_size: int = 0) -> bool:
-        """检查磁盘空间是否足够"""
+    def _refresh_disk_space_cache(self) -> None:
+        """查询保存路径的可用空间并写入缓存（可在线程池中执行）"""
+        path = self.save_path
+        free_space = None
         try:
-            if not os.path.exists(self.save_path):
-                return False
-            
-            disk_usage = shutil.disk_usage(self.save_path)
-            free_space = disk_usage.free
-            
-            # 如果指定了所需大小，检查是否足够
-            if required_size > 0:
-                if free_space < required_size:
-                    logger.warning(f"磁盘空间不足: 需要 {required_size} 字节，可用 {free_space} 字节")
-                    return False
-            
-            # 检查是否有至少100MB的可用空间
-            min_space = 100 * 1024 * 1024  # 100MB
-            if free_space < min_space:
-                logger.warning(f"磁盘空间不足: 可用空间 {free_space / 1024 / 1024:.1f} MB")
-                return False
-            
-            return True
-            
+            # disk_usage 在 POSIX 上就是一次 statvfs，路径不存在时直接抛出，无需先 stat 检查
+            free_space = shutil.disk_usage(path).free
+        except FileNotFoundError:
+            pass
         except Exception as e:
             logger.error(f"检查磁盘空间失败: {str(e)}")
+        self._disk_space_cache = (time.monotonic(), path, free_space)
+
+    def _check_disk_space(self, required_size: int = 0) -> bool:
+        """检查磁盘空间是否足够（首次同步查询，之后使用缓存结果并在过期时后台刷新）"""
+        checked_at, path, free_space = self._disk_space_cache
+        if path != self.save_path or checked_at == 0.0:
+            # 尚未查询到当前路径的结果（首次下载或刚切换路径），同步查询一次，避免在磁盘已满时开始下载
+            self._refresh_disk_space_cache()
+            checked_at, path, free_space = self._disk_space_cache
+        elif time.monotonic() - checked_at >= _DISK_SPACE_CACHE_TTL:
+            # 结果已过期：本次仍使用旧值判断，同时在后台刷新
+            QThreadPool.globalInstance().start(self._refresh_disk_space_cache)
+        
+        if free_space is None:
+            # 保存路径不存在或无法获取可用空间
+            return False
+        
+        # 如果指定了所需大小，检查是否足够
+        if required_size > 0:
+            if free_space < required_size:
+                logger.warning(f"磁盘空间不足: 需要 {required_size} 字节，可用 {free_space} 字节")
+                return False
+        
+        # 检查是否有至少100MB的可用空间
+        min_space = 100 * 1024 * 1024  # 100MB
+        if free_space < min_space:
+            logger.warning(f"磁盘空间不足: 可用空间 {free_space / 1024 / 1024:.1f} MB")
             return False
+        
+        return True
 
     def add_formats_to_tree(self) -> None:
         """将格式列表添加到树形控件中显示"""
         if not self.formats:
             logger.warning("没有可用的格式添加到树形控件")
             return
-            
-        logger.info(f"开始添加 {len(self.formats)} 个格式到树形控件")
         
         # 清空现有内容
-        self.format_tree.clear()
+        self._clear_format_tree()
         
         # 按类型分组
-        type_groups = {}
+        type_groups = defaultdict(list)
         for fmt in self.formats:
-            fmt_type = fmt.get("type", "unknown")
-            if fmt_type not in type_groups:
-                type_groups[fmt_type] = []
-            type_groups[fmt_type].append(fmt)
+            type_groups[fmt.get("type", "unknown")].append(fmt)
+        
+        title = getattr(self, 'current_video_title', '') or 'video'
+        not_downloaded = self._tr_not_downloaded
+        brush_not_downloaded = self._brush_not_downloaded
+        icon_play = self._icon_play
+        item_to_format = self._item_to_format
         
-        # 为每种类型创建分组
+        # 先在控件外构建完整的节点树，再一次性挂到控件上，只触发一次重排和重绘
+        top_items = []
         for fmt_type, formats in type_groups.items():
             # 创建类型分组节点
-            type_group = QTreeWidgetItem(self.format_tree)
-            type_group.setFlags(Qt.ItemIsEnabled | Qt.ItemIsUserCheckable)
+            type_group = QTreeWidgetItem([f"{fmt_type.upper()} 格式" if fmt_type else ""])
+            type_group.setFlags(Qt.ItemIsEnabled | Qt.ItemIsUserCheckable | Qt.ItemIsAutoTristate)
             type_group.setCheckState(0, Qt.Unchecked)
-            
-            # 设置类型名称和图标
             if fmt_type:
-                type_group.setText(0, f"{fmt_type.upper()} 格式")
-                type_group.setIcon(0, self.style().standardIcon(self.style().SP_DirIcon))
-            
-            type_group.setExpanded(True)
+                type_group.setIcon(0, self._icon_dir)
             
             # 为每个格式创建子项
+            children = []
             for fmt in formats:
-                # 创建格式项
-                format_item = QTreeWidgetItem(type_group)
-                format_item.setFlags(Qt.ItemIsEnabled | Qt.ItemIsUserCheckable)
-                format_item.setCheckState(0, Qt.Unchecked)
-                
-                # 设置图标
-                format_item.setIcon(0, self.style().standardIcon(self.style().SP_MediaPlay))
-                
-                # 设置文本内容
                 # 生成描述文本：优先使用resolution，如果没有则使用format_id
+                ext = fmt.get("ext", "")
+                ext_upper = ext.upper()
                 resolution = fmt.get("resolution", "")
                 format_id = fmt.get("format_id", "")
                 if resolution and resolution != "audio only":
-                    description = f"{resolution} {fmt.get('ext', '').upper()}"
+                    description = f"{resolution} {ext_upper}"
                 elif format_id:
-                    description = f"{format_id} {fmt.get('ext', '').upper()}"
+                    description = f"{format_id} {ext_upper}"
                 else:
-                    description = f"未知格式 {fmt.get('ext', '').upper()}"
+                    description = f"未知格式 {ext_upper}"
                 
-                ext = fmt.get("ext", "")
-                filesize = fmt.get("filesize", 0)
-                
-                format_item.setText(0, description)  # 第0列：描述
-                format_item.setText(1, f"{getattr(self, 'current_video_title', '') or 'video'}.{ext}")  # 第1列：文件名
-                format_item.setText(2, ext)  # 第2列：文件类型
-                format_item.setText(3, format_size(filesize))  # 第3列：文件大小
-                format_item.setText(4, tr("main_window.not_downloaded"))  # 第4列：状态
-                format_item.setForeground(4, Qt.black)
+                # 列：描述、文件名、文件类型、文件大小、状态
+                format_item = QTreeWidgetItem([
+                    description, f"{title}.{ext}", ext,
+                    format_size(fmt.get("filesize", 0)), not_downloaded,
+                ])
+                format_item.setFlags(_FLAGS_CHECKABLE)
+                format_item.setCheckState(0, Qt.Unchecked)
+                format_item.setIcon(0, icon_play)
+                format_item.setForeground(4, brush_not_downloaded)
                 
                 # 将树形控件项保存到格式信息中
                 fmt["item"] = format_item
-                
-                logger.info(f"添加格式项到树形控件: {description} ({ext}, {format_size(filesize)})")
+                item_to_format[id(format_item)] = fmt
+                children.append(format_item)
+            
+            type_group.addChildren(children)
+            top_items.append(type_group)
+        
+        tree = self.format_tree
+        sorting_enabled = tree.isSortingEnabled()
+        tree.setUpdatesEnabled(False)
+        tree.blockSignals(True)
+        tree.setSortingEnabled(False)
+        try:
+            tree.addTopLevelItems(top_items)
+            # 节点挂到控件上之后才能展开
+            for type_group in top_items:
+                type_group.setExpanded(True)
+        finally:
+            tree.setSortingEnabled(sorting_enabled)
+            tree.blockSignals(False)
+            tree.setUpdatesEnabled(True)
         
-        logger.info(f"成功添加 {len(self.formats)} 个格式到树形控件")
-        self.format_tree.update()
+        logger.info("成功添加 %d 个格式到树形控件", len(self.formats))
     
     def on_language_changed(self, language: str) -> None:
         """处理语言切换"""
         try:
             logger.info(f"语言已切换为: {language}")
+            self._rebuild_tr_cache()
+            self._last_progress_snapshot = None
+            # 缓存的确认框使用旧语言文本，下次使用时重新创建
+            for box in (self._cancel_confirm_box, self._cancel_downloads_box):
+                if box is not None:
+                    box.deleteLater()
+            self._cancel_confirm_box = None
+            self._cancel_downloads_box = None
+            cached_widgets = (
+                self._format_tree_menu, self._shortcuts_dialog, self._about_dialog,
+                self._settings_dialog, self._help_dialog, self._feedback_dialog,
+                self._history_dialog, self._subtitle_dialog,
+            )
+            for widget in cached_widgets:
+                if widget is None:
+                    continue
+                if not widget.isVisible():
+                    widget.deleteLater()
+                # 语言可能是在设置对话框中切换的，正在显示的窗口关闭后再销毁
+                elif isinstance(widget, QMenu):
+                    widget.aboutToHide.connect(widget.deleteLater)
+                else:
+                    widget.finished.connect(widget.deleteLater)
+            self._format_tree_menu = None
+            self._shortcuts_dialog = None
+            self._about_dialog = None
+            self._settings_dialog = None
+            self._help_dialog = None
+            self._feedback_dialog = None
+            self._history_dialog = None
+            self._subtitle_dialog = None
             # 更新界面文本
             self.update_ui_texts()
             logger.info("界面文本已更新")
@@ -3929,16 +4189,16 @@ class VideoDownloaderMethods:
             logger.error(f"处理语言切换失败: {e}")
     
     def update_ui_texts(self) -> None:
-        """更新界面文本"""
+        """更新界面文本（调用前翻译缓存已由 _rebuild_tr_cache 重建）"""
         try:
             # 更新窗口标题
-            self.setWindowTitle(f"{tr('app.title')}-v{Config.APP_VERSION}")
+            self.setWindowTitle(self._window_title_base)
             
             # 更新按钮文本
             self.smart_parse_button.setText(tr("main_window.parse"))
             self.path_button.setText(tr("main_window.choose_path"))
-            self.smart_select_button.setText(tr("main_window.select_all"))
-            self.smart_download_button.setText(tr("main_window.download"))
+            self.smart_select_button.setText(self._tr_select_all)
+            self.smart_download_button.setText(self._tr_download)
             self.smart_pause_button.setText(tr("main_window.pause"))
             
             # 更新标签文本
@@ -3947,15 +4207,14 @@ class VideoDownloaderMethods:
             # 更新表格标题
             self.format_tree.setHeaderLabels([tr("main_window.select_type"), tr("main_window.filename"), tr("main_window.file_type"), tr("main_window.file_size"), tr("main_window.status")])
             
-            # 更新选择统计标签
-            selected_count = len([item for item in self.format_tree.findItems("", Qt.MatchContains) if item.checkState(0) == Qt.Checked])
-            self.selection_count_label.setText(tr("main_window.selected_count").format(count=selected_count))
+            # 更新选择统计标签，使用缓存的选中数，无需遍历格式树
+            self.selection_count_label.setText(self._tr_selected_count.format(count=self._sel_selected))
             
             # 更新状态标签
             if hasattr(self, 'status_label'):
-                self.status_label.setText(tr("main_window.ready"))
+                self.status_label.setText(self._tr_ready)
             if hasattr(self, 'status_scroll_label'):
-                self.status_scroll_label.setText(tr("main_window.ready"))
+                self.status_scroll_label.setText(self._tr_ready)
             
             # 更新占位符文本
             self.url_input.setPlaceholderText(tr("main_window.url_placeholder"))
@@ -3971,64 +4230,8 @@ class VideoDownloaderMethods:
     def update_menu_texts(self) -> None:
         """更新菜单文本"""
         try:
-            menubar = self.menuBar()
-            
-            # 更新菜单标题
-            menubar.actions()[0].setText(tr('menu.file'))  # 文件菜单
-            menubar.actions()[1].setText(tr('menu.edit'))  # 编辑菜单
-            menubar.actions()[2].setText(tr('menu.tools'))  # 工具菜单
-            menubar.actions()[3].setText(tr('menu.help'))  # 帮助菜单
-            
-            # 更新菜单项文本
-            file_menu = menubar.actions()[0].menu()
-            if file_menu:
-                actions = file_menu.actions()
-                if len(actions) >= 1:
-                    actions[0].setText(tr('menu.new_session'))  # 新建会话
-                if len(actions) >= 3:
-                    actions[2].setText(tr('menu.open_folder'))  # 打开文件夹
-                if len(actions) >= 5:
-                    actions[4].setText(tr('menu.exit'))  # 退出
-            
-            edit_menu = menubar.actions()[1].menu()
-            if edit_menu:
-                actions = edit_menu.actions()
-                if len(actions) >= 1:
-                    actions[0].setText(tr('menu.clear_input'))  # 清空输入
-                if len(actions) >= 2:
-                    actions[1].setText(tr('menu.clear_list'))  # 清空列表
-            
-            tools_menu = menubar.actions()[2].menu()
-            if tools_menu:
-                actions = tools_menu.actions()
-                # 跳过分隔符，更新菜单项
-                action_index = 0
-                for action in actions:
-                    if action.isSeparator():
-                        action_index += 1
-                        continue
-                    
-                    if action_index == 1:  # 设置
-                        action.setText(tr('menu.settings'))
-                    elif action_index == 2:  # 历史
-                        action.setText(tr('menu.history'))
-                    elif action_index == 3:  # 字幕
-                        action.setText(tr('menu.subtitle'))
-                    elif action_index == 5:  # 日志
-                        action.setText(tr('menu.log'))
-                    
-                    action_index += 1
-            
-            help_menu = menubar.actions()[3].menu()
-            if help_menu:
-                actions = help_menu.actions()
-                if len(actions) >= 1:
-                    actions[0].setText(tr('menu.help_content'))  # 帮助
-                if len(actions) >= 3:
-                    actions[2].setText(tr('menu.feedback'))  # 反馈
-                if len(actions) >= 5:
-                    actions[4].setText(tr('menu.about'))  # 关于
-            
+            for key, action in self._menu_actions.items():
+                action.setText(tr(key))
             logger.info("菜单文本更新完成")
         except Exception as e:
             logger.error(f"更新菜单文本失败: {e}")
@@ -4062,12 +4265,15 @@ class VideoDownloaderMethods:
             
             # 在后台检查更新，不显示对话框
             from ..core.update_manager import update_manager
-            from .update_dialog import UpdateDialog
             
-            # 连接信号
-            update_manager.update_available.connect(self.on_auto_update_available)
-            update_manager.no_update_available.connect(self.on_auto_no_update)
-            update_manager.update_check_failed.connect(self.on_auto_check_failed)
+            # 连接信号，收到任一结果后统一断开
+            self._auto_update_connections = (
+                (update_manager.update_available, self.on_auto_update_available),
+                (update_manager.no_update_available, self.on_auto_no_update),
+                (update_manager.update_check_failed, self.on_auto_check_failed),
+            )
+            for signal, slot in self._auto_update_connections:
+                signal.connect(slot)
             
             # 开始检查
             update_manager.check_for_updates(force=True)
@@ -4075,17 +4281,22 @@ class VideoDownloaderMethods:
         except Exception as e:
             logger.error(f"自动检查更新失败: {e}")
     
+    def _finish_auto_update_check(self, record_time: bool = True) -> None:
+        """断开自动检查更新的信号连接，并按需记录检查时间"""
+        for signal, slot in self._auto_update_connections:
+            try:
+                signal.disconnect(slot)
+            except TypeError:
+                # 连接已断开
+                pass
+        self._auto_update_connections = ()
+        if record_time:
+            self.settings.setValue("last_update_check", int(time.time()))
+    
     def on_auto_update_available(self, version_info):
         """自动检查发现新版本"""
         try:
-            # 断开信号连接
-            from ..core.update_manager import update_manager
-            update_manager.update_available.disconnect(self.on_auto_update_available)
-            update_manager.no_update_available.disconnect(self.on_auto_no_update)
-            update_manager.update_check_failed.disconnect(self.on_auto_check_failed)
-            
-            # 记录检查时间
-            self.settings.setValue("last_update_check", int(time.time()))
+            self._finish_auto_update_check()
             
             # 显示更新对话框
             from .update_dialog import UpdateDialog
@@ -4098,15 +4309,7 @@ class VideoDownloaderMethods:
     def on_auto_no_update(self):
         """自动检查无更新"""
         try:
-            # 断开信号连接
-            from ..core.update_manager import update_manager
-            update_manager.update_available.disconnect(self.on_auto_update_available)
-            update_manager.no_update_available.disconnect(self.on_auto_no_update)
-            update_manager.update_check_failed.disconnect(self.on_auto_check_failed)
-            
-            # 记录检查时间
-            self.settings.setValue("last_update_check", int(time.time()))
-            
+            self._finish_auto_update_check()
             logger.info("自动检查更新：已是最新版本")
             
         except Exception as e:
@@ -4115,12 +4318,8 @@ class VideoDownloaderMethods:
     def on_auto_check_failed(self, error_msg):
         """自动检查失败"""
         try:
-            # 断开信号连接
-            from ..core.update_manager import update_manager
-            update_manager.update_available.disconnect(self.on_auto_update_available)
-            update_manager.no_update_available.disconnect(self.on_auto_no_update)
-            update_manager.update_check_failed.disconnect(self.on_auto_check_failed)
-            
+            # 检查失败不记录时间，下次启动时重试
+            self._finish_auto_update_check(record_time=False)
             logger.warning(f"自动检查更新失败: {error_msg}")
             
         except Exception as e:
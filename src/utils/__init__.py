@@ -6,11 +6,13 @@ Contains various utility functions and helper classes.
 
 from .logger import DebugLogger
 from .file_utils import sanitize_filename, format_size, get_ffmpeg_path, check_ffmpeg
+from .lru_cache import SegmentedLRUCache
 
 __all__ = [
     "DebugLogger",
     "sanitize_filename", 
     "format_size",
     "get_ffmpeg_path",
-    "check_ffmpeg"
+    "check_ffmpeg",
+    "SegmentedLRUCache"
 ]
@@ -23,12 +23,18 @@ import sys
 import platform
 import webbrowser
 import subprocess
-from typing import Optional
+from functools import lru_cache
+from typing import Optional, Set
 from PyQt5.QtWidgets import QMessageBox
 
 from ..core.config import Config
 from .logger import logger
 
+# 预编译的正则表达式，文件名清理在每个格式项上都会调用
+_RE_ILLEGAL_CHARS = re.compile(r'[<>:"/\\|?*]')  # Windows文件系统不允许的字符
+_RE_CONTROL_CHARS = re.compile(r'[\x00-\x1f\x7f-\x9f]')  # 控制字符
+_RE_UNICODE_CONTROL_CHARS = re.compile(r'[\u200b-\u200f\u2028-\u202f\u2060-\u206f]')  # Unicode控制字符
+
 
 def sanitize_filename(filename: str, save_path: str) -> str:
     """
@@ -56,16 +62,16 @@ def sanitize_filename(filename: str, save_path: str) -> str:
             logger.info(f"已重置为安全路径: {save_path}")
         
         # 移除Windows文件系统不允许的字符
-        filename = re.sub(r'[<>:"/\\|?*]', "", filename)
+        filename = _RE_ILLEGAL_CHARS.sub("", filename)
         
         # 移除路径分隔符，防止路径遍历
         filename = filename.replace("/", "_").replace("\\", "_")
         
         # 移除控制字符
-        filename = re.sub(r'[\x00-\x1f\x7f-\x9f]', "", filename)
+        filename = _RE_CONTROL_CHARS.sub("", filename)
         
         # 移除Unicode控制字符
-        filename = re.sub(r'[\u200b-\u200f\u2028-\u202f\u2060-\u206f]', "", filename)
+        filename = _RE_UNICODE_CONTROL_CHARS.sub("", filename)
         
         # 限制文件名长度
         filename = filename[:Config.MAX_FILENAME_LENGTH]
@@ -180,11 +186,11 @@ def _is_safe_path(path: str) -> bool:
                 return False
         
         # 检查是否包含控制字符
-        if re.search(r'[\x00-\x1f\x7f-\x9f]', path):
+        if _RE_CONTROL_CHARS.search(path):
             return False
         
         # 检查是否包含Unicode控制字符
-        if re.search(r'[\u200b-\u200f\u2028-\u202f\u2060-\u206f]', path):
+        if _RE_UNICODE_CONTROL_CHARS.search(path):
             return False
         
         return True
@@ -210,11 +216,11 @@ def _is_safe_filename(filename: str) -> bool:
             return False
         
         # 检查是否包含控制字符
-        if re.search(r'[\x00-\x1f\x7f-\x9f]', filename):
+        if _RE_CONTROL_CHARS.search(filename):
             return False
         
         # 检查是否包含Unicode控制字符
-        if re.search(r'[\u200b-\u200f\u2028-\u202f\u2060-\u206f]', filename):
+        if _RE_UNICODE_CONTROL_CHARS.search(filename):
             return False
         
         # 检查是否为空
@@ -230,11 +236,13 @@ def _is_safe_filename(filename: str) -> bool:
     return new_filename
 
 
+@lru_cache(maxsize=1024)
 def format_size(bytes_size: Optional[int]) -> str:
     """
     格式化文件大小显示
     
     将字节数转换为人类可读的文件大小格式（B、KB、MB、GB）。
+    结果按字节数缓存，播放列表中相同大小的格式（如纯音频）只格式化一次。
     
     Args:
         bytes_size: 文件大小（字节）
@@ -254,6 +262,27 @@ def format_size(bytes_size: Optional[int]) -> str:
     return f"{bytes_size:.2f} GB"
 
 
+def list_file_names(directory: str) -> Set[str]:
+    """
+    获取目录中已有的文件名集合
+    
+    一次目录扫描代替逐个文件 stat，文件名经过 normcase 处理，
+    在不区分大小写的文件系统上也能直接用集合查找。
+    
+    Args:
+        directory: 要扫描的目录
+        
+    Returns:
+        Set[str]: 文件名集合，目录无法访问时返回空集合
+    """
+    try:
+        with os.scandir(directory) as entries:
+            return {os.path.normcase(entry.name) for entry in entries}
+    except OSError as e:
+        logger.warning(f"扫描保存目录失败: {e}")
+        return set()
+
+
 def get_ffmpeg_path(save_path: str) -> Optional[str]:
     """
     获取 FFmpeg 可执行文件路径 - 改进版本
@@ -0,0 +1,87 @@
+"""
+Segmented LRU Cache Module
+
+This module provides a scan-resistant cache used for parse results:
+- New entries enter a probation segment
+- Entries hit a second time are promoted to a protected segment
+- Protected overflow is demoted back to probation instead of being dropped
+- Only probation entries are evicted, so one-off URLs from a playlist
+  cannot flush frequently reused results
+
+The class is not thread-safe; callers hold their own lock.
+
+Author: Yeguo IDM Development Team
+Version: 1.0.0
+"""
+
+from collections import OrderedDict
+from typing import Any, Hashable
+
+# 未命中标记，缓存值本身可以是None或其他假值
+_MISSING = object()
+
+
+class SegmentedLRUCache:
+    """分段LRU缓存（SLRU / LRU-2）"""
+
+    def __init__(self, limit: int):
+        """
+        初始化缓存
+
+        Args:
+            limit: 缓存总条数上限，保护段和试用段各占一半
+        """
+        self.limit = max(1, limit)
+        self.protected_limit = self.limit // 2
+        # 只访问过一次的条目，溢出时从头部淘汰
+        self._probation: "OrderedDict[Hashable, Any]" = OrderedDict()
+        # 至少访问过两次的条目，溢出时降级回试用段
+        self._protected: "OrderedDict[Hashable, Any]" = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._probation) + len(self._protected)
+
+    def __contains__(self, key: Hashable) -> bool:
+        # 只读查询，不改变条目顺序
+        return key in self._protected or key in self._probation
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """查询条目，命中时刷新或晋升其位置"""
+        if key in self._protected:
+            self._protected.move_to_end(key)
+            return self._protected[key]
+        value = self._probation.pop(key, _MISSING)
+        if value is _MISSING:
+            return default
+        # 第二次访问：从试用段晋升到保护段
+        self._protected[key] = value
+        if len(self._protected) > self.protected_limit:
+            demoted_key, demoted_value = self._protected.popitem(last=False)
+            self._probation[demoted_key] = demoted_value
+        return value
+
+    def add(self, key: Hashable, value: Any) -> bool:
+        """插入新条目，已存在时按命中处理并返回False"""
+        if key in self:
+            # 已存在的条目按一次命中处理
+            self.get(key)
+            return False
+        self._probation[key] = value
+        overflow = len(self) - self.limit
+        if overflow > 0:
+            self.evict(overflow)
+        return True
+
+    def evict(self, count: int) -> None:
+        """淘汰指定数量的条目，优先淘汰试用段中最久未使用的条目"""
+        from_probation = min(count, len(self._probation))
+        for _ in range(from_probation):
+            self._probation.popitem(last=False)
+        # 试用段不足时才淘汰保护段
+        for _ in range(min(count - from_probation, len(self._protected))):
+            self._protected.popitem(last=False)
+
+    def clear(self) -> None:
+        """清空缓存"""
+        self._probation.clear()
+        self._protected.clear()
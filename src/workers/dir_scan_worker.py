@@ -0,0 +1,24 @@
+"""Directory Scan Worker Module"""
+
+from PyQt5.QtCore import QObject, QRunnable, pyqtSignal
+
+from ..utils.file_utils import list_file_names
+
+
+class DirScanSignals(QObject):
+    """目录扫描任务的信号（QRunnable 本身不能定义信号）"""
+
+    finished = pyqtSignal(str, object)  # (目录, 文件名集合)
+
+
+class DirScanWorker(QRunnable):
+    """在线程池中扫描保存目录，避免慢速磁盘或网络共享阻塞UI线程"""
+
+    def __init__(self, directory: str):
+        super().__init__()
+        self.directory = directory
+        self.signals = DirScanSignals()
+
+    def run(self) -> None:
+        """扫描目录，结果通过信号回传主线程"""
+        self.signals.finished.emit(self.directory, list_file_names(self.directory))
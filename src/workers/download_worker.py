@@ -17,6 +17,15 @@ from src.core.config import Config
 
 # YTDlpLogger 已移动到 src/utils/ytdlp_logger.py
 
+
+def _file_size(path: str) -> int:
+    """获取文件大小，一次 stat 同时完成存在性检查；文件不存在时返回 -1"""
+    try:
+        return os.stat(path).st_size
+    except OSError:
+        return -1
+
+
 class DownloadWorker(QThread):
     """下载工作线程"""
     
@@ -31,9 +40,13 @@ class DownloadWorker(QThread):
     class DownloadPaused(Exception):
         pass
     
-    def __init__(self, url: str, ydl_opts: Dict, format_id: Optional[str] = None):
+    def __init__(self, url: str, ydl_opts: Dict, format_id: Optional[str] = None,
+                 selected_format: Optional[Dict] = None, source_url: Optional[str] = None):
         super().__init__()
         self.url = url
+        # 下载完成时回传给主窗口的格式信息和原始链接（网易云音乐的下载链接与原始链接不同）
+        self.selected_format = selected_format
+        self.source_url = source_url or url
         self.ydl_opts = ydl_opts
         self.format_id = format_id
         self._is_cancelled = False
@@ -45,6 +58,11 @@ class DownloadWorker(QThread):
         self._cancel_check_thread = None  # 取消检查线程
         self._resource_lock = threading.Lock()  # 资源管理锁
     
+    @property
+    def thread_finished(self):
+        """QThread 原生的 finished 信号，在 run() 返回后发出（本类的 finished 已用作下载完成信号）"""
+        return QThread.finished.__get__(self, QThread)
+    
     def cancel(self):
         """取消下载"""
         self._is_cancelled = True
@@ -577,7 +595,7 @@ class DownloadWorker(QThread):
                                     self.log_signal.emit(f"下载进度: {progress:.1f}% ({downloaded_size}/{total_size} bytes)")
             
             # 检查文件是否下载成功
-            if os.path.exists(output_file) and os.path.getsize(output_file) > 0:
+            if _file_size(output_file) > 0:
                 self.log_signal.emit(f"直接下载成功: {output_file}")
                 
                 # 验证文件完整性
@@ -626,11 +644,11 @@ class DownloadWorker(QThread):
     def _verify_downloaded_file(self, file_path: str) -> bool:
         """验证下载文件的完整性"""
         try:
-            if not os.path.exists(file_path):
+            file_size = _file_size(file_path)
+            if file_size < 0:
                 self.log_signal.emit(f"文件不存在: {file_path}")
                 return False
             
-            file_size = os.path.getsize(file_path)
             self.log_signal.emit(f"开始验证文件完整性: {file_path}")
             self.log_signal.emit(f"文件大小: {file_size} bytes")
             
@@ -975,7 +993,7 @@ class DownloadWorker(QThread):
                         # 按修改时间排序，取最新的
                         possible_files.sort(key=lambda x: os.path.getmtime(x), reverse=True)
                         latest_file = possible_files[0]
-                        if os.path.exists(latest_file) and os.path.getsize(latest_file) > 1024*1024:  # 大于1MB
+                        if _file_size(latest_file) > 1024*1024:  # 大于1MB
                             return latest_file
             
             # 方法2: 查找当前目录下最新的MP4文件
@@ -985,7 +1003,7 @@ class DownloadWorker(QThread):
                 # 按修改时间排序，取最新的
                 mp4_files.sort(key=lambda x: os.path.getmtime(x), reverse=True)
                 latest_file = mp4_files[0]
-                if os.path.exists(latest_file) and os.path.getsize(latest_file) > 1024*1024:  # 大于1MB
+                if _file_size(latest_file) > 1024*1024:  # 大于1MB
                     return latest_file
             
             # 方法3: 查找包含特定关键词的文件
@@ -996,7 +1014,7 @@ class DownloadWorker(QThread):
                     # 按修改时间排序，取最新的
                     keyword_files.sort(key=lambda x: os.path.getmtime(x), reverse=True)
                     latest_file = keyword_files[0]
-                    if os.path.exists(latest_file) and os.path.getsize(latest_file) > 1024*1024:  # 大于1MB
+                    if _file_size(latest_file) > 1024*1024:  # 大于1MB
                         return latest_file
             
             return None
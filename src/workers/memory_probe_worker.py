@@ -0,0 +1,30 @@
+"""Memory Probe Worker Module"""
+
+import psutil
+from PyQt5.QtCore import QObject, QRunnable, pyqtSignal
+
+from ..utils.logger import logger
+
+
+class MemoryProbeSignals(QObject):
+    """内存查询任务的信号（QRunnable 本身不能定义信号）"""
+
+    finished = pyqtSignal(int)  # 进程常驻内存（MB），查询失败时为 -1
+
+
+class MemoryProbeWorker(QRunnable):
+    """在线程池中查询进程内存占用，避免系统调用阻塞UI线程"""
+
+    def __init__(self, process: psutil.Process):
+        super().__init__()
+        self.process = process
+        self.signals = MemoryProbeSignals()
+
+    def run(self) -> None:
+        """查询常驻内存，结果通过信号回传主线程"""
+        memory_mb = -1
+        try:
+            memory_mb = self.process.memory_info().rss >> 20
+        except Exception as e:
+            logger.error("获取进程内存使用失败: %s", e)
+        self.signals.finished.emit(memory_mb)
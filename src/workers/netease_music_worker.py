@@ -2,7 +2,7 @@
 
 import logging
 from typing import Dict, List, Optional
-from PyQt5.QtCore import QThread, pyqtSignal, QMutex, QWaitCondition
+from PyQt5.QtCore import QThread, pyqtSignal, QMutex, QMutexLocker, QWaitCondition
 
 from ..core.netease_music_manager import NetEaseMusicManager
 
@@ -255,9 +255,8 @@ class NetEaseMusicParseWorker(QThread):
     
     def pause(self):
         """暂停解析"""
-        self.mutex.lock()
-        self.paused = True
-        self.mutex.unlock()
+        with QMutexLocker(self.mutex):
+            self.paused = True
         # 同时暂停 NetEaseMusicManager
         if hasattr(self, 'netease_manager'):
             self.netease_manager.pause()
@@ -266,43 +265,43 @@ class NetEaseMusicParseWorker(QThread):
     
     def resume(self):
         """恢复解析"""
-        self.mutex.lock()
-        self.paused = False
-        self.wait_condition.wakeAll()
-        self.mutex.unlock()
+        with QMutexLocker(self.mutex):
+            self.paused = False
+            self.wait_condition.wakeAll()
         # 同时恢复 NetEaseMusicManager
         if hasattr(self, 'netease_manager'):
             self.netease_manager.resume()
         self.log_signal.emit("解析已恢复")
         self.progress_signal.emit("解析已恢复")
     
-    def cancel(self):
-        """取消解析"""
-        self.mutex.lock()
-        self.cancelled = True
-        self.paused = False
-        self.wait_condition.wakeAll()
-        self.mutex.unlock()
+    def request_cancel(self):
+        """请求取消解析，不等待线程结束（可在UI线程直接调用）"""
+        with QMutexLocker(self.mutex):
+            self.cancelled = True
+            self.paused = False
+            self.wait_condition.wakeAll()
         # 同时取消 NetEaseMusicManager
         if hasattr(self, 'netease_manager'):
             self.netease_manager.cancel()
+        self.quit()
+    
+    def cancel(self):
+        """取消解析并等待线程结束"""
+        self.request_cancel()
         self.log_signal.emit("正在取消解析...")
         self.progress_signal.emit("正在取消解析...")
-        self.quit()
         self.wait()
     
     def _check_cancelled(self):
         """检查是否被取消或暂停"""
-        self.mutex.lock()
-        if self.cancelled:
-            self.mutex.unlock()
-            return True
-        
-        while self.paused and not self.cancelled:
-            self.wait_condition.wait(self.mutex)
-        
-        cancelled = self.cancelled
-        self.mutex.unlock()
+        with QMutexLocker(self.mutex):
+            if self.cancelled:
+                return True
+            
+            while self.paused and not self.cancelled:
+                self.wait_condition.wait(self.mutex)
+            
+            cancelled = self.cancelled
         
         # 检查 NetEaseMusicManager 是否被取消
         if hasattr(self, 'netease_manager') and self.netease_manager.cancelled:
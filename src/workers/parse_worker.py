@@ -18,7 +18,7 @@ Version: 1.0.0
 import time
 import threading
 import logging
-from PyQt5.QtCore import QThread, pyqtSignal, QMutex, QWaitCondition
+from PyQt5.QtCore import QThread, pyqtSignal, QMutex, QMutexLocker, QWaitCondition
 import yt_dlp
 from src.core.youtube_optimizer import YouTubeOptimizer
 from src.utils.logger import logger
@@ -49,6 +49,11 @@ class ParseWorker(QThread):
         self._extraction_completed = threading.Event()
         self._extraction_thread = None
 
+    @property
+    def thread_finished(self):
+        """QThread 原生的 finished 信号，在 run() 返回后发出（本类的 finished 已用作解析完成信号）"""
+        return QThread.finished.__get__(self, QThread)
+
     def run(self) -> None:
         try:
             
@@ -568,63 +573,51 @@ class ParseWorker(QThread):
     
     def pause(self) -> None:
         """暂停解析 - 使用PyQt5线程安全机制"""
-        self._mutex.lock()
-        try:
+        with QMutexLocker(self._mutex):
             self._paused = True
-        finally:
-            self._mutex.unlock()
         self.status_signal.emit("解析已暂停")
     
     def resume(self) -> None:
         """恢复解析 - 使用PyQt5线程安全机制"""
-        self._mutex.lock()
-        try:
+        with QMutexLocker(self._mutex):
             self._paused = False
             self._condition.wakeAll()
-        finally:
-            self._mutex.unlock()
         self.status_signal.emit("解析已恢复")
     
-    def cancel(self) -> None:
-        """取消解析 - 使用PyQt5线程安全机制"""
-        self._mutex.lock()
-        try:
+    def request_cancel(self) -> None:
+        """请求取消解析，不等待线程结束（可在UI线程直接调用）"""
+        with QMutexLocker(self._mutex):
             self._cancelled = True
             self._paused = False
             self._condition.wakeAll()
-        finally:
-            self._mutex.unlock()
+        # 唤醒等待提取结果的循环，提取线程的结果会被忽略
+        self._extraction_completed.set()
+        self.quit()
+    
+    def cancel(self) -> None:
+        """取消解析并等待线程结束 - 使用PyQt5线程安全机制"""
+        self.request_cancel()
         self.status_signal.emit("正在取消解析...")
         
         # 中断正在进行的提取
         self._interrupt_extraction()
         
-        self.quit()
         self.wait()
     
     def _check_pause(self) -> None:
         """检查是否需要暂停 - 使用PyQt5线程安全机制"""
-        self._mutex.lock()
-        try:
+        with QMutexLocker(self._mutex):
             while self._paused and not self._cancelled:
                 self._condition.wait(self._mutex)
-        finally:
-            self._mutex.unlock()
     
     def _check_cancelled(self) -> bool:
         """检查是否已取消 - 使用PyQt5线程安全机制"""
-        self._mutex.lock()
-        try:
+        with QMutexLocker(self._mutex):
             return self._cancelled
-        finally:
-            self._mutex.unlock()
     
     def _check_paused(self) -> bool:
         """检查是否暂停 - 使用PyQt5线程安全机制"""
-        self._mutex.lock()
-        try:
+        with QMutexLocker(self._mutex):
             return self._paused
-        finally:
-            self._mutex.unlock()
     
     
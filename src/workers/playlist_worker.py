@@ -0,0 +1,34 @@
+"""Playlist Fetch Worker Module"""
+
+from typing import Any, Callable
+
+from PyQt5.QtCore import QObject, QRunnable, pyqtSignal
+
+from ..utils.logger import logger
+
+
+class PlaylistFetchSignals(QObject):
+    """播放列表获取任务的信号（QRunnable 本身不能定义信号）"""
+
+    finished = pyqtSignal(str, object)  # (URL, 获取结果)
+    error = pyqtSignal(str, object)  # (URL, 异常对象)，由主线程按异常类型提示用户
+
+
+class PlaylistFetchWorker(QRunnable):
+    """在线程池中执行播放列表网络请求，避免阻塞UI线程"""
+
+    def __init__(self, url: str, fetch: Callable[[str], Any]):
+        super().__init__()
+        self.url = url
+        self.fetch = fetch
+        self.signals = PlaylistFetchSignals()
+
+    def run(self) -> None:
+        """执行获取任务，结果或异常通过信号回传主线程"""
+        try:
+            result = self.fetch(self.url)
+        except Exception as e:
+            logger.error(f"获取播放列表数据失败: {e}")
+            self.signals.error.emit(self.url, e)
+            return
+        self.signals.finished.emit(self.url, result)